@@ -0,0 +1,124 @@
+"""
+Shared ViewSet mixins for the PyDialer API.
+
+This module provides queryset helpers used by ViewSets across the apps,
+keeping related-object loading in step with what the serializers render.
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+def _serializer_fields(serializer):
+    """
+    Return a serializer's fields, or only its declared ones if the rest fail to build.
+    
+    Serializers whose Meta.fields list names that are not on the model raise
+    ImproperlyConfigured when building their fields; the explicitly declared
+    fields (where the dotted sources live) are still usable.
+    """
+    try:
+        return serializer.fields
+    except ImproperlyConfigured:
+        return serializer._declared_fields
+
+
+def _relation_paths(serializer, model, prefix=''):
+    """
+    Collect the relations a serializer traverses through its field sources.
+    
+    Args:
+        serializer: Serializer instance whose fields are inspected
+        model: Model class the serializer reads from
+        prefix: Lookup path of model from the root queryset model
+    
+    Returns:
+        tuple: (select_related paths, prefetch_related paths) as sets
+    """
+    select, prefetch = set(), set()
+    
+    for name, field in _serializer_fields(serializer).items():
+        # Declared fields that were never bound have no source set yet
+        source = field.source or name
+        if field.write_only or source == '*':
+            continue
+        
+        current = model
+        path = prefix
+        many = False
+        parts = source.split('.')
+        for index, part in enumerate(parts):
+            try:
+                model_field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                # Method or property; nothing further to join
+                break
+            if not model_field.is_relation:
+                break
+            
+            path = f'{path}__{part}' if path else part
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch.add(path)
+                many = True
+            elif index == len(parts) - 1 and isinstance(field, PrimaryKeyRelatedField):
+                # Only the FK id is rendered, which is already on the row
+                break
+            elif many:
+                prefetch.add(path)
+            else:
+                select.add(path)
+            current = model_field.related_model
+        else:
+            nested = field.child if isinstance(field, ListSerializer) else field
+            if isinstance(nested, BaseSerializer) and path:
+                nested_select, nested_prefetch = _relation_paths(nested, current, path)
+                if many:
+                    prefetch |= nested_select | nested_prefetch
+                else:
+                    select |= nested_select
+                    prefetch |= nested_prefetch
+    
+    return select, prefetch
+
+
+@lru_cache(maxsize=None)
+def serializer_relations(serializer_class, model):
+    """
+    Return the related lookups needed to render serializer_class, computed once.
+    
+    Args:
+        serializer_class: Serializer class used by the view
+        model: Model class of the view's queryset
+    
+    Returns:
+        tuple: (select_related paths, prefetch_related paths) as sorted tuples
+    """
+    select, prefetch = _relation_paths(serializer_class(), model)
+    # A select_related path already covers its own prefixes
+    select = {path for path in select if not any(other.startswith(path + '__') for other in select)}
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+class AutoPrefetchMixin:
+    """
+    ViewSet mixin that joins every relation the serializer renders.
+    
+    The select_related/prefetch_related lookups are derived from the
+    serializer's field sources, so they cannot drift from the fields the
+    serializer actually reads.
+    """
+    
+    def get_queryset(self):
+        """
+        Return the base queryset with the serializer's relations loaded.
+        """
+        queryset = super().get_queryset()
+        select, prefetch = serializer_relations(self.get_serializer_class(), queryset.model)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
@@ -0,0 +1,50 @@
+"""
+Pagination classes for the PyDialer API.
+
+This module provides page-number pagination whose total count is cached,
+so paging through large lead and statistics tables does not rerun
+SELECT COUNT(*) on every request.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.exceptions import EmptyResultSet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that reuses the object count of an identical query for COUNT_CACHE_TIMEOUT seconds.
+    """
+    COUNT_CACHE_TIMEOUT = 60
+    
+    @cached_property
+    def count(self):
+        """
+        Return the total number of objects, from the cache when possible.
+        
+        The key is a digest of the compiled SQL, parameters included, so
+        each filter set and each user's scoped queryset is counted separately.
+        """
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+        
+        try:
+            sql = str(query)
+        except EmptyResultSet:
+            return 0
+        
+        digest = hashlib.md5(sql.encode()).hexdigest()
+        key = f'pagination_count:{self.object_list.model._meta.label_lower}:{digest}'
+        return cache.get_or_set(key, lambda: super(CachedCountPaginator, self).count, self.COUNT_CACHE_TIMEOUT)
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Default page-number pagination with the total count cached per query.
+    """
+    django_paginator_class = CachedCountPaginator
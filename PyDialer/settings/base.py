@@ -198,11 +198,22 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'calls.tasks.cleanup_old_cdrs',
         'schedule': 3600.0,  # Run every hour
     },
+    'flush-campaign-counters': {
+        'task': 'campaigns.tasks.flush_campaign_counters',
+        'schedule': 5.0,  # Apply Redis-buffered call counters every 5 seconds
+    },
+    'update-all-campaign-statistics': {
+        'task': 'campaigns.tasks.update_all_campaign_statistics',
+        'schedule': 30.0,  # Refresh every active campaign's statistics together
+    },
 }
 
 # Celery Queue Configuration
 CELERY_TASK_ROUTES = {
     'campaigns.tasks.predictive_dial': {'queue': 'dialing'},
+    # Call initiation is sub-second and latency sensitive, so keep it off queues
+    # that carry long-running tasks such as lead recycling
+    'campaigns.tasks.dial_batch': {'queue': 'call_initiation'},
     'calls.tasks.*': {'queue': 'calls'},
     'leads.tasks.*': {'queue': 'leads'},
     'reporting.tasks.*': {'queue': 'reporting'},
@@ -218,6 +229,10 @@ CELERY_TASK_QUEUES = {
         'exchange': 'dialing',
         'routing_key': 'dialing',
     },
+    'call_initiation': {
+        'exchange': 'call_initiation',
+        'routing_key': 'call_initiation',
+    },
     'calls': {
         'exchange': 'calls',
         'routing_key': 'calls',
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.16 on 2026-10-17 05:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('agents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='avatar',
+            field=models.ImageField(blank=True, null=True, upload_to='avatars/'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='bio',
+            field=models.TextField(blank=True, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='desktop_notifications',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='email_notifications',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='preferred_language',
+            field=models.CharField(choices=[('en', 'English'), ('es', 'Spanish'), ('fr', 'French'), ('de', 'German')], default='en', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='sound_notifications',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='timezone',
+            field=models.CharField(default='UTC', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='agentstatus',
+            index=models.Index(fields=['status'], name='agent_statu_status_e62bc0_idx'),
+        ),
+    ]
@@ -176,6 +176,9 @@ class AgentStatus(models.Model):
     class Meta:
         db_table = 'agent_status'
         ordering = ['agent__last_name', 'agent__first_name']
+        indexes = [
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return f"{self.agent.get_full_name()} - {self.get_status_display()}"
@@ -165,6 +165,32 @@ class CanViewReports(permissions.BasePermission):
         )
 
 
+class RoleCacheMixin:
+    """
+    ViewSet mixin that resolves the requesting user's roles once per request.
+    
+    get_queryset and the custom actions ask the same role questions; the
+    answers are stored on the request so repeated checks are dict lookups.
+    """
+
+    def get_user_roles(self):
+        """
+        Return the user's role flags, computing them on first use.
+        
+        Returns:
+            dict: 'agent', 'supervisor' and 'manager' mapped to booleans
+        """
+        request = self.request
+        if not hasattr(request, '_roles'):
+            user = request.user
+            request._roles = {
+                'agent': user.is_agent(),
+                'supervisor': user.is_supervisor(),
+                'manager': user.is_manager(),
+            }
+        return request._roles
+
+
 # Function-based view decorators
 def require_role(required_roles):
     """
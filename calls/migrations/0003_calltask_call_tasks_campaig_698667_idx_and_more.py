@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-17 05:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0002_disposition_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calltask',
+            index=models.Index(fields=['campaign', 'created_at', 'state'], name='call_tasks_campaig_698667_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calltask',
+            index=models.Index(fields=['campaign', 'answered_at'], name='call_tasks_campaig_3b254d_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0003_calltask_call_tasks_campaig_698667_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calltask',
+            index=models.Index(condition=models.Q(('state__in', ['dialing', 'ringing', 'connected'])), fields=['campaign'], name='call_tasks_active_idx'),
+        ),
+    ]
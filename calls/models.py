@@ -106,6 +106,13 @@ class CallTask(models.Model):
             models.Index(fields=['agent', 'state']),
             models.Index(fields=['pbx_call_id']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['campaign', 'created_at', 'state']),
+            models.Index(fields=['campaign', 'answered_at']),
+            models.Index(
+                fields=['campaign'],
+                name='call_tasks_active_idx',
+                condition=models.Q(state__in=['dialing', 'ringing', 'connected'])
+            ),
         ]
 
     def __str__(self):
@@ -144,6 +151,15 @@ class CallTask(models.Model):
                 self.hangup_by = kwargs['hangup_by']
         
         self.save()
+        
+        # Answers and drops feed the campaign's live call counters
+        if new_state != old_state and new_state in ('answered', 'abandoned'):
+            from campaigns.services import PredictiveDialingService  # campaigns.services imports this module
+            PredictiveDialingService(self.campaign).update_statistics(
+                call_answered=new_state == 'answered',
+                call_dropped=new_state == 'abandoned'
+            )
+        
         return old_state
 
     def can_retry(self):
@@ -68,7 +68,8 @@ class CallDetailRecordViewSet(viewsets.ReadOnlyModelViewSet):
         if user.is_agent() and not user.is_supervisor():
             queryset = queryset.filter(agent=user)
         
-        return queryset.select_related('call_task', 'agent')
+        # Join every relation the serializer reads, so rows cost no extra queries
+        return queryset.select_related('call_task', 'campaign', 'lead', 'agent')
 
 
 class RecordingViewSet(viewsets.ReadOnlyModelViewSet):
@@ -94,7 +95,8 @@ class RecordingViewSet(viewsets.ReadOnlyModelViewSet):
         if user.is_agent() and not user.is_supervisor():
             queryset = queryset.filter(cdr__agent=user)
         
-        return queryset.select_related('cdr')
+        # Join every relation the serializer reads, so rows cost no extra queries
+        return queryset.select_related('call_task', 'cdr', 'campaign', 'agent')
 
 
 class DispositionViewSet(viewsets.ModelViewSet):
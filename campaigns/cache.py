@@ -0,0 +1,43 @@
+"""
+Campaign Statistics Summary Cache
+
+This module keys the cached campaign statistics summaries served by
+CampaignStatisticsViewSet.summary. Every key embeds a shared version number,
+so bumping the version invalidates every cached summary at once without
+scanning for keys, on any cache backend.
+
+The tasks that write CampaignStatistics call invalidate_summary_cache after
+their writes; the signal handlers cover rows saved individually.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+
+# Dashboards poll the summary, so one aggregate is shared for this long
+SUMMARY_CACHE_TIMEOUT = 60
+SUMMARY_CACHE_VERSION_KEY = 'camp_stats_summary:version'
+
+
+def summary_cache_key(user_id: int, query_string: str) -> str:
+    """
+    Build the cache key of one user's summary for one set of filters.
+    
+    Args:
+        user_id: ID of the requesting user
+        query_string: Encoded filter parameters of the request
+    
+    Returns:
+        str: Cache key under the current summary version
+    """
+    version = cache.get_or_set(SUMMARY_CACHE_VERSION_KEY, 1, timeout=None)
+    digest = hashlib.md5(query_string.encode()).hexdigest()
+    return f'camp_stats_summary:{version}:{user_id}:{digest}'
+
+
+def invalidate_summary_cache() -> None:
+    """Invalidate every cached summary by bumping the summary version."""
+    try:
+        cache.incr(SUMMARY_CACHE_VERSION_KEY)
+    except ValueError:
+        pass  # No summary has been cached since the version key expired
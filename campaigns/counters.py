@@ -0,0 +1,172 @@
+"""
+Hot Campaign Counters
+
+This module buffers high-frequency campaign call counters in Redis so call events
+only cost an O(1) HINCRBY instead of a database write. Buffered deltas are drained
+periodically and applied to CampaignStatistics by the flush_campaign_counters task.
+The statistics recompute tasks rebuild the same totals from CallTask, so they
+discard the deltas of the campaigns they recount.
+
+When the default cache is not backed by django-redis (e.g. in development), every
+function reports that Redis is unavailable and callers fall back to the database.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'campaign_counters'
+DIRTY_SET_KEY = f'{KEY_PREFIX}:dirty'
+COUNTER_FIELDS = ('attempted', 'answered', 'dropped')
+
+
+def counter_key(campaign_id: int) -> str:
+    """Return the Redis hash key holding a campaign's buffered counters."""
+    return f'{KEY_PREFIX}:{campaign_id}'
+
+
+def get_client():
+    """
+    Get the raw Redis client behind the default cache.
+    
+    Returns:
+        Redis client, or None if the default cache is not django-redis
+    """
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def increment(campaign_id: int, attempted: int = 0, answered: int = 0, dropped: int = 0) -> bool:
+    """
+    Buffer counter increments for a campaign.
+    
+    Args:
+        campaign_id: ID of the campaign
+        attempted: Calls attempted to add
+        answered: Calls answered to add
+        dropped: Calls dropped to add
+    
+    Returns:
+        bool: True if buffered in Redis, False if the caller must write to the database
+    """
+    client = get_client()
+    if client is None:
+        return False
+    
+    deltas = {'attempted': attempted, 'answered': answered, 'dropped': dropped}
+    key = counter_key(campaign_id)
+    
+    try:
+        pipe = client.pipeline(transaction=True)
+        for field, delta in deltas.items():
+            if delta:
+                pipe.hincrby(key, field, delta)
+        pipe.sadd(DIRTY_SET_KEY, campaign_id)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Error buffering counters for campaign {campaign_id}: {e}")
+        return False
+    
+    return True
+
+
+def inc_attempted(campaign_id: int) -> bool:
+    """Buffer one attempted call for a campaign."""
+    return increment(campaign_id, attempted=1)
+
+
+def inc_answered(campaign_id: int) -> bool:
+    """Buffer one answered call for a campaign."""
+    return increment(campaign_id, answered=1)
+
+
+def inc_dropped(campaign_id: int) -> bool:
+    """Buffer one dropped call for a campaign."""
+    return increment(campaign_id, dropped=1)
+
+
+def get_snapshot(campaign_id: int) -> Optional[Dict[str, int]]:
+    """
+    Get the counters buffered for a campaign and not yet flushed.
+    
+    Args:
+        campaign_id: ID of the campaign
+    
+    Returns:
+        Dict of pending counter deltas, or None if Redis is unavailable
+    """
+    client = get_client()
+    if client is None:
+        return None
+    
+    values = client.hgetall(counter_key(campaign_id))
+    return _parse_counters(values)
+
+
+def drain_snapshots() -> Dict[int, Dict[str, int]]:
+    """
+    Atomically read and clear the buffered counters of every dirty campaign.
+    
+    Returns:
+        Dict mapping campaign id to the counter deltas drained for it
+    """
+    client = get_client()
+    if client is None:
+        return {}
+    
+    campaign_ids = [int(campaign_id) for campaign_id in client.smembers(DIRTY_SET_KEY)]
+    if not campaign_ids:
+        return {}
+    
+    # Read and delete each hash in one MULTI so increments landing meanwhile
+    # are either drained now or left for the next flush, never lost
+    pipe = client.pipeline(transaction=True)
+    pipe.srem(DIRTY_SET_KEY, *campaign_ids)
+    for campaign_id in campaign_ids:
+        pipe.hgetall(counter_key(campaign_id))
+        pipe.delete(counter_key(campaign_id))
+    replies = pipe.execute()
+    
+    hashes: List[Dict] = replies[1::2]
+    return {
+        campaign_id: _parse_counters(values)
+        for campaign_id, values in zip(campaign_ids, hashes)
+    }
+
+
+def discard(campaign_ids: List[int]) -> None:
+    """
+    Drop the buffered counters of campaigns whose statistics are being recomputed.
+    
+    The recompute counts the same calls from CallTask, so adding these deltas
+    on top of its totals would count them twice.
+    
+    Args:
+        campaign_ids: IDs of the campaigns to clear
+    """
+    client = get_client()
+    if client is None or not campaign_ids:
+        return
+    
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.srem(DIRTY_SET_KEY, *campaign_ids)
+        pipe.delete(*[counter_key(campaign_id) for campaign_id in campaign_ids])
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Error discarding counters for campaigns {campaign_ids}: {e}")
+
+
+def _parse_counters(values: Dict) -> Dict[str, int]:
+    """Convert a raw Redis hash into integer counters with every field present."""
+    counters = {field: 0 for field in COUNTER_FIELDS}
+    for field, value in values.items():
+        if isinstance(field, bytes):
+            field = field.decode()
+        if field in counters:
+            counters[field] = int(value)
+    return counters
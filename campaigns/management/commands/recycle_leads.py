@@ -143,17 +143,14 @@ class Command(BaseCommand):
 
     def simulate_recycling(self, recycling_service, batch_size):
         """Simulate recycling without making changes."""
-        recycle_rules = {
-            'no_answer': recycling_service.campaign.recycle_no_answer_days,
-            'busy': recycling_service.campaign.recycle_busy_days,
-            'disconnected': recycling_service.campaign.recycle_disconnected_days,
-        }
+        # Same cutoffs, from a single reference time, as process_campaign_recycling
+        now = timezone.now()
         
         total_would_recycle = 0
         self.stdout.write("  Would recycle:")
         
-        for status, days_threshold in recycle_rules.items():
-            leads = recycling_service.get_recyclable_leads(status, days_threshold, batch_size)
+        for status in recycling_service.get_recycle_cutoffs(now):
+            leads = recycling_service.get_recyclable_leads(status, batch_size, current_time=now)
             count = len(leads)
             total_would_recycle += count
             
@@ -1,12 +1,18 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.contrib.auth import get_user_model
 from agents.models import AgentSkill
 
 User = get_user_model()
 
 
+def seconds_of_day(value):
+    """Convert a time of day to whole seconds since midnight"""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 class Campaign(models.Model):
     """
     Campaign model for managing outbound and inbound call campaigns
@@ -25,6 +31,9 @@ class Campaign(models.Model):
         ('auto', 'Auto'),
     ]
     
+    # Weekday flag fields in datetime.weekday() order (0 = Monday)
+    WEEKDAY_FIELDS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+    
     STATUS_CHOICES = [
         ('inactive', 'Inactive'),
         ('active', 'Active'),
@@ -153,6 +162,27 @@ class Campaign(models.Model):
         """Check if campaign is currently active"""
         return self.status == 'active'
 
+    # Schedule values below are computed once per instance; re-fetch the
+    # campaign after changing its days or hours in place
+    @cached_property
+    def weekday_mask(self):
+        """Allowed weekdays as a bitmask: bit N is set when weekday N (0 = Monday) is enabled"""
+        return sum(
+            1 << weekday
+            for weekday, field in enumerate(self.WEEKDAY_FIELDS)
+            if getattr(self, field)
+        )
+
+    @cached_property
+    def start_seconds(self):
+        """Daily start time in seconds since midnight"""
+        return seconds_of_day(self.start_time)
+
+    @cached_property
+    def end_seconds(self):
+        """Daily end time in seconds since midnight"""
+        return seconds_of_day(self.end_time)
+
     def is_in_time_window(self, current_datetime=None):
         """Check if campaign should be running based on schedule"""
         if current_datetime is None:
@@ -165,18 +195,12 @@ class Campaign(models.Model):
             return False
         
         # Check time of day
-        current_time = current_datetime.time()
-        if current_time < self.start_time or current_time > self.end_time:
+        current_seconds = seconds_of_day(current_datetime)
+        if current_seconds < self.start_seconds or current_seconds > self.end_seconds:
             return False
         
-        # Check day of week
-        weekday = current_datetime.weekday()  # 0 = Monday, 6 = Sunday
-        day_enabled = [
-            self.monday, self.tuesday, self.wednesday, self.thursday,
-            self.friday, self.saturday, self.sunday
-        ][weekday]
-        
-        return day_enabled
+        # Check day of week (0 = Monday, 6 = Sunday)
+        return bool(self.weekday_mask >> current_datetime.weekday() & 1)
 
     def get_available_agents(self):
         """Get agents available for this campaign"""
@@ -311,14 +335,20 @@ class CampaignStatistics(models.Model):
     def __str__(self):
         return f"{self.campaign.name} Statistics"
 
+    # Values the daily counters are reset to at the start of each day
+    DAILY_STAT_DEFAULTS = {
+        'calls_attempted_today': 0,
+        'calls_completed_today': 0,
+        'calls_answered_today': 0,
+        'calls_dropped_today': 0,
+        'contact_rate_today': 0.0,
+        'conversion_rate_today': 0.0,
+    }
+
     def reset_daily_stats(self):
         """Reset daily statistics (called by scheduled task)"""
-        self.calls_attempted_today = 0
-        self.calls_completed_today = 0
-        self.calls_answered_today = 0
-        self.calls_dropped_today = 0
-        self.contact_rate_today = 0.0
-        self.conversion_rate_today = 0.0
+        for field, value in self.DAILY_STAT_DEFAULTS.items():
+            setattr(self, field, value)
         self.last_reset_date = timezone.now().date()
         self.save()
 
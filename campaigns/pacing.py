@@ -6,11 +6,12 @@ historical performance, and real-time metrics for optimal call center efficiency
 """
 
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict, List, Tuple, Optional
 from django.utils import timezone
-from django.db.models import Count, Avg, Q
+from django.db.models import Count, Avg, Q, Prefetch
 from django.contrib.auth import get_user_model
 
 from .models import Campaign, CampaignStatistics
@@ -20,6 +21,17 @@ from agents.models import AgentStatus
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Maps AgentStatus.status values to the pacing metric bucket they count towards.
+# Any status not listed here (including a missing status) counts as offline.
+STATUS_BUCKET = {
+    'available': 'available',
+    'on_call': 'on_call',
+    'connected': 'on_call',
+    'wrap_up': 'wrap_up',
+    'break': 'break',
+    'lunch': 'break',
+}
+
 
 class AgentAvailabilityTracker:
     """
@@ -37,52 +49,83 @@ class AgentAvailabilityTracker:
             Dict with current agent status counts
         """
         assigned_agents = self.campaign.assigned_agents.filter(is_active=True)
+        return self._summarize_agent_statuses(assigned_agents)
+    
+    @classmethod
+    def bulk_metrics(cls, campaigns: List[Campaign]) -> Dict[int, Dict[str, int]]:
+        """
+        Get real-time agent metrics for several campaigns at once.
         
-        # Get agent status counts
-        status_counts = {
-            'total_assigned': assigned_agents.count(),
-            'logged_in': 0,
-            'available': 0,
-            'on_call': 0,
-            'wrap_up': 0,
-            'break': 0,
-            'offline': 0
+        Assigned agents and their current status are prefetched for all
+        campaigns in a single pass instead of querying per campaign.
+        
+        Args:
+            campaigns: Campaigns to report on
+        
+        Returns:
+            Dict mapping campaign id to its agent status counts
+        """
+        agents_queryset = User.objects.filter(is_active=True).select_related(
+            'current_status'
+        ).only('id', 'current_status__status')
+        
+        prefetched_campaigns = Campaign.objects.filter(
+            id__in=[campaign.id for campaign in campaigns]
+        ).prefetch_related(
+            Prefetch('assigned_agents', queryset=agents_queryset)
+        )
+        
+        return {
+            campaign.id: cls._summarize_agent_statuses(list(campaign.assigned_agents.all()))
+            for campaign in prefetched_campaigns
         }
+    
+    @staticmethod
+    def _summarize_agent_statuses(agents) -> Dict[str, int]:
+        """
+        Count agents by their current status.
         
-        # Count agents by status
-        for agent in assigned_agents:
-            if hasattr(agent, 'current_status') and agent.current_status:
-                status = agent.current_status.status
-                if status == 'available':
-                    status_counts['available'] += 1
-                    status_counts['logged_in'] += 1
-                elif status in ['on_call', 'connected']:
-                    status_counts['on_call'] += 1
-                    status_counts['logged_in'] += 1
-                elif status == 'wrap_up':
-                    status_counts['wrap_up'] += 1
-                    status_counts['logged_in'] += 1
-                elif status in ['break', 'lunch']:
-                    status_counts['break'] += 1
-                    status_counts['logged_in'] += 1
-                else:
-                    status_counts['offline'] += 1
-            else:
-                status_counts['offline'] += 1
+        Args:
+            agents: QuerySet or list of agents
+        
+        Returns:
+            Dict with agent status counts
+        """
+        total_assigned = len(agents) if isinstance(agents, list) else agents.count()
+        
+        # Bucket agents by status with a single dict lookup per agent
+        bucket_counts = Counter()
+        for agent in agents:
+            status = getattr(getattr(agent, 'current_status', None), 'status', None)
+            bucket_counts[STATUS_BUCKET.get(status, 'offline')] += 1
+        
+        status_counts = {
+            'total_assigned': total_assigned,
+            'logged_in': sum(count for bucket, count in bucket_counts.items() if bucket != 'offline'),
+            'available': bucket_counts['available'],
+            'on_call': bucket_counts['on_call'],
+            'wrap_up': bucket_counts['wrap_up'],
+            'break': bucket_counts['break'],
+            'offline': bucket_counts['offline']
+        }
         
         return status_counts
     
-    def get_agent_utilization_history(self, hours: int = 24) -> Dict[str, float]:
+    def get_agent_utilization_history(self, hours: int = 24,
+                                      now: Optional[datetime] = None) -> Dict[str, float]:
         """
         Calculate agent utilization over the specified time period.
         
         Args:
             hours: Number of hours to look back
+            now: Reference time for the window (defaults to timezone.now())
             
         Returns:
             Dict with utilization metrics
         """
-        cutoff_time = timezone.now() - timedelta(hours=hours)
+        if now is None:
+            now = timezone.now()
+        cutoff_time = now - timedelta(hours=hours)
         
         # Get call tasks from the period
         recent_calls = CallTask.objects.filter(
@@ -135,23 +178,37 @@ class AgentAvailabilityTracker:
             'utilization': utilization
         }
     
-    def predict_agent_availability(self, minutes_ahead: int = 30) -> Dict[str, float]:
+    def predict_agent_availability(self, minutes_ahead: int = 30,
+                                   now: Optional[datetime] = None) -> Dict[str, float]:
         """
         Predict agent availability for the next specified minutes.
         
         Args:
             minutes_ahead: Minutes to predict ahead
+            now: Reference time for the prediction (defaults to timezone.now())
             
         Returns:
             Dict with availability predictions
         """
+        if now is None:
+            now = timezone.now()
         current_metrics = self.get_current_agent_metrics()
-        historical_data = self.get_agent_utilization_history(hours=168)  # Last week
         
         # Simple prediction based on current state and historical patterns
         current_available = current_metrics['available']
         current_on_call = current_metrics['on_call']
         
+        if current_available == 0 and current_on_call == 0:
+            # Nobody can become available, skip the week-long history query
+            return {
+                'current_available': 0,
+                'predicted_available': 0,
+                'prediction_confidence': 0.0,
+                'minutes_ahead': minutes_ahead
+            }
+        
+        historical_data = self.get_agent_utilization_history(hours=168, now=now)  # Last week
+        
         # Estimate how many agents will become available
         avg_call_minutes = historical_data['avg_call_minutes']
         
@@ -181,26 +238,42 @@ class PacingCalculator:
         self.availability_tracker = AgentAvailabilityTracker(campaign)
         self.statistics = getattr(campaign, 'statistics', None)
         
-    def calculate_optimal_pacing_ratio(self) -> Tuple[float, Dict[str, any]]:
+    def calculate_optimal_pacing_ratio(self, now: Optional[datetime] = None) -> Tuple[float, Dict[str, any]]:
         """
         Calculate the optimal pacing ratio based on current conditions.
         
+        Args:
+            now: Reference time shared by all factors (defaults to timezone.now())
+            
         Returns:
             Tuple of (pacing_ratio, calculation_details)
         """
+        if now is None:
+            now = timezone.now()
+        
         # Get current agent metrics
         agent_metrics = self.availability_tracker.get_current_agent_metrics()
-        historical_data = self.availability_tracker.get_agent_utilization_history()
         
         # Base ratio from campaign configuration
         base_ratio = float(self.campaign.pacing_ratio)
         
+        if agent_metrics['logged_in'] == 0:
+            # No agents to take calls, skip the historical and factor calculations
+            return 0.0, {
+                'base_ratio': base_ratio,
+                'reason': 'no_agents',
+                'optimal_ratio': 0.0,
+                'agent_metrics': agent_metrics
+            }
+        
+        historical_data = self.availability_tracker.get_agent_utilization_history(now=now)
+        
         # Adjustment factors
         contact_rate_factor = self._calculate_contact_rate_factor(historical_data['contact_rate'])
         drop_rate_factor = self._calculate_drop_rate_factor()
         agent_availability_factor = self._calculate_agent_availability_factor(agent_metrics)
         utilization_factor = self._calculate_utilization_factor(historical_data['utilization'])
-        time_of_day_factor = self._calculate_time_of_day_factor()
+        time_of_day_factor = self._calculate_time_of_day_factor(now)
         
         # Calculate adjusted ratio
         adjusted_ratio = (
@@ -325,11 +398,13 @@ class PacingCalculator:
             # Low utilization, increase pacing significantly
             return 1.3
     
-    def _calculate_time_of_day_factor(self) -> float:
+    def _calculate_time_of_day_factor(self, now: Optional[datetime] = None) -> float:
         """
         Calculate pacing adjustment based on time of day patterns.
         """
-        current_time = timezone.now().time()
+        if now is None:
+            now = timezone.now()
+        current_time = now.time()
         hour = current_time.hour
         
         # Peak hours (typically 10 AM - 2 PM and 6 PM - 8 PM)
@@ -348,14 +423,17 @@ class PacingCalculator:
         else:
             return 0.8  # Conservative pacing for unusual hours
     
-    def get_recommended_calls_per_agent(self) -> Tuple[float, Dict[str, any]]:
+    def get_recommended_calls_per_agent(self, now: Optional[datetime] = None) -> Tuple[float, Dict[str, any]]:
         """
         Get recommended number of concurrent calls per available agent.
         
+        Args:
+            now: Reference time passed to the pacing calculation
+            
         Returns:
             Tuple of (calls_per_agent, calculation_details)
         """
-        optimal_ratio, details = self.calculate_optimal_pacing_ratio()
+        optimal_ratio, details = self.calculate_optimal_pacing_ratio(now=now)
         agent_metrics = details['agent_metrics']
         
         available_agents = agent_metrics['available']
@@ -375,14 +453,17 @@ class PacingCalculator:
         
         return calls_per_agent, details
     
-    def should_adjust_pacing(self) -> Tuple[bool, str, float]:
+    def should_adjust_pacing(self, now: Optional[datetime] = None) -> Tuple[bool, str, float]:
         """
         Determine if pacing should be adjusted and by how much.
         
+        Args:
+            now: Reference time passed to the pacing calculation
+            
         Returns:
             Tuple of (should_adjust, reason, new_ratio)
         """
-        optimal_ratio, details = self.calculate_optimal_pacing_ratio()
+        optimal_ratio, details = self.calculate_optimal_pacing_ratio(now=now)
         current_ratio = float(self.campaign.pacing_ratio)
         
         # Define adjustment threshold (5% difference)
@@ -401,6 +482,9 @@ class PacingCalculator:
     
     def _get_primary_adjustment_reason(self, details: Dict[str, any], direction: str) -> str:
         """Get the primary reason for pacing adjustment."""
+        if details.get('reason') == 'no_agents':
+            return 'no agents logged in'
+        
         factors = {
             'contact_rate': details['contact_rate_factor'],
             'drop_rate': details['drop_rate_factor'],
@@ -444,16 +528,21 @@ class PacingMonitor:
         Returns:
             Dict with pacing performance metrics and recommendations
         """
+        # Single time snapshot shared by every calculation in the report
+        now = timezone.now()
+        
         # Get current calculations
-        optimal_ratio, calculation_details = self.calculator.calculate_optimal_pacing_ratio()
-        calls_per_agent, agent_details = self.calculator.get_recommended_calls_per_agent()
-        should_adjust, reason, new_ratio = self.calculator.should_adjust_pacing()
+        optimal_ratio, calculation_details = self.calculator.calculate_optimal_pacing_ratio(now=now)
+        calls_per_agent, agent_details = self.calculator.get_recommended_calls_per_agent(now=now)
+        should_adjust, reason, new_ratio = self.calculator.should_adjust_pacing(now=now)
         
         # Get historical performance
-        historical_data = self.calculator.availability_tracker.get_agent_utilization_history(hours=24)
+        historical_data = self.calculator.availability_tracker.get_agent_utilization_history(hours=24, now=now)
         
         # Predict future availability
-        availability_prediction = self.calculator.availability_tracker.predict_agent_availability(minutes_ahead=60)
+        availability_prediction = self.calculator.availability_tracker.predict_agent_availability(
+            minutes_ahead=60, now=now
+        )
         
         report = {
             'campaign_name': self.campaign.name,
@@ -466,7 +555,7 @@ class PacingMonitor:
             'calculation_details': calculation_details,
             'historical_performance': historical_data,
             'availability_prediction': availability_prediction,
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         return report
@@ -153,20 +153,23 @@ class CampaignStatisticsSerializer(serializers.ModelSerializer):
     Serializer for CampaignStatistics model - mostly read-only.
     """
     campaign_name = serializers.CharField(source='campaign.name', read_only=True)
+    drop_rate_today = serializers.FloatField(source='calculate_drop_rate_today', read_only=True)
 
     class Meta:
         model = CampaignStatistics
         fields = [
-            'id', 'campaign', 'campaign_name', 'date', 'calls_attempted',
-            'calls_connected', 'calls_dropped', 'calls_answered',
-            'total_talk_time', 'average_talk_time', 'leads_contacted',
-            'appointments_set', 'sales_made', 'current_drop_rate'
+            'id', 'campaign', 'campaign_name', 'active_calls', 'agents_logged_in',
+            'agents_available', 'agents_on_call', 'calls_attempted_today',
+            'calls_completed_today', 'calls_answered_today', 'calls_dropped_today',
+            'average_call_duration', 'average_wrap_time', 'contact_rate_today',
+            'conversion_rate_today', 'drop_rate_today', 'last_updated', 'last_reset_date'
         ]
         read_only_fields = [
-            'id', 'date', 'calls_attempted', 'calls_connected',
-            'calls_dropped', 'calls_answered', 'total_talk_time',
-            'average_talk_time', 'leads_contacted', 'appointments_set',
-            'sales_made', 'current_drop_rate'
+            'id', 'active_calls', 'agents_logged_in', 'agents_available',
+            'agents_on_call', 'calls_attempted_today', 'calls_completed_today',
+            'calls_answered_today', 'calls_dropped_today', 'average_call_duration',
+            'average_wrap_time', 'contact_rate_today', 'conversion_rate_today',
+            'last_updated', 'last_reset_date'
         ]
 
 
@@ -8,12 +8,20 @@ It provides intelligent call pacing, agent availability monitoring, and drop rat
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache, wraps
 from typing import List, Optional, Dict, Tuple
+import pytz
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Q, Count, Avg
+from django.db import transaction
+from django.db.models import (
+    Q, Count, Avg, Sum, F, Case, When, Value, ExpressionWrapper, DecimalField, Window
+)
+from django.db.models.functions import RowNumber
 from django.contrib.auth import get_user_model
 
-from .models import Campaign, CampaignStatistics
+from . import counters
+from .models import Campaign, CampaignAgentAssignment, CampaignStatistics, seconds_of_day
 from leads.models import Lead
 from calls.models import CallTask
 from agents.models import AgentStatus
@@ -21,6 +29,52 @@ from agents.models import AgentStatus
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Parse each zoneinfo name once per process; lookups are hot in lead filtering
+_pytz_zone = lru_cache(maxsize=512)(pytz.timezone)
+
+
+@lru_cache(maxsize=1024)
+def _compile_campaign_window(day_mask: int, start_seconds: int, end_seconds: int):
+    """
+    Build the business-hours check for one campaign schedule.
+    
+    Closures are cached by schedule, so every tick for an unchanged campaign
+    reuses the same straight-line predicate.
+    
+    Args:
+        day_mask: Allowed weekdays bitmask (Campaign.weekday_mask)
+        start_seconds: Daily start in seconds since midnight
+        end_seconds: Daily end in seconds since midnight
+        
+    Returns:
+        Callable taking a local datetime and returning True within business hours
+    """
+    if start_seconds <= end_seconds:
+        # Same day window
+        def in_window(local_datetime) -> bool:
+            return bool(day_mask >> local_datetime.weekday() & 1) and (
+                start_seconds <= seconds_of_day(local_datetime) <= end_seconds
+            )
+    else:
+        # Cross midnight window
+        def in_window(local_datetime) -> bool:
+            if not day_mask >> local_datetime.weekday() & 1:
+                return False
+            local_seconds = seconds_of_day(local_datetime)
+            return local_seconds >= start_seconds or local_seconds <= end_seconds
+    
+    return in_window
+
+
+def _memoize(method):
+    """Cache a no-argument service getter for the lifetime of the instance."""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
+
 
 class PredictiveDialingService:
     """
@@ -33,9 +87,13 @@ class PredictiveDialingService:
     - Ratio: Fixed ratio dialing based on pacing_ratio setting
     """
     
-    def __init__(self, campaign: Campaign):
+    def __init__(self, campaign: Campaign, prefetched: Optional[Dict[str, int]] = None):
         self.campaign = campaign
         self.statistics = getattr(campaign, 'statistics', None)
+        self._prefetched = prefetched or {}
+        self._metrics = None
+        # Per-instance memo for the get_* helpers; a service lives for one tick
+        self._cache = {}
         
     def should_make_calls(self) -> bool:
         """
@@ -44,17 +102,22 @@ class PredictiveDialingService:
         Returns:
             bool: True if calls should be made, False otherwise
         """
-        # Check if campaign is active and in time window
+        # Cheapest checks first: the in-memory predicates, then EXISTS queries,
+        # so a campaign that is out of hours or unstaffed issues no SQL
         if not self.campaign.is_active() or not self.campaign.is_in_time_window():
             logger.info(f"Campaign {self.campaign.name} is not active or outside time window")
             return False
             
         # Check if we have available agents
-        available_agents = self.get_available_agent_count()
-        if available_agents == 0:
+        if not self.has_available_agents():
             logger.debug(f"No available agents for campaign {self.campaign.name}")
             return False
             
+        # Check if we have dialable leads
+        if not self.has_dialable_leads():
+            logger.info(f"No dialable leads available for campaign {self.campaign.name}")
+            return False
+            
         # Check drop rate compliance
         if self.campaign.should_reduce_pace():
             current_drop_rate = self.get_current_drop_rate()
@@ -62,18 +125,26 @@ class PredictiveDialingService:
                          f"{current_drop_rate:.2f}% > {self.campaign.drop_sla}%")
             # Still allow calls but with reduced pacing
             
-        # Check if we have dialable leads
-        dialable_leads = self.get_dialable_leads_count()
-        if dialable_leads == 0:
-            logger.info(f"No dialable leads available for campaign {self.campaign.name}")
-            return False
-            
         return True
     
     def calculate_calls_to_make(self) -> int:
         """
         Calculate the number of calls to initiate based on the campaign's dial method.
         
+        Returns:
+            int: Number of calls to make
+        """
+        # Load all metrics once so the helpers below read from memory
+        self._metrics = self._load_metrics()
+        try:
+            return self._calculate_calls_for_dial_method()
+        finally:
+            self._metrics = None
+    
+    def _calculate_calls_for_dial_method(self) -> int:
+        """
+        Dispatch the calls calculation to the campaign's dial method.
+        
         Returns:
             int: Number of calls to make
         """
@@ -165,15 +236,16 @@ class PredictiveDialingService:
             
         # Adjust for current performance
         current_drop_rate = self.get_current_drop_rate()
+        drop_sla = float(self.campaign.drop_sla)
         
-        if current_drop_rate > self.campaign.drop_sla:
+        if current_drop_rate > drop_sla:
             # Reduce aggressiveness if exceeding drop SLA
-            drop_penalty = 1.0 - min(0.5, (current_drop_rate - self.campaign.drop_sla) / 10.0)
+            drop_penalty = 1.0 - min(0.5, (current_drop_rate - drop_sla) / 10.0)
             base_ratio *= drop_penalty
             
-        elif current_drop_rate < self.campaign.drop_sla * 0.5:
+        elif current_drop_rate < drop_sla * 0.5:
             # Increase aggressiveness if well below drop SLA
-            drop_bonus = 1.0 + min(0.3, (self.campaign.drop_sla * 0.5 - current_drop_rate) / 10.0)
+            drop_bonus = 1.0 + min(0.3, (drop_sla * 0.5 - current_drop_rate) / 10.0)
             base_ratio *= drop_bonus
             
         # Calculate target calls
@@ -193,46 +265,47 @@ class PredictiveDialingService:
         
         return calls_to_make
     
-    def get_dialable_leads(self, limit: int = None) -> List[Lead]:
+    def get_dialable_leads(self, limit: int = None, lock: bool = False,
+                           current_time: Optional[datetime] = None) -> List[Lead]:
         """
         Get leads that are ready to be dialed with timezone-aware filtering.
         
         Args:
             limit: Maximum number of leads to return
+            lock: Lock the returned rows with SELECT ... FOR UPDATE SKIP LOCKED,
+                so concurrent schedulers never pick the same lead. Must be
+                called inside a transaction.
+            current_time: Reference time (defaults to now)
             
         Returns:
             List[Lead]: Dialable leads ordered by priority, filtered by timezone
         """
-        from leads.models import Lead
+        if current_time is None:
+            current_time = timezone.now()
         
-        now = timezone.now()
+        queryset = self._get_dialable_leads_queryset(current_time)
         
-        # Base query for dialable leads
-        queryset = Lead.objects.filter(
-            campaign=self.campaign,
-            status__in=['new', 'callback', 'retry'],
-            attempts__lt=self.campaign.max_attempts,
-            is_dnc=False,  # Use is_dnc instead of do_not_call
-        ).exclude(
-            # Exclude leads in retry delay period
-            Q(last_call_at__isnull=False) & 
-            Q(last_call_at__gt=now - timedelta(minutes=self.campaign.retry_delay_minutes))
+        # Resolve business hours per distinct lead timezone and filter in SQL
+        tz_names = queryset.order_by().values_list('timezone', flat=True).distinct()
+        queryset = queryset.filter(
+            TimezoneSchedulingService.callable_leads_filter(self.campaign, tz_names, current_time)
+        )
+        
+        # Only load the columns read by call scheduling and the per-lead
+        # callability checks, so neither triggers deferred-field queries
+        queryset = queryset.only(
+            'id', 'campaign_id', 'phone', 'status', 'attempts', 'priority',
+            'last_call_at', 'created_at', 'timezone',
+            'best_call_time_start', 'best_call_time_end', 'do_not_call_after'
         ).order_by('-priority', 'last_call_at', 'created_at')
         
-        # Get initial leads (might be more than limit for timezone filtering)
-        initial_limit = limit * 3 if limit else 1000  # Get extra to account for timezone filtering
-        initial_leads = list(queryset[:initial_limit])
+        if lock:
+            queryset = queryset.select_for_update(skip_locked=True)
         
-        # Apply timezone-aware filtering
-        callable_leads = TimezoneSchedulingService.filter_callable_leads(
-            initial_leads, self.campaign
-        )
+        if limit:
+            queryset = queryset[:limit]
         
-        # Apply final limit after timezone filtering
-        if limit and len(callable_leads) > limit:
-            callable_leads = callable_leads[:limit]
-            
-        return callable_leads
+        return list(queryset)
     
     def get_dialable_leads_count(self) -> int:
         """
@@ -240,56 +313,167 @@ class PredictiveDialingService:
         
         Note: This provides an estimate as timezone filtering requires 
         individual lead evaluation which is expensive for counting.
+        The count is cached for a few seconds per campaign since it is
+        requested on every dialing tick.
+        """
+        # For accurate count, we'd need to apply timezone filtering,
+        # but that's expensive for large datasets. Return base count as estimate.
+        # For precise counts when needed, use len(get_dialable_leads()), and
+        # use has_dialable_leads() when only a yes/no answer is needed
+        return cache.get_or_set(
+            f'dialable_count:{self.campaign.id}',
+            lambda: self._get_dialable_leads_queryset().count(),
+            10
+        )
+    
+    @_memoize
+    def has_dialable_leads(self) -> bool:
+        """Check whether at least one lead is ready to be dialed."""
+        return self._get_dialable_leads_queryset().exists()
+    
+    def _get_dialable_leads_queryset(self, current_time: Optional[datetime] = None):
         """
-        from leads.models import Lead
+        Build the base queryset of dialable leads, before timezone filtering.
         
-        now = timezone.now()
+        Args:
+            current_time: Reference time (defaults to now)
+            
+        Returns:
+            QuerySet: Leads eligible for dialing in this campaign
+        """
+        now = current_time or timezone.now()
         
-        # Get base count without timezone filtering (for performance)
-        base_count = Lead.objects.filter(
+        # callable() applies the per-lead DNC, consent, attempt and expiry rules
+        return Lead.objects.callable().filter(
             campaign=self.campaign,
             status__in=['new', 'callback', 'retry'],
             attempts__lt=self.campaign.max_attempts,
-            is_dnc=False,  # Use is_dnc instead of do_not_call
         ).exclude(
+            # Exclude leads in retry delay period
             Q(last_call_at__isnull=False) & 
             Q(last_call_at__gt=now - timedelta(minutes=self.campaign.retry_delay_minutes))
-        ).count()
+        )
+    
+    def _load_metrics(self) -> Dict[str, float]:
+        """
+        Load every metric used by the calls calculation in as few queries as possible.
         
-        # For accurate count, we'd need to apply timezone filtering,
-        # but that's expensive for large datasets. Return base count as estimate.
-        # For precise counts when needed, use len(get_dialable_leads())
-        return base_count
+        Values already held on the statistics row are read directly; the call
+        task fallbacks (active calls and average call duration) are fused into
+        a single aggregate query and only computed when statistics lack them.
+        
+        Returns:
+            Dict with the metrics read by the get_* helpers
+        """
+        aggregates = {}
+        fallback_filter = Q()
+        
+        if not self.statistics and 'active_calls' not in self._prefetched:
+            aggregates['active_calls'] = Count(
+                'id', filter=Q(state__in=['dialing', 'ringing', 'connected'])
+            )
+            fallback_filter |= Q(state__in=['dialing', 'ringing', 'connected'])
+        
+        if not (self.statistics and self.statistics.average_call_duration):
+            recent_completed = Q(
+                state='completed',
+                completed_at__isnull=False,
+                call_duration__isnull=False,
+                created_at__gte=timezone.now() - timedelta(days=7)
+            )
+            aggregates['avg_call_duration'] = Avg('call_duration', filter=recent_completed)
+            fallback_filter |= recent_completed
+        
+        call_metrics = {}
+        if aggregates:
+            call_metrics = CallTask.objects.filter(
+                fallback_filter, campaign=self.campaign
+            ).aggregate(**aggregates)
+        
+        if 'active_calls' in call_metrics:
+            active_calls = call_metrics['active_calls']
+        else:
+            active_calls = self.get_active_calls_count()
+        
+        if self.statistics and self.statistics.average_call_duration:
+            avg_call_duration = self.statistics.average_call_duration.total_seconds() / 60.0
+        elif call_metrics['avg_call_duration']:
+            avg_call_duration = call_metrics['avg_call_duration'].total_seconds() / 60.0
+        else:
+            avg_call_duration = 3.0  # Default assumption
+        
+        return {
+            'available_agents': self.get_available_agent_count(),
+            'active_calls': active_calls,
+            'drop_rate': self.get_current_drop_rate(),
+            'contact_rate': self.get_contact_rate(),
+            'avg_call_duration_minutes': avg_call_duration,
+            'avg_wrap_time_minutes': self.get_average_wrap_time_minutes(),
+        }
     
+    @_memoize
     def get_available_agent_count(self) -> int:
         """Get number of agents available for this campaign."""
+        if self._metrics is not None:
+            return self._metrics['available_agents']
+        
+        if 'available_agents' in self._prefetched:
+            return self._prefetched['available_agents']
+        
         return self.campaign.get_available_agents().count()
     
+    def has_available_agents(self) -> bool:
+        """Check whether at least one agent is available for this campaign."""
+        if (self._metrics is not None or 'available_agents' in self._prefetched
+                or 'get_available_agent_count' in self._cache):
+            return self.get_available_agent_count() > 0
+        
+        return self.campaign.get_available_agents().exists()
+    
+    @_memoize
     def get_active_calls_count(self) -> int:
         """Get number of active calls for this campaign."""
+        if self._metrics is not None:
+            return self._metrics['active_calls']
+        
         if self.statistics:
             return self.statistics.active_calls
         
+        if 'active_calls' in self._prefetched:
+            return self._prefetched['active_calls']
+        
         # Fallback to direct query if statistics not available
         return CallTask.objects.filter(
             campaign=self.campaign,
             state__in=['dialing', 'ringing', 'connected']
         ).count()
     
+    @_memoize
     def get_current_drop_rate(self) -> float:
         """Get current drop rate percentage."""
+        if self._metrics is not None:
+            return self._metrics['drop_rate']
+        
         if self.statistics:
             return float(self.statistics.calculate_drop_rate_today())
         return float(self.campaign.current_drop_rate)
     
+    @_memoize
     def get_contact_rate(self) -> float:
         """Get current contact rate percentage."""
+        if self._metrics is not None:
+            return self._metrics['contact_rate']
+        
         if self.statistics:
             return float(self.statistics.contact_rate_today)
         return self.campaign.calculate_contact_rate()
     
+    @_memoize
     def get_average_call_duration_minutes(self) -> float:
         """Get average call duration in minutes."""
+        if self._metrics is not None:
+            return self._metrics['avg_call_duration_minutes']
+        
         if self.statistics and self.statistics.average_call_duration:
             return self.statistics.average_call_duration.total_seconds() / 60.0
         
@@ -302,53 +486,81 @@ class PredictiveDialingService:
             created_at__gte=timezone.now() - timedelta(days=7)
         )
         
-        if recent_calls.exists():
-            avg_duration = recent_calls.aggregate(
-                avg_duration=Avg('call_duration')
-            )['avg_duration']
-            if avg_duration:
-                return avg_duration.total_seconds() / 60.0
+        # Avg() is NULL on an empty set, so no separate existence check is needed
+        avg_duration = recent_calls.aggregate(
+            avg_duration=Avg('call_duration')
+        )['avg_duration']
+        if avg_duration:
+            return avg_duration.total_seconds() / 60.0
         
         return 3.0  # Default assumption
     
+    @_memoize
     def get_average_wrap_time_minutes(self) -> float:
         """Get average wrap-up time in minutes."""
+        if self._metrics is not None:
+            return self._metrics['avg_wrap_time_minutes']
+        
         if self.statistics and self.statistics.average_wrap_time:
             return self.statistics.average_wrap_time.total_seconds() / 60.0
         
         return float(self.campaign.wrap_up_time) / 60.0  # Convert seconds to minutes
     
-    def update_statistics(self, call_attempted: bool = False, call_answered: bool = False, 
-                         call_dropped: bool = False) -> None:
+    def update_statistics(self, call_attempted: int = 0, call_answered: int = 0, 
+                         call_dropped: int = 0) -> None:
         """
         Update campaign statistics after call events.
         
         Args:
-            call_attempted: Whether a call was attempted
-            call_answered: Whether a call was answered
-            call_dropped: Whether a call was dropped (abandoned)
+            call_attempted: Number of calls attempted (True counts as one)
+            call_answered: Number of calls answered (True counts as one)
+            call_dropped: Number of calls dropped, i.e. abandoned (True counts as one)
         """
+        attempted = int(call_attempted)
+        answered = int(call_answered)
+        dropped = int(call_dropped)
+        if not (attempted or answered or dropped):
+            return
+        
+        # Buffer in Redis when available; flush_campaign_counters applies the
+        # deltas to CampaignStatistics every few seconds
+        if counters.increment(self.campaign.id, attempted, answered, dropped):
+            return
+        
         if not self.statistics:
             # Create statistics if they don't exist
             self.statistics = CampaignStatistics.objects.create(campaign=self.campaign)
-            
-        if call_attempted:
-            self.statistics.calls_attempted_today += 1
-            
-        if call_answered:
-            self.statistics.calls_answered_today += 1
-            
-        if call_dropped:
-            self.statistics.calls_dropped_today += 1
-            
-        # Update contact rate
-        if self.statistics.calls_attempted_today > 0:
-            self.statistics.contact_rate_today = (
-                self.statistics.calls_answered_today / 
-                self.statistics.calls_attempted_today * 100
+        
+        # Increment counters and recompute the contact rate in one UPDATE so
+        # concurrent call events never overwrite each other's counts
+        attempted_today = F('calls_attempted_today') + attempted
+        answered_today = F('calls_answered_today') + answered
+        
+        with transaction.atomic():
+            CampaignStatistics.objects.filter(pk=self.statistics.pk).update(
+                calls_attempted_today=attempted_today,
+                calls_answered_today=answered_today,
+                calls_dropped_today=F('calls_dropped_today') + dropped,
+                contact_rate_today=Case(
+                    When(
+                        calls_attempted_today__gt=-attempted,
+                        then=ExpressionWrapper(
+                            answered_today * Value(100.0) / attempted_today,
+                            output_field=DecimalField(max_digits=5, decimal_places=2)
+                        )
+                    ),
+                    default=F('contact_rate_today')
+                ),
+                last_updated=timezone.now()
             )
             
-        self.statistics.save()
+            self.statistics.refresh_from_db(fields=[
+                'calls_attempted_today', 'calls_answered_today',
+                'calls_dropped_today', 'contact_rate_today', 'last_updated'
+            ])
+        
+        # Rates derived from the statistics row are now stale
+        self._cache.clear()
         
         # Also update the campaign's drop rate
         if self.statistics.calls_attempted_today > 0:
@@ -357,7 +569,6 @@ class PredictiveDialingService:
                 self.statistics.calls_attempted_today
             )
 
-
 class PredictiveDialingManager:
     """
     Manager class for handling multiple campaigns and coordinating dialing operations.
@@ -371,33 +582,111 @@ class PredictiveDialingManager:
             dial_method__in=['predictive', 'progressive', 'ratio']
         ).select_related('statistics')
     
+    # Seconds a campaign looked up by ID is served from the cache
+    CAMPAIGN_CACHE_TIMEOUT = 30
+    
     @staticmethod
-    def process_all_campaigns() -> Dict[str, int]:
+    def campaign_cache_key(campaign_id: int) -> str:
+        """Return the cache key for a campaign looked up by ID."""
+        return f'campaign:{campaign_id}'
+    
+    @staticmethod
+    def get_campaign(campaign_id: int) -> Campaign:
         """
-        Process all active campaigns and return summary of calls initiated.
+        Get a campaign by primary key, served from a short-lived cache.
+        
+        Entries are invalidated when the campaign is saved or deleted
+        (see campaigns.signals).
         
+        Args:
+            campaign_id: ID of the campaign
+            
         Returns:
-            Dict[str, int]: Campaign name to calls initiated mapping
+            Campaign: The campaign
+            
+        Raises:
+            Campaign.DoesNotExist: If no campaign has this ID
+        """
+        cache_key = PredictiveDialingManager.campaign_cache_key(campaign_id)
+        campaign = cache.get(cache_key)
+        
+        if campaign is None:
+            campaign = Campaign.objects.get(pk=campaign_id)
+            cache.set(cache_key, campaign, PredictiveDialingManager.CAMPAIGN_CACHE_TIMEOUT)
+        
+        return campaign
+    
+    @staticmethod
+    def process_campaign(campaign: Campaign, prefetched: Dict[str, int]) -> int:
         """
-        results = {}
+        Work out how many calls a single campaign should place now.
         
-        for campaign in PredictiveDialingManager.get_active_campaigns():
-            dialer = PredictiveDialingService(campaign)
+        Args:
+            campaign: Campaign to evaluate
+            prefetched: Counts from get_campaign_counts for this campaign
             
-            if dialer.should_make_calls():
-                calls_to_make = dialer.calculate_calls_to_make()
-                
-                if calls_to_make > 0:
-                    # This would trigger the actual call initiation
-                    # Implementation depends on telephony integration
-                    logger.info(f"Campaign {campaign.name}: scheduling {calls_to_make} calls")
-                    results[campaign.name] = calls_to_make
-                else:
-                    results[campaign.name] = 0
-            else:
-                results[campaign.name] = 0
-                
-        return results
+        Returns:
+            int: Number of calls to initiate
+        """
+        dialer = PredictiveDialingService(campaign, prefetched=prefetched)
+        
+        if not dialer.should_make_calls():
+            return 0
+        
+        calls_to_make = dialer.calculate_calls_to_make()
+        if calls_to_make <= 0:
+            return 0
+        
+        # This would trigger the actual call initiation
+        # Implementation depends on telephony integration
+        logger.info(f"Campaign {campaign.name}: scheduling {calls_to_make} calls")
+        return calls_to_make
+    
+    @staticmethod
+    def get_campaign_counts(campaigns: List[Campaign]) -> Dict[int, Dict[str, int]]:
+        """
+        Get available agent and active call counts for several campaigns at once.
+        
+        Each count is a single GROUP BY query across all campaigns. Active calls
+        are only counted for campaigns without a statistics row, since the
+        dialing service reads them from statistics otherwise.
+        
+        Args:
+            campaigns: Campaigns to count for
+            
+        Returns:
+            Dict mapping campaign id to its prefetched counts
+        """
+        campaign_ids = [campaign.id for campaign in campaigns]
+        
+        available_counts = dict(
+            CampaignAgentAssignment.objects.filter(
+                campaign_id__in=campaign_ids,
+                is_active=True,
+                agent__current_status__status='available'
+            ).order_by().values_list('campaign_id').annotate(count=Count('agent_id', distinct=True))
+        )
+        
+        campaigns_without_statistics = [
+            campaign.id for campaign in campaigns
+            if getattr(campaign, 'statistics', None) is None
+        ]
+        active_counts = {}
+        if campaigns_without_statistics:
+            active_counts = dict(
+                CallTask.objects.filter(
+                    campaign_id__in=campaigns_without_statistics,
+                    state__in=['dialing', 'ringing', 'connected']
+                ).order_by().values_list('campaign_id').annotate(count=Count('id'))
+            )
+        
+        counts = {}
+        for campaign_id in campaign_ids:
+            counts[campaign_id] = {'available_agents': available_counts.get(campaign_id, 0)}
+            if campaign_id in campaigns_without_statistics:
+                counts[campaign_id]['active_calls'] = active_counts.get(campaign_id, 0)
+        
+        return counts
     
     @staticmethod
     def get_system_capacity() -> Dict[str, int]:
@@ -407,14 +696,15 @@ class PredictiveDialingManager:
         Returns:
             Dict with system capacity metrics
         """
-        total_agents = User.objects.filter(is_active=True).count()
-        available_agents = User.objects.filter(
-            current_status__status='available'
-        ).count()
-        active_calls = sum(
-            campaign.statistics.active_calls if campaign.statistics else 0
-            for campaign in Campaign.objects.filter(status='active')
+        agent_counts = User.objects.aggregate(
+            total_agents=Count('id', filter=Q(is_active=True)),
+            available_agents=Count('id', filter=Q(current_status__status='available'))
         )
+        total_agents = agent_counts['total_agents']
+        available_agents = agent_counts['available_agents']
+        active_calls = CampaignStatistics.objects.filter(
+            campaign__status='active'
+        ).aggregate(total=Sum('active_calls'))['total'] or 0
         
         return {
             'total_agents': total_agents,
@@ -429,31 +719,109 @@ class LeadRecyclingService:
     Service class for handling lead recycling operations based on campaign rules.
     """
     
+    # Rows fetched per round-trip, and leads recycled per UPDATE, when recycling
+    RECYCLE_CHUNK_SIZE = 500
+    
+    # Campaign fields read by the recycling rules and the business hours check
+    CAMPAIGN_FIELDS = (
+        'id', 'name', 'status', 'recycle_inactive_leads',
+        'recycle_no_answer_days', 'recycle_busy_days', 'recycle_disconnected_days',
+        'max_recycle_attempts', 'exclude_dnc_from_recycling', 'recycle_only_business_hours',
+        'start_date', 'end_date', 'start_time', 'end_time',
+        'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+    )
+    
+    # Lead fields read by the eligibility checks, recycle_lead and its log messages
+    LEAD_FIELDS = (
+        'id', 'phone', 'status', 'attempts', 'recycle_count', 'is_dnc',
+        'last_call_at', 'next_call_at',
+    )
+    
+    # Shared by every instance so constructing a service is just an attribute set
+    logger = logging.getLogger(__name__)
+    
     def __init__(self, campaign: Campaign):
         """Initialize with a specific campaign."""
         self.campaign = campaign
-        self.logger = logging.getLogger(__name__)
     
-    def get_recyclable_leads(self, status: str, days_threshold: int, limit: int = 100) -> List[Lead]:
+    @classmethod
+    def get_recycling_campaigns(cls):
         """
-        Get leads eligible for recycling based on status and time threshold.
+        Get active campaigns with recycling enabled, loading only the recycling config.
+        
+        Returns:
+            QuerySet of Campaign objects
+        """
+        return Campaign.objects.filter(
+            status='active', recycle_inactive_leads=True
+        ).only(*cls.CAMPAIGN_FIELDS)
+    
+    def get_recyclable_leads(self, status: str, limit: int = 100,
+                             current_time: Optional[datetime] = None) -> List[Lead]:
+        """
+        Get leads eligible for recycling based on status and the campaign's threshold for it.
         
         Args:
-            status: Lead status to filter by
-            days_threshold: Number of days after last call to consider for recycling
+            status: Recyclable lead status to filter by (a key of get_recycle_cutoffs)
             limit: Maximum number of leads to return
+            current_time: Reference time (defaults to now)
             
         Returns:
             List of Lead objects eligible for recycling
         """
-        current_time = timezone.now()
-        cutoff_time = current_time - timedelta(days=days_threshold)
+        cutoff_time = self.get_recycle_cutoffs(current_time)[status]
+        leads = self._get_recyclable_leads_queryset(status, cutoff_time).only(*self.LEAD_FIELDS)
+        return list(leads[:limit])
+    
+    def get_recycle_cutoffs(self, current_time: Optional[datetime] = None) -> Dict[str, datetime]:
+        """
+        Get the last-call cutoff time for each recyclable status.
+        
+        Args:
+            current_time: Reference time (defaults to now)
+            
+        Returns:
+            Dict mapping lead status to the latest last_call_at eligible for recycling
+        """
+        if current_time is None:
+            current_time = timezone.now()
+        
+        recycle_rules = {
+            'no_answer': self.campaign.recycle_no_answer_days,
+            'busy': self.campaign.recycle_busy_days,
+            'disconnected': self.campaign.recycle_disconnected_days,
+        }
         
-        # Base query for recyclable leads
+        return {
+            status: current_time - timedelta(days=days_threshold)
+            for status, days_threshold in recycle_rules.items()
+        }
+    
+    def _get_recyclable_leads_queryset(self, status: str, cutoff_time: datetime):
+        """
+        Build the queryset of leads eligible for recycling.
+        
+        Args:
+            status: Lead status to filter by
+            cutoff_time: Latest last call time eligible for recycling
+            
+        Returns:
+            QuerySet: Recyclable leads for this campaign
+        """
+        return self._get_recycle_candidates_queryset().filter(
+            status=status,
+            last_call_at__lte=cutoff_time
+        )
+    
+    def _get_recycle_candidates_queryset(self):
+        """
+        Build the queryset of this campaign's leads that the recycle limit and DNC rule allow.
+        
+        Returns:
+            QuerySet: Leads that may be recycled once their status cutoff has passed
+        """
         leads_query = Lead.objects.filter(
             campaign=self.campaign,
-            status=status,
-            last_call_at__lte=cutoff_time,
             recycle_count__lt=self.campaign.max_recycle_attempts
         )
         
@@ -461,7 +829,22 @@ class LeadRecyclingService:
         if self.campaign.exclude_dnc_from_recycling:
             leads_query = leads_query.filter(is_dnc=False)
         
-        return list(leads_query[:limit])
+        return leads_query
+    
+    def _recyclable_leads_filter(self, current_time: Optional[datetime] = None) -> Q:
+        """
+        Build one filter matching every recyclable status past its own cutoff.
+        
+        Args:
+            current_time: Reference time (defaults to now)
+            
+        Returns:
+            Q: OR of a (status, last_call_at cutoff) condition per recyclable status
+        """
+        recyclable = Q()
+        for status, cutoff_time in self.get_recycle_cutoffs(current_time).items():
+            recyclable |= Q(status=status, last_call_at__lte=cutoff_time)
+        return recyclable
     
     def recycle_lead(self, lead: Lead) -> bool:
         """
@@ -475,25 +858,20 @@ class LeadRecyclingService:
         """
         try:
             # Validate lead can be recycled
-            if lead.recycle_count >= self.campaign.max_recycle_attempts:
-                self.logger.warning(f"Lead {lead.phone} has reached max recycle attempts")
+            if not self._can_recycle_lead(lead):
                 return False
             
-            if self.campaign.exclude_dnc_from_recycling and lead.is_dnc:
-                self.logger.warning(f"Lead {lead.phone} is DNC and cannot be recycled")
+            now = timezone.now()
+            if not self.recycle_leads_bulk(Lead.objects.filter(pk=lead.pk), now):
                 return False
             
-            # Reset lead for recycling
+            # Mirror the reset on the in-memory lead without reloading it
             lead.status = 'new'
             lead.attempts = 0
             lead.recycle_count += 1
             lead.next_call_at = None
             lead.last_call_at = None
-            
-            lead.save(update_fields=[
-                'status', 'attempts', 'recycle_count', 
-                'next_call_at', 'last_call_at', 'updated_at'
-            ])
+            lead.updated_at = now
             
             self.logger.debug(f"Recycled lead {lead.phone} (recycle #{lead.recycle_count})")
             return True
@@ -502,60 +880,140 @@ class LeadRecyclingService:
             self.logger.error(f"Error recycling lead {lead.phone}: {e}")
             return False
     
-    def can_recycle_now(self) -> bool:
+    def _can_recycle_lead(self, lead: Lead) -> bool:
+        """
+        Check a lead against the campaign's recycle limit and DNC rule.
+        
+        Args:
+            lead: Lead object to check
+            
+        Returns:
+            bool: True if the lead may be recycled, False otherwise
+        """
+        if lead.recycle_count >= self.campaign.max_recycle_attempts:
+            self.logger.warning(f"Lead {lead.phone} has reached max recycle attempts")
+            return False
+        
+        if self.campaign.exclude_dnc_from_recycling and lead.is_dnc:
+            self.logger.warning(f"Lead {lead.phone} is DNC and cannot be recycled")
+            return False
+        
+        return True
+    
+    def recycle_leads_bulk(self, queryset, current_time: Optional[datetime] = None) -> int:
+        """
+        Recycle every lead in a queryset that the recycle limit and DNC rule allow, in one UPDATE.
+        
+        Args:
+            queryset: Lead queryset to recycle
+            current_time: Timestamp recorded as the update time (defaults to now)
+            
+        Returns:
+            int: Number of leads recycled
+        """
+        queryset = queryset.filter(recycle_count__lt=self.campaign.max_recycle_attempts)
+        
+        if self.campaign.exclude_dnc_from_recycling:
+            queryset = queryset.filter(is_dnc=False)
+        
+        return queryset.update(
+            status='new',
+            attempts=0,
+            recycle_count=F('recycle_count') + 1,
+            next_call_at=None,
+            last_call_at=None,
+            updated_at=current_time or timezone.now()
+        )
+    
+    def can_recycle_now(self, current_time: Optional[datetime] = None) -> bool:
         """
         Check if lead recycling can be performed now based on campaign rules.
         
+        Args:
+            current_time: Reference time (defaults to now)
+            
+        Returns:
+            bool: True if recycling can proceed, False otherwise
+        """
+        return LeadRecyclingService.campaign_can_recycle(self.campaign, current_time)
+    
+    @staticmethod
+    def campaign_can_recycle(campaign: Campaign, current_time: Optional[datetime] = None) -> bool:
+        """
+        Check if a campaign's leads can be recycled now, without building a service.
+        
+        The campaign's attributes are read on every call, so changes to the
+        campaign are always seen.
+        
+        Args:
+            campaign: Campaign to check
+            current_time: Reference time (defaults to now)
+            
         Returns:
             bool: True if recycling can proceed, False otherwise
         """
         # Check if campaign allows recycling
-        if not self.campaign.recycle_inactive_leads:
+        if not campaign.recycle_inactive_leads:
             return False
         
         # Check if campaign is active
-        if self.campaign.status != 'active':
+        if campaign.status != 'active':
             return False
         
         # Check business hours restriction
-        if self.campaign.recycle_only_business_hours and not self.campaign.is_in_time_window():
+        if campaign.recycle_only_business_hours and not campaign.is_in_time_window(current_time):
             return False
         
         return True
     
-    def process_campaign_recycling(self, batch_size: int = 100) -> Dict[str, int]:
+    def process_campaign_recycling(self, batch_size: int = 100,
+                                   current_time: Optional[datetime] = None) -> Dict[str, int]:
         """
         Process lead recycling for this campaign based on its rules.
         
         Args:
             batch_size: Maximum number of leads to process per status
+            current_time: Reference time (defaults to now)
             
         Returns:
             Dict with recycling results by status
         """
-        if not self.can_recycle_now():
+        if current_time is None:
+            current_time = timezone.now()
+        
+        if not self.can_recycle_now(current_time):
             return {}
         
-        results = {}
+        cutoffs = self.get_recycle_cutoffs(current_time)
+        results = {status: 0 for status in cutoffs}
         
-        # Define recyclable statuses and their time thresholds
-        recycle_rules = {
-            'no_answer': self.campaign.recycle_no_answer_days,
-            'busy': self.campaign.recycle_busy_days,
-            'disconnected': self.campaign.recycle_disconnected_days,
-        }
+        # One SELECT covers every status; the recycle limit and DNC rule are part of the
+        # filter, and each status is capped at batch_size in SQL, oldest calls first
+        candidates = self._get_recycle_candidates_queryset().filter(
+            self._recyclable_leads_filter(current_time)
+        ).annotate(
+            status_rank=Window(RowNumber(), partition_by=F('status'), order_by=F('last_call_at').asc())
+        ).filter(status_rank__lte=batch_size).order_by().values_list('id', 'status')
         
-        for status, days_threshold in recycle_rules.items():
-            # Get eligible leads
-            leads = self.get_recyclable_leads(status, days_threshold, batch_size)
-            
-            recycled_count = 0
-            for lead in leads:
-                if self.recycle_lead(lead):
-                    recycled_count += 1
-            
-            results[status] = recycled_count
-            
+        eligible = {status: [] for status in cutoffs}
+        for lead_id, status in candidates:
+            eligible[status].append(lead_id)
+        
+        # Each UPDATE rechecks its status cutoff, so a lead that stopped qualifying
+        # since the SELECT is neither recycled nor counted
+        try:
+            for status, lead_ids in eligible.items():
+                for start in range(0, len(lead_ids), self.RECYCLE_CHUNK_SIZE):
+                    results[status] += self.recycle_leads_bulk(
+                        self._get_recyclable_leads_queryset(status, cutoffs[status]).filter(
+                            id__in=lead_ids[start:start + self.RECYCLE_CHUNK_SIZE]
+                        ),
+                        current_time
+                    )
+        except Exception as e:
+            self.logger.error(f"Error recycling leads for campaign {self.campaign.name}: {e}")
+        
+        for status, recycled_count in results.items():
             if recycled_count > 0:
                 self.logger.info(f"Recycled {recycled_count} '{status}' leads for campaign {self.campaign.name}")
         
@@ -568,35 +1026,16 @@ class LeadRecyclingService:
         Returns:
             Dict with recycling statistics
         """
-        stats = {}
-        current_time = timezone.now()
-        
-        recycle_rules = {
-            'no_answer': self.campaign.recycle_no_answer_days,
-            'busy': self.campaign.recycle_busy_days,
-            'disconnected': self.campaign.recycle_disconnected_days,
-        }
-        
-        for status, days_threshold in recycle_rules.items():
-            cutoff_time = current_time - timedelta(days=days_threshold)
-            
-            count = Lead.objects.filter(
-                campaign=self.campaign,
+        # Count every recyclable status in a single query
+        counts = self._get_recycle_candidates_queryset().aggregate(**{
+            f'{status}_recyclable': Count('id', filter=Q(
                 status=status,
-                last_call_at__lte=cutoff_time,
-                recycle_count__lt=self.campaign.max_recycle_attempts
-            ).count()
-            
-            if self.campaign.exclude_dnc_from_recycling:
-                count = Lead.objects.filter(
-                    campaign=self.campaign,
-                    status=status,
-                    last_call_at__lte=cutoff_time,
-                    recycle_count__lt=self.campaign.max_recycle_attempts,
-                    is_dnc=False
-                ).count()
-            
-            stats[f'{status}_recyclable'] = count
+                last_call_at__lte=cutoff_time
+            ))
+            for status, cutoff_time in self.get_recycle_cutoffs().items()
+        })
+        
+        stats = {key: count or 0 for key, count in counts.items()}
         
         return stats
 
@@ -618,36 +1057,65 @@ class TimezoneSchedulingService:
         Returns:
             bool: True if lead can be called now, False otherwise
         """
-        import pytz
         from django.utils import timezone
         
         if campaign is None:
             campaign = lead.campaign
         
         current_utc = timezone.now()
+        lead_tz, day_mask = TimezoneSchedulingService._resolve_schedule(lead, campaign)
+        
+        return TimezoneSchedulingService._is_callable_at(
+            current_utc.astimezone(lead_tz), current_utc, lead, campaign, day_mask
+        )
+    
+    @staticmethod
+    def _resolve_schedule(lead, campaign) -> Tuple:
+        """
+        Resolve the lead's timezone and the campaign's allowed weekdays once.
         
-        # Convert current time to lead's timezone
+        Args:
+            lead: Lead object
+            campaign: Campaign object
+            
+        Returns:
+            Tuple of (timezone, campaign weekday bitmask)
+        """
+        # Fall back to the campaign timezone, then UTC
         try:
-            lead_tz = pytz.timezone(lead.timezone)
-            lead_local_time = current_utc.astimezone(lead_tz)
+            lead_tz = _pytz_zone(lead.timezone)
         except (pytz.UnknownTimeZoneError, AttributeError):
-            # Fallback to campaign timezone
             try:
-                campaign_tz = pytz.timezone(campaign.timezone_name)
-                lead_local_time = current_utc.astimezone(campaign_tz)
+                lead_tz = _pytz_zone(campaign.timezone_name)
             except pytz.UnknownTimeZoneError:
-                # Fallback to UTC
-                lead_local_time = current_utc
+                lead_tz = pytz.UTC
+        
+        return lead_tz, campaign.weekday_mask
+    
+    @staticmethod
+    def _is_callable_at(local_datetime, current_utc, lead, campaign, day_mask) -> bool:
+        """
+        Check a lead against every calling rule at a given moment.
         
-        # Check if current time is within campaign business hours
+        Args:
+            local_datetime: The moment in the lead's local timezone
+            current_utc: The same moment in UTC
+            lead: Lead object
+            campaign: Campaign object
+            day_mask: Campaign weekday bitmask (Campaign.weekday_mask)
+            
+        Returns:
+            bool: True if the lead may be called at that moment
+        """
+        # Check if time is within campaign business hours
         if not TimezoneSchedulingService._is_time_in_campaign_window(
-            lead_local_time, campaign
+            local_datetime, campaign, day_mask
         ):
             return False
         
         # Check if lead has specific call time preferences
         if lead.best_call_time_start and lead.best_call_time_end:
-            current_time = lead_local_time.time()
+            current_time = local_datetime.time()
             
             if lead.best_call_time_start <= lead.best_call_time_end:
                 # Same day window (e.g., 9:00 AM - 5:00 PM)
@@ -666,42 +1134,27 @@ class TimezoneSchedulingService:
         return True
     
     @staticmethod
-    def _is_time_in_campaign_window(local_datetime, campaign) -> bool:
+    def _is_time_in_campaign_window(local_datetime, campaign, day_mask: Optional[int] = None) -> bool:
         """
         Check if a local datetime is within campaign business hours.
         
         Args:
             local_datetime: datetime in lead's local timezone
             campaign: Campaign object
+            day_mask: Precomputed weekday bitmask (computed if not provided)
             
         Returns:
             bool: True if time is within business hours
         """
-        # Check day of week
-        weekday = local_datetime.weekday()  # 0 = Monday, 6 = Sunday
-        
-        day_flags = [
-            campaign.monday,    # 0
-            campaign.tuesday,   # 1 
-            campaign.wednesday, # 2
-            campaign.thursday,  # 3
-            campaign.friday,    # 4
-            campaign.saturday,  # 5
-            campaign.sunday,    # 6
-        ]
+        if day_mask is None:
+            day_mask = campaign.weekday_mask
         
-        if not day_flags[weekday]:
+        # Off days are rejected without reading the campaign hours at all
+        if not day_mask >> local_datetime.weekday() & 1:
             return False
         
-        # Check time of day
-        current_time = local_datetime.time()
-        
-        if campaign.start_time <= campaign.end_time:
-            # Same day window
-            return campaign.start_time <= current_time <= campaign.end_time
-        else:
-            # Cross midnight window
-            return current_time >= campaign.start_time or current_time <= campaign.end_time
+        in_window = _compile_campaign_window(day_mask, campaign.start_seconds, campaign.end_seconds)
+        return in_window(local_datetime)
     
     @staticmethod
     def get_next_callable_time(lead, campaign=None):
@@ -715,67 +1168,178 @@ class TimezoneSchedulingService:
         Returns:
             datetime: Next callable time in UTC, or None if never callable
         """
-        import pytz
         from django.utils import timezone
         from datetime import datetime, timedelta
         
         if campaign is None:
             campaign = lead.campaign
         
+        current_utc = timezone.now()
+        lead_tz, day_mask = TimezoneSchedulingService._resolve_schedule(lead, campaign)
+        current_local = current_utc.astimezone(lead_tz)
+        
         # If lead is callable now, return current time
-        if TimezoneSchedulingService.is_lead_callable_now(lead, campaign):
-            return timezone.now()
+        if TimezoneSchedulingService._is_callable_at(
+            current_local, current_utc, lead, campaign, day_mask
+        ):
+            return current_utc
+        
+        if not day_mask:
+            return None  # Campaign never dials on any weekday
+        
+        today = current_local.date()
+        weekday = today.weekday()
+        
+        # Today's window start is still ahead of us
+        if day_mask >> weekday & 1:
+            start_local = lead_tz.localize(datetime.combine(today, campaign.start_time))
+            if start_local > current_utc:
+                return start_local.astimezone(pytz.UTC)
+        
+        # Rotate the mask so bit 0 is tomorrow, then take the lowest set bit
+        # as the number of days to the next allowed weekday (1-7)
+        shift = (weekday + 1) % 7
+        rotated = ((day_mask >> shift) | (day_mask << (7 - shift))) & 0x7F
+        days_ahead = (rotated & -rotated).bit_length()
+        
+        start_local = lead_tz.localize(
+            datetime.combine(today + timedelta(days=days_ahead), campaign.start_time)
+        )
+        return start_local.astimezone(pytz.UTC)
+    
+    @staticmethod
+    def get_local_windows(campaign, tz_names, current_utc) -> Dict[str, Tuple]:
+        """
+        Resolve the local time and business-hours check for each lead timezone.
+        
+        Unknown or missing timezone names fall back to the campaign timezone,
+        matching is_lead_callable_now.
+        
+        Args:
+            campaign: Campaign object whose business hours apply
+            tz_names: Iterable of lead timezone names
+            current_utc: Current time as an aware datetime
+            
+        Returns:
+            Dict mapping timezone name to (local time of day, within business hours)
+        """
+        # Business-hours check compiled once per campaign schedule
+        in_campaign_window = _compile_campaign_window(
+            campaign.weekday_mask, campaign.start_seconds, campaign.end_seconds
+        )
         
         try:
-            lead_tz = pytz.timezone(lead.timezone)
-        except (pytz.UnknownTimeZoneError, AttributeError):
+            fallback_local = current_utc.astimezone(_pytz_zone(campaign.timezone_name))
+        except pytz.UnknownTimeZoneError:
+            fallback_local = current_utc
+        
+        local_windows = {}
+        
+        for tz_name in tz_names:
             try:
-                lead_tz = pytz.timezone(campaign.timezone_name)
-            except pytz.UnknownTimeZoneError:
-                lead_tz = pytz.UTC
+                lead_local_time = current_utc.astimezone(_pytz_zone(tz_name))
+            except (pytz.UnknownTimeZoneError, AttributeError):
+                lead_local_time = fallback_local
+            
+            local_windows[tz_name] = (lead_local_time.time(), in_campaign_window(lead_local_time))
         
-        current_utc = timezone.now()
-        current_local = current_utc.astimezone(lead_tz)
+        return local_windows
+    
+    @staticmethod
+    def callable_leads_filter(campaign, tz_names, current_utc: Optional[datetime] = None) -> Q:
+        """
+        Build a Q object selecting leads that are callable right now.
         
-        # Start checking from tomorrow if we're past business hours today
-        check_date = current_local.date()
-        max_days_ahead = 14  # Don't look more than 2 weeks ahead
+        The business-hours window is resolved once per distinct lead timezone
+        and each lead's call-time preferences and do_not_call_after cutoff are
+        compared in SQL, so the database returns only callable leads. This
+        mirrors filter_callable_leads and works on every database backend.
         
-        for days_ahead in range(max_days_ahead):
-            check_datetime = lead_tz.localize(
-                datetime.combine(check_date + timedelta(days=days_ahead), 
-                               campaign.start_time)
-            )
+        Args:
+            campaign: Campaign object the leads belong to
+            tz_names: Iterable of the distinct lead timezone names to consider
+            current_utc: Reference time in UTC (defaults to now)
             
-            # Convert to UTC for comparison
-            check_utc = check_datetime.astimezone(pytz.UTC).replace(tzinfo=None)
+        Returns:
+            Q: Filter matching callable leads (matches nothing if none are)
+        """
+        if current_utc is None:
+            current_utc = timezone.now()
+        
+        local_windows = TimezoneSchedulingService.get_local_windows(
+            campaign, tz_names, current_utc
+        )
+        
+        callable_q = Q(pk__in=[])
+        for tz_name, (local_time, in_window) in local_windows.items():
+            if not in_window:
+                continue
             
-            if check_utc > current_utc.replace(tzinfo=None):
-                # Create a temporary lead with this future time for checking
-                if TimezoneSchedulingService._is_time_in_campaign_window(
-                    check_datetime, campaign
-                ):
-                    return timezone.make_aware(check_utc)
+            # Leads without a complete preference, or whose preferred window
+            # (possibly wrapping past midnight) contains the local time
+            preference_q = (
+                Q(best_call_time_start__isnull=True) |
+                Q(best_call_time_end__isnull=True) |
+                (Q(best_call_time_start__lte=F('best_call_time_end')) &
+                 Q(best_call_time_start__lte=local_time,
+                   best_call_time_end__gte=local_time)) |
+                (Q(best_call_time_start__gt=F('best_call_time_end')) &
+                 (Q(best_call_time_start__lte=local_time) |
+                  Q(best_call_time_end__gte=local_time)))
+            )
+            callable_q |= Q(timezone=tz_name) & preference_q
         
-        return None  # No callable time found within the next 2 weeks
+        return callable_q & (
+            Q(do_not_call_after__isnull=True) |
+            Q(do_not_call_after__gte=current_utc)
+        )
     
     @staticmethod
-    def filter_callable_leads(leads, campaign=None):
+    def filter_callable_leads(leads, campaign):
         """
         Filter a list of leads to only include those callable right now.
         
+        Campaign settings are read once and the local time and business-hours
+        check are computed once per distinct lead timezone, so the cost per
+        lead is only its own call-time preferences.
+        
         Args:
             leads: List or QuerySet of Lead objects
-            campaign: Campaign object (uses lead.campaign if not provided)
+            campaign: Campaign object the leads belong to
             
         Returns:
             List[Lead]: Filtered list of callable leads
         """
+        from django.utils import timezone
+        
+        current_utc = timezone.now()
+        leads = list(leads)
+        
+        # Lead timezone name -> (local time of day, within campaign business hours)
+        local_windows = TimezoneSchedulingService.get_local_windows(
+            campaign, {lead.timezone for lead in leads}, current_utc
+        )
         callable_leads = []
         
         for lead in leads:
-            if TimezoneSchedulingService.is_lead_callable_now(lead, campaign):
-                callable_leads.append(lead)
+            local_time, in_window = local_windows[lead.timezone]
+            if not in_window:
+                continue
+            
+            # Check if lead has specific call time preferences
+            if lead.best_call_time_start and lead.best_call_time_end:
+                if lead.best_call_time_start <= lead.best_call_time_end:
+                    if not (lead.best_call_time_start <= local_time <= lead.best_call_time_end):
+                        continue
+                elif not (local_time >= lead.best_call_time_start or
+                          local_time <= lead.best_call_time_end):
+                    continue
+            
+            # Check do_not_call_after restriction
+            if lead.do_not_call_after and current_utc > lead.do_not_call_after:
+                continue
+            
+            callable_leads.append(lead)
         
         return callable_leads
     
@@ -0,0 +1,25 @@
+"""
+Signal handlers for the campaigns app.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Campaign, CampaignStatistics
+from .cache import invalidate_summary_cache
+from .services import PredictiveDialingManager
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def invalidate_campaign_cache(sender, instance, **kwargs):
+    """Drop the cached campaign so dialing tasks see campaign changes."""
+    cache.delete(PredictiveDialingManager.campaign_cache_key(instance.pk))
+
+
+@receiver(post_save, sender=CampaignStatistics)
+@receiver(post_delete, sender=CampaignStatistics)
+def invalidate_statistics_summary_cache(sender, instance, **kwargs):
+    """Drop cached statistics summaries so dashboards see individually saved statistics."""
+    invalidate_summary_cache()
@@ -6,18 +6,51 @@ and managing the predictive dialing engine.
 """
 
 import logging
+from decimal import Decimal
 from typing import Dict, List
-from celery import shared_task
+from celery import chord, group, shared_task
+from django.core.cache import cache
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q
 
-from .models import Campaign, CampaignStatistics
+from . import counters
+from .cache import invalidate_summary_cache
+from .models import Campaign, CampaignAgentAssignment, CampaignStatistics
 from .services import PredictiveDialingService, PredictiveDialingManager, LeadRecyclingService
 from calls.models import CallTask
 from leads.models import Lead
 
 logger = logging.getLogger(__name__)
 
+# Rows deleted per transaction by cleanup_completed_calls
+CLEANUP_CHUNK_SIZE = 5000
+
+# Call tasks initiated per dial_batch task
+DIAL_BATCH_SIZE = 25
+
+# Statistics fields recomputed by the campaign statistics tasks
+STATISTICS_FIELDS = (
+    'agents_logged_in', 'agents_available', 'agents_on_call', 'active_calls',
+    *CampaignStatistics.DAILY_STAT_DEFAULTS, 'last_reset_date',
+)
+
+# Counts used for campaigns without any agent assignments or call tasks
+EMPTY_AGENT_COUNTS = {'logged_in': 0, 'available': 0, 'on_call': 0}
+EMPTY_CALL_COUNTS = {'active': 0, 'attempted': 0, 'completed': 0, 'answered': 0, 'dropped': 0}
+
+# Lock held while a predictive dialing tick runs, so overlapping ticks are
+# skipped; finalize_dialing_tick releases it, and the timeout releases it if
+# a campaign task fails and the chord callback never runs
+DIALING_TICK_LOCK_KEY = 'lock:predictive_dialing'
+DIALING_TICK_LOCK_TIMEOUT = 60
+
+
+def _release_dialing_tick_lock(lock_token: str):
+    """Release the predictive dialing lock if it is still held by this tick."""
+    if cache.get(DIALING_TICK_LOCK_KEY) == lock_token:
+        cache.delete(DIALING_TICK_LOCK_KEY)
+
 
 @shared_task(bind=True, max_retries=3)
 def process_predictive_dialing(self):
@@ -26,53 +59,132 @@ def process_predictive_dialing(self):
     
     This task runs periodically (typically every 30-60 seconds) to:
     1. Check all active campaigns
-    2. Calculate calls needed based on agent availability
-    3. Queue calls for dialing
+    2. Dispatch a process_single_campaign task for each of them, which
+       calculates calls needed based on agent availability and queues them
+    
+    The per-campaign tasks are published as one chord whose
+    finalize_dialing_tick callback logs the total calls scheduled this tick
+    and releases the tick lock, so the next tick starts only once every
+    campaign of this one has been processed.
     
     Returns:
-        dict: Summary of calls initiated per campaign
+        dict: Number of campaigns dispatched and system capacity
     """
+    # SET NX on the shared cache: only one tick may run at a time
+    lock_token = self.request.id or 'local'
+    if not cache.add(DIALING_TICK_LOCK_KEY, lock_token, DIALING_TICK_LOCK_TIMEOUT):
+        logger.info("Skipping predictive dialing tick - previous tick still running")
+        return {'success': True, 'skipped': True}
+    
+    dispatched = False
     try:
         logger.info("Starting predictive dialing process")
         
         # Get system capacity overview
         capacity = PredictiveDialingManager.get_system_capacity()
-        logger.info(f"System capacity: {capacity}")
-        
-        # Process all campaigns
-        results = PredictiveDialingManager.process_all_campaigns()
+        logger.info("System capacity: %s", capacity)
         
-        # Schedule actual call tasks
-        total_calls_scheduled = 0
-        for campaign_name, calls_to_make in results.items():
-            if calls_to_make > 0:
-                # Schedule call initiation for this campaign
-                schedule_campaign_calls.delay(campaign_name, calls_to_make)
-                total_calls_scheduled += calls_to_make
+        # Count agents and calls for every campaign in one pass, then fan out
+        # one task per campaign so campaigns are processed in parallel
+        campaigns = list(PredictiveDialingManager.get_active_campaigns())
+        prefetched_counts = PredictiveDialingManager.get_campaign_counts(campaigns)
+        if campaigns:
+            chord(
+                process_single_campaign.s(campaign.id, prefetched_counts[campaign.id])
+                for campaign in campaigns
+            )(finalize_dialing_tick.s(lock_token))
+            dispatched = True
         
-        logger.info(f"Predictive dialing completed. Scheduled {total_calls_scheduled} calls across {len(results)} campaigns")
+        logger.info("Predictive dialing dispatched for %d campaigns", len(campaigns))
         
         return {
             'success': True,
-            'total_calls_scheduled': total_calls_scheduled,
-            'campaigns_processed': len(results),
-            'campaign_results': results,
+            'campaigns_dispatched': len(campaigns),
             'system_capacity': capacity
         }
         
     except Exception as exc:
-        logger.error(f"Error in predictive dialing process: {exc}")
+        logger.error("Error in predictive dialing process: %s", exc)
         # Retry with exponential backoff
         raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
+        
+    finally:
+        # Once the chord is published, finalize_dialing_tick releases the lock
+        if not dispatched:
+            _release_dialing_tick_lock(lock_token)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def process_single_campaign(self, campaign_id: int, prefetched_counts: Dict[str, int]):
+    """
+    Calculate and schedule calls for a single active campaign.
+    
+    Args:
+        campaign_id: ID of the campaign to process
+        prefetched_counts: Counts from get_campaign_counts for this campaign
+        
+    Returns:
+        dict: Calls scheduled for the campaign
+    """
+    try:
+        campaign = PredictiveDialingManager.get_active_campaigns().get(id=campaign_id)
+        
+        calls_to_make = PredictiveDialingManager.process_campaign(campaign, prefetched_counts)
+        
+        if calls_to_make > 0:
+            schedule_campaign_calls.delay(campaign.id, calls_to_make)
+        
+        return {
+            'success': True,
+            'campaign': campaign.name,
+            'calls_scheduled': calls_to_make
+        }
+        
+    except Campaign.DoesNotExist:
+        logger.warning("Campaign %s is no longer active for dialing", campaign_id)
+        return {'success': False, 'error': 'campaign_not_active'}
+        
+    except Exception as exc:
+        logger.error("Error processing campaign %s: %s", campaign_id, exc)
+        raise self.retry(exc=exc)
+
+
+@shared_task(bind=True)
+def finalize_dialing_tick(self, results: List[dict], lock_token: str):
+    """
+    Combine the per-campaign results of a predictive dialing tick and release its lock.
+    
+    Args:
+        results: Return values of the process_single_campaign tasks
+        lock_token: Token the tick acquired the lock with
+        
+    Returns:
+        dict: Totals across all campaigns
+    """
+    total_calls_scheduled = sum(result.get('calls_scheduled', 0) for result in results)
+    campaigns_processed = sum(1 for result in results if result.get('success'))
+    
+    logger.info(
+        "Predictive dialing completed. Scheduled %d calls across %d campaigns",
+        total_calls_scheduled, campaigns_processed
+    )
+    
+    _release_dialing_tick_lock(lock_token)
+    
+    return {
+        'success': True,
+        'total_calls_scheduled': total_calls_scheduled,
+        'campaigns_processed': campaigns_processed
+    }
 
 
 @shared_task(bind=True, max_retries=3)
-def schedule_campaign_calls(self, campaign_name: str, calls_to_make: int):
+def schedule_campaign_calls(self, campaign_id: int, calls_to_make: int):
     """
     Schedule call tasks for a specific campaign.
     
     Args:
-        campaign_name: Name of the campaign
+        campaign_id: ID of the campaign
         calls_to_make: Number of calls to schedule
         
     Returns:
@@ -80,44 +192,57 @@ def schedule_campaign_calls(self, campaign_name: str, calls_to_make: int):
     """
     try:
         # Get campaign
-        campaign = Campaign.objects.get(name=campaign_name)
+        now = timezone.now()
+        campaign = PredictiveDialingManager.get_campaign(campaign_id)
         dialer = PredictiveDialingService(campaign)
         
-        # Get dialable leads
-        leads = dialer.get_dialable_leads(limit=calls_to_make)
-        
-        if not leads:
-            logger.warning(f"No dialable leads found for campaign {campaign_name}")
-            return {'success': True, 'calls_created': 0, 'reason': 'no_leads'}
-        
-        # Create call tasks
-        call_tasks_created = []
-        
         with transaction.atomic():
-            for lead in leads[:calls_to_make]:
-                # Create call task
-                call_task = CallTask.objects.create(
+            # Lock the dialable leads, skipping rows another worker holds
+            leads = dialer.get_dialable_leads(limit=calls_to_make, lock=True, current_time=now)
+            
+            if not leads:
+                logger.warning("No dialable leads found for campaign %s", campaign.name)
+                return {'success': True, 'calls_created': 0, 'reason': 'no_leads'}
+            
+            # Create call tasks in one INSERT; task_id defaults to a client-side
+            # UUID so the IDs are known without reading the rows back
+            call_tasks = [
+                CallTask(
                     lead=lead,
                     campaign=campaign,
-                    phone_number=lead.phone_number,
+                    phone_number=lead.phone,
                     caller_id=campaign.caller_id,
                     call_type='outbound',
                     state='pending',
                     priority=lead.priority or 5
                 )
-                call_tasks_created.append(call_task.task_id)
-                
-                # Update lead status
-                lead.status = 'dialing'
-                lead.attempts += 1
-                lead.last_call_attempt = timezone.now()
-                lead.save(update_fields=['status', 'attempts', 'last_call_attempt'])
+                for lead in leads
+            ]
+            CallTask.objects.bulk_create(call_tasks)
+            
+            # Update lead status in one UPDATE
+            Lead.objects.filter(pk__in=[lead.pk for lead in leads]).update(
+                status='dialing',
+                attempts=F('attempts') + 1,
+                last_call_at=now,
+                updated_at=now
+            )
+        
+        call_tasks_created = [call_task.task_id for call_task in call_tasks]
         
-        # Queue call tasks for dialing
-        for task_id in call_tasks_created:
-            initiate_call.delay(str(task_id))
+        # Count the attempts now; the statistics refresh reconciles them with CallTask
+        dialer.update_statistics(call_attempted=len(call_tasks))
         
-        logger.info(f"Created {len(call_tasks_created)} call tasks for campaign {campaign_name}")
+        # Queue call tasks for dialing in batches, published together. Each
+        # dial_batch takes its whole list; Celery's .chunks() would still run
+        # the task once per call inside each chunk
+        call_task_ids = [str(task_id) for task_id in call_tasks_created]
+        group(
+            dial_batch.s(call_task_ids[i:i + DIAL_BATCH_SIZE])
+            for i in range(0, len(call_task_ids), DIAL_BATCH_SIZE)
+        ).apply_async()
+        
+        logger.info("Created %d call tasks for campaign %s", len(call_tasks_created), campaign.name)
         
         return {
             'success': True,
@@ -126,64 +251,68 @@ def schedule_campaign_calls(self, campaign_name: str, calls_to_make: int):
         }
         
     except Campaign.DoesNotExist:
-        logger.error(f"Campaign {campaign_name} not found")
+        logger.error("Campaign %s not found", campaign_id)
         return {'success': False, 'error': 'campaign_not_found'}
         
     except Exception as exc:
-        logger.error(f"Error scheduling calls for campaign {campaign_name}: {exc}")
+        logger.error("Error scheduling calls for campaign %s: %s", campaign_id, exc)
         raise self.retry(exc=exc, countdown=30 * (2 ** self.request.retries))
 
 
 @shared_task(bind=True, max_retries=5)
-def initiate_call(self, call_task_id: str):
+def dial_batch(self, call_task_ids: List[str]):
     """
-    Initiate a specific call task.
+    Initiate a batch of call tasks.
     
-    This task handles the actual call initiation process:
-    1. Update call task state to 'queued'
-    2. Interface with telephony system (Asterisk/PBX)
-    3. Monitor call progress
+    The call tasks are loaded with one query and moved to 'queued' with one
+    UPDATE, so a dialing tick costs a task per batch rather than per call.
+    Once queued, each call is handed to the telephony system and its
+    progress is monitored.
     
     Args:
-        call_task_id: UUID of the call task to initiate
+        call_task_ids: UUIDs of the call tasks to initiate
         
     Returns:
         dict: Result of call initiation
     """
     try:
-        # Get call task
-        call_task = CallTask.objects.get(task_id=call_task_id)
+        call_tasks = list(
+            CallTask.objects.filter(task_id__in=call_task_ids, state='pending')
+            .only('id', 'task_id', 'phone_number')
+        )
         
-        # Update state to queued
-        call_task.update_state('queued')
+        if len(call_tasks) < len(call_task_ids):
+            logger.warning(
+                "%d of %d call tasks not found or no longer pending",
+                len(call_task_ids) - len(call_tasks), len(call_task_ids)
+            )
         
-        # TODO: Interface with telephony system
-        # This is where integration with Asterisk/PBX would happen
-        # For now, we'll simulate the process
+        if not call_tasks:
+            return {'success': True, 'calls_queued': 0}
         
-        logger.info(f"Call task {call_task_id} queued for dialing to {call_task.phone_number}")
+        # Update state to queued in one UPDATE
+        CallTask.objects.filter(pk__in=[call_task.pk for call_task in call_tasks]).update(
+            state='queued',
+            queued_at=timezone.now()
+        )
         
-        # In a real implementation, this would:
-        # 1. Send call origination request to Asterisk via ARI
-        # 2. Monitor call progress via AMI events
-        # 3. Update call task state based on call progress
+        # TODO: Interface with telephony system
+        # Origination requests for the whole batch would be sent to Asterisk
+        # via ARI here, concurrently, before scheduling monitoring
         
-        # For now, schedule call monitoring
-        monitor_call_progress.delay(call_task_id)
+        queued_ids = [str(call_task.task_id) for call_task in call_tasks]
+        group(monitor_call_progress.s(task_id) for task_id in queued_ids).apply_async()
+        
+        logger.info("Queued %d call tasks for dialing", len(queued_ids))
         
         return {
             'success': True,
-            'call_task_id': call_task_id,
-            'phone_number': call_task.phone_number,
-            'state': call_task.state
+            'calls_queued': len(queued_ids),
+            'call_task_ids': queued_ids
         }
         
-    except CallTask.DoesNotExist:
-        logger.error(f"Call task {call_task_id} not found")
-        return {'success': False, 'error': 'call_task_not_found'}
-        
     except Exception as exc:
-        logger.error(f"Error initiating call {call_task_id}: {exc}")
+        logger.error("Error initiating call batch: %s", exc)
         raise self.retry(exc=exc, countdown=15 * (2 ** self.request.retries))
 
 
@@ -205,7 +334,7 @@ def monitor_call_progress(self, call_task_id: str):
         # This would listen to AMI/ARI events from Asterisk
         # and update call task state accordingly
         
-        logger.info(f"Monitoring call progress for task {call_task_id}")
+        logger.info("Monitoring call progress for task %s", call_task_id)
         
         return {
             'success': True,
@@ -214,11 +343,11 @@ def monitor_call_progress(self, call_task_id: str):
         }
         
     except CallTask.DoesNotExist:
-        logger.error(f"Call task {call_task_id} not found for monitoring")
+        logger.error("Call task %s not found for monitoring", call_task_id)
         return {'success': False, 'error': 'call_task_not_found'}
 
 
-@shared_task(bind=True)
+@shared_task(bind=True, acks_late=True)
 def update_campaign_statistics(self, campaign_id: int):
     """
     Update real-time campaign statistics.
@@ -237,53 +366,28 @@ def update_campaign_statistics(self, campaign_id: int):
             campaign=campaign
         )
         
-        # Update real-time metrics
-        statistics.active_calls = CallTask.objects.filter(
-            campaign=campaign,
-            state__in=['dialing', 'ringing', 'connected']
-        ).count()
-        
-        statistics.agents_logged_in = campaign.assigned_agents.filter(
-            is_active=True
-        ).count()
-        
-        statistics.agents_available = campaign.get_available_agents().count()
-        
-        statistics.agents_on_call = campaign.assigned_agents.filter(
-            current_status__status__in=['on_call', 'connected']
-        ).count()
-        
-        # Update daily statistics
         today = timezone.now().date()
-        if statistics.last_reset_date != today:
-            statistics.reset_daily_stats()
         
-        # Calculate today's metrics from call tasks
-        today_calls = CallTask.objects.filter(
-            campaign=campaign,
-            created_at__date=today
-        )
+        # Real-time agent metrics and call task counts, one aggregate each
+        agent_counts = CampaignAgentAssignment.objects.filter(
+            campaign=campaign
+        ).aggregate(**_agent_count_aggregates())
         
-        statistics.calls_attempted_today = today_calls.count()
-        statistics.calls_completed_today = today_calls.filter(
-            state='completed'
-        ).count()
-        statistics.calls_answered_today = today_calls.filter(
-            answered_at__isnull=False
-        ).count()
-        statistics.calls_dropped_today = today_calls.filter(
-            state='abandoned'
-        ).count()
-        
-        # Update rates
-        if statistics.calls_attempted_today > 0:
-            statistics.contact_rate_today = (
-                statistics.calls_answered_today / statistics.calls_attempted_today * 100
-            )
+        # CallTask is the source of truth for the daily call counters; drop the
+        # buffered deltas it is about to count so the flush does not add them again
+        counters.discard([campaign.id])
         
-        statistics.save()
+        active_calls, today_calls = _call_count_filters(today)
+        call_counts = CallTask.objects.filter(
+            active_calls | today_calls,
+            campaign=campaign
+        ).aggregate(**_call_count_aggregates(today))
         
-        logger.debug(f"Updated statistics for campaign {campaign.name}")
+        # Write only the fields whose values changed, or nothing at all
+        changed = _apply_statistics(statistics, agent_counts, call_counts, today)
+        if changed:
+            statistics.save(update_fields=[*changed, 'last_updated'])
+            logger.debug("Updated statistics for campaign %s", campaign.name)
         
         return {
             'success': True,
@@ -297,15 +401,271 @@ def update_campaign_statistics(self, campaign_id: int):
         }
         
     except Campaign.DoesNotExist:
-        logger.error(f"Campaign {campaign_id} not found")
+        logger.error("Campaign %s not found", campaign_id)
         return {'success': False, 'error': 'campaign_not_found'}
         
     except Exception as exc:
-        logger.error(f"Error updating statistics for campaign {campaign_id}: {exc}")
+        logger.error("Error updating statistics for campaign %s: %s", campaign_id, exc)
         return {'success': False, 'error': str(exc)}
 
 
+@shared_task(bind=True, acks_late=True)
+def update_all_campaign_statistics(self):
+    """
+    Update real-time statistics for every active campaign at once.
+    
+    Cross-campaign counterpart of update_campaign_statistics: agent and call
+    task counts are grouped by campaign in one query each, and all changed
+    statistics rows are written back with a single bulk update.
+    
+    Returns:
+        dict: Number of campaigns whose statistics changed
+    """
+    try:
+        now = timezone.now()
+        today = now.date()
+        
+        campaign_ids = list(
+            Campaign.objects.filter(status='active').values_list('id', flat=True)
+        )
+        if not campaign_ids:
+            return {'success': True, 'campaigns_updated': 0}
+        
+        agent_counts = {
+            row['campaign_id']: row
+            for row in CampaignAgentAssignment.objects.filter(
+                campaign_id__in=campaign_ids
+            ).values('campaign_id').annotate(**_agent_count_aggregates())
+        }
+        
+        # CallTask is the source of truth for the daily call counters; drop the
+        # buffered deltas it is about to count so the flush does not add them again
+        counters.discard(campaign_ids)
+        
+        active_calls, today_calls = _call_count_filters(today)
+        call_counts = {
+            row['campaign_id']: row
+            for row in CallTask.objects.filter(
+                active_calls | today_calls,
+                campaign_id__in=campaign_ids
+            ).values('campaign_id').annotate(**_call_count_aggregates(today))
+        }
+        
+        with transaction.atomic():
+            statistics_rows = CampaignStatistics.objects.in_bulk(
+                campaign_ids, field_name='campaign_id'
+            )
+            missing = [
+                CampaignStatistics(campaign_id=campaign_id)
+                for campaign_id in campaign_ids if campaign_id not in statistics_rows
+            ]
+            for statistics in CampaignStatistics.objects.bulk_create(missing):
+                statistics_rows[statistics.campaign_id] = statistics
+            
+            updated = []
+            changed_fields = set()
+            for campaign_id, statistics in statistics_rows.items():
+                changed = _apply_statistics(
+                    statistics,
+                    agent_counts.get(campaign_id, EMPTY_AGENT_COUNTS),
+                    call_counts.get(campaign_id, EMPTY_CALL_COUNTS),
+                    today
+                )
+                if changed:
+                    # bulk_update does not apply auto_now
+                    statistics.last_updated = now
+                    updated.append(statistics)
+                    changed_fields.update(changed)
+            
+            if updated:
+                CampaignStatistics.objects.bulk_update(
+                    updated, fields=[*changed_fields, 'last_updated'], batch_size=500
+                )
+        
+        # bulk_update sends no signals, so invalidate the cached summaries here
+        if updated:
+            invalidate_summary_cache()
+        
+        logger.debug("Updated statistics for %d campaigns", len(updated))
+        
+        return {'success': True, 'campaigns_updated': len(updated)}
+        
+    except Exception as exc:
+        logger.error("Error updating statistics for all campaigns: %s", exc)
+        return {'success': False, 'error': str(exc)}
+
+
+def _agent_count_aggregates() -> Dict:
+    """Aggregates over CampaignAgentAssignment counting agents by presence."""
+    return {
+        'logged_in': Count('agent', filter=Q(agent__is_active=True), distinct=True),
+        'available': Count('agent', filter=Q(
+            is_active=True, agent__current_status__status='available'
+        ), distinct=True),
+        'on_call': Count('agent', filter=Q(
+            agent__current_status__status__in=['on_call', 'connected']
+        ), distinct=True),
+    }
+
+
+def _call_count_filters(today):
+    """Filters selecting active call tasks and call tasks created today."""
+    return Q(state__in=['dialing', 'ringing', 'connected']), Q(created_at__date=today)
+
+
+def _call_count_aggregates(today) -> Dict:
+    """Aggregates over CallTask counting active calls and today's outcomes."""
+    active_calls, today_calls = _call_count_filters(today)
+    return {
+        'active': Count('id', filter=active_calls),
+        'attempted': Count('id', filter=today_calls),
+        'completed': Count('id', filter=today_calls & Q(state='completed')),
+        'answered': Count('id', filter=today_calls & Q(answered_at__isnull=False)),
+        'dropped': Count('id', filter=today_calls & Q(state='abandoned')),
+    }
+
+
+def _apply_statistics(statistics: CampaignStatistics, agent_counts: Dict,
+                      call_counts: Dict, today) -> List[str]:
+    """
+    Apply freshly computed counts to a statistics row in memory.
+    
+    Args:
+        statistics: CampaignStatistics row to update
+        agent_counts: Result of the agent count aggregates
+        call_counts: Result of the call task count aggregates
+        today: Current date, used to reset the daily counters
+        
+    Returns:
+        list: Names of the fields whose values changed
+    """
+    old_values = {field: getattr(statistics, field) for field in STATISTICS_FIELDS}
+    
+    statistics.agents_logged_in = agent_counts['logged_in']
+    statistics.agents_available = agent_counts['available']
+    statistics.agents_on_call = agent_counts['on_call']
+    
+    # Reset the daily counters in memory; the caller writes them
+    if statistics.last_reset_date != today:
+        for field, value in CampaignStatistics.DAILY_STAT_DEFAULTS.items():
+            setattr(statistics, field, value)
+        statistics.last_reset_date = today
+    
+    statistics.active_calls = call_counts['active']
+    statistics.calls_attempted_today = call_counts['attempted']
+    statistics.calls_completed_today = call_counts['completed']
+    statistics.calls_answered_today = call_counts['answered']
+    statistics.calls_dropped_today = call_counts['dropped']
+    
+    # Update rates
+    if statistics.calls_attempted_today > 0:
+        statistics.contact_rate_today = (
+            statistics.calls_answered_today / statistics.calls_attempted_today * 100
+        )
+    
+    return [
+        field for field in STATISTICS_FIELDS
+        if _field_value(statistics, field) != _field_value(old_values, field)
+    ]
+
+
+def _field_value(source, field: str):
+    """
+    Get a CampaignStatistics field value converted to its stored type.
+    
+    Lets computed floats compare equal to the Decimal values read back from
+    the database.
+    
+    Args:
+        source: CampaignStatistics instance, or dict of values keyed by field name
+        field: Name of the field
+    """
+    model_field = CampaignStatistics._meta.get_field(field)
+    value = model_field.to_python(
+        source[field] if isinstance(source, dict) else getattr(source, field)
+    )
+    
+    if isinstance(model_field, DecimalField) and value is not None:
+        value = value.quantize(Decimal(1).scaleb(-model_field.decimal_places))
+    
+    return value
+
+
 @shared_task(bind=True)
+def flush_campaign_counters(self):
+    """
+    Apply call counters buffered in Redis to campaign statistics.
+    
+    This task runs every few seconds. Buffered deltas are drained atomically,
+    added to the statistics rows and written back with one bulk update, and the
+    contact and drop rates are recomputed from the new totals. Between the
+    statistics recomputes, which reset these totals from CallTask and discard
+    the deltas they counted, this keeps the daily call counters current.
+    
+    Returns:
+        dict: Number of campaigns flushed
+    """
+    snapshots = counters.drain_snapshots()
+    if not snapshots:
+        return {'success': True, 'campaigns_flushed': 0}
+    
+    try:
+        with transaction.atomic():
+            campaigns = Campaign.objects.only('id', 'current_drop_rate').in_bulk(list(snapshots))
+            
+            existing = set(
+                CampaignStatistics.objects.filter(
+                    campaign_id__in=campaigns
+                ).values_list('campaign_id', flat=True)
+            )
+            CampaignStatistics.objects.bulk_create([
+                CampaignStatistics(campaign_id=campaign_id)
+                for campaign_id in campaigns if campaign_id not in existing
+            ])
+            
+            statistics_rows = list(
+                CampaignStatistics.objects.select_for_update().filter(campaign_id__in=campaigns)
+            )
+            
+            for statistics in statistics_rows:
+                deltas = snapshots[statistics.campaign_id]
+                statistics.calls_attempted_today += deltas['attempted']
+                statistics.calls_answered_today += deltas['answered']
+                statistics.calls_dropped_today += deltas['dropped']
+                
+                if statistics.calls_attempted_today > 0:
+                    statistics.contact_rate_today = (
+                        statistics.calls_answered_today / statistics.calls_attempted_today * 100
+                    )
+                    campaigns[statistics.campaign_id].current_drop_rate = (
+                        statistics.calls_dropped_today / statistics.calls_attempted_today * 100
+                    )
+            
+            CampaignStatistics.objects.bulk_update(statistics_rows, [
+                'calls_attempted_today', 'calls_answered_today',
+                'calls_dropped_today', 'contact_rate_today'
+            ])
+            Campaign.objects.bulk_update(list(campaigns.values()), ['current_drop_rate'])
+        
+        # bulk_update sends no signals, so invalidate the cached summaries here
+        invalidate_summary_cache()
+        
+        logger.debug("Flushed buffered counters for %d campaigns", len(statistics_rows))
+        
+        return {
+            'success': True,
+            'campaigns_flushed': len(statistics_rows)
+        }
+        
+    except Exception as exc:
+        # Put the drained deltas back so they are retried on the next flush
+        for campaign_id, deltas in snapshots.items():
+            counters.increment(campaign_id, **deltas)
+        logger.error("Error flushing campaign counters: %s", exc)
+        return {'success': False, 'error': str(exc)}
+
+
+@shared_task(bind=True, acks_late=True)
 def cleanup_completed_calls(self, hours_old: int = 24):
     """
     Clean up completed call tasks older than specified hours.
@@ -327,13 +687,27 @@ def cleanup_completed_calls(self, hours_old: int = 24):
             completed_at__lt=cutoff_time
         )
         
-        count = old_tasks.count()
+        # Delete in short per-chunk transactions so row locks are released
+        # between batches. Deleted rows drop out of the filter, so re-reading
+        # the first chunk acts as a cursor without any OFFSET.
+        # In a real implementation, you might want to archive these
+        # instead of deleting them outright
+        count = 0
+        while True:
+            ids = list(
+                old_tasks.order_by('pk').values_list('pk', flat=True)[:CLEANUP_CHUNK_SIZE]
+            )
+            if not ids:
+                break
+            
+            with transaction.atomic():
+                # CDRs, recordings and dispositions cascade in Django rather
+                # than the database, so the regular collector is still needed
+                CallTask.objects.filter(pk__in=ids).delete()
+            count += len(ids)
         
         if count > 0:
-            # In a real implementation, you might want to archive these
-            # instead of deleting them outright
-            old_tasks.delete()
-            logger.info(f"Cleaned up {count} completed call tasks older than {hours_old} hours")
+            logger.info("Cleaned up %d completed call tasks older than %d hours", count, hours_old)
         
         return {
             'success': True,
@@ -342,7 +716,7 @@ def cleanup_completed_calls(self, hours_old: int = 24):
         }
         
     except Exception as exc:
-        logger.error(f"Error cleaning up completed calls: {exc}")
+        logger.error("Error cleaning up completed calls: %s", exc)
         return {'success': False, 'error': str(exc)}
 
 
@@ -355,13 +729,19 @@ def reset_daily_statistics(self):
     daily statistics counters.
     """
     try:
-        reset_count = 0
+        # One UPDATE for every campaign instead of a save() per row;
+        # last_updated is auto_now, which update() does not apply
+        now = timezone.now()
+        reset_count = CampaignStatistics.objects.update(
+            **CampaignStatistics.DAILY_STAT_DEFAULTS,
+            last_reset_date=now.date(),
+            last_updated=now
+        )
         
-        for statistics in CampaignStatistics.objects.all():
-            statistics.reset_daily_stats()
-            reset_count += 1
+        # update() sends no signals, so invalidate the cached summaries here
+        invalidate_summary_cache()
         
-        logger.info(f"Reset daily statistics for {reset_count} campaigns")
+        logger.info("Reset daily statistics for %d campaigns", reset_count)
         
         return {
             'success': True,
@@ -369,11 +749,11 @@ def reset_daily_statistics(self):
         }
         
     except Exception as exc:
-        logger.error(f"Error resetting daily statistics: {exc}")
+        logger.error("Error resetting daily statistics: %s", exc)
         return {'success': False, 'error': str(exc)}
 
 
-@shared_task(bind=True)
+@shared_task(bind=True, acks_late=True)
 def recycle_campaign_leads(self, campaign_id: int = None):
     """
     Recycle leads based on campaign rules.
@@ -381,43 +761,128 @@ def recycle_campaign_leads(self, campaign_id: int = None):
     This task processes leads that have been in certain statuses (no_answer, busy, 
     disconnected) for a specified period and resets them for another attempt.
     
+    A specific campaign is recycled inline. Without one, every eligible campaign
+    is recycled by its own recycle_single_campaign task, fanned out as a chord
+    whose summarize_recycling_results callback logs the overall totals.
+    
     Args:
         campaign_id: Specific campaign ID to process, or None to process all active campaigns
     """
     try:
-        # Get campaigns to process
         if campaign_id:
-            campaigns = Campaign.objects.filter(id=campaign_id, status='active')
-        else:
-            campaigns = Campaign.objects.filter(status='active', recycle_inactive_leads=True)
+            campaign = LeadRecyclingService.get_recycling_campaigns().filter(id=campaign_id).first()
+            recycled = _recycle_campaign(campaign) if campaign else None
+            
+            return {
+                'success': True,
+                'total_recycled': recycled or 0,
+                'campaigns_processed': int(recycled is not None)
+            }
         
-        total_recycled = 0
-        campaigns_processed = 0
+        # Evaluate the recycling rules here so campaigns outside their
+        # business hours do not cost a task and a campaign query each
+        now = timezone.now()
+        campaign_ids = [
+            campaign.id
+            for campaign in LeadRecyclingService.get_recycling_campaigns()
+            if LeadRecyclingService.campaign_can_recycle(campaign, now)
+        ]
         
-        for campaign in campaigns:
-            logger.info(f"Processing lead recycling for campaign: {campaign.name}")
-            
-            # Use the LeadRecyclingService for business logic
-            recycling_service = LeadRecyclingService(campaign)
-            
-            if recycling_service.can_recycle_now():
-                results = recycling_service.process_campaign_recycling(batch_size=100)
-                campaign_total = sum(results.values())
-                total_recycled += campaign_total
-                campaigns_processed += 1
-                
-                logger.info(f"Recycled {campaign_total} leads for campaign {campaign.name}")
-                logger.debug(f"Recycling breakdown for {campaign.name}: {results}")
-            else:
-                logger.info(f"Skipping campaign {campaign.name} - recycling not allowed at this time")
+        if not campaign_ids:
+            return {'success': True, 'campaigns_dispatched': 0}
         
-        logger.info(f"Lead recycling completed. Total recycled: {total_recycled}")
+        result = chord(
+            recycle_single_campaign.s(campaign_id) for campaign_id in campaign_ids
+        )(summarize_recycling_results.s())
+        
+        logger.info("Dispatched lead recycling for %d campaigns", len(campaign_ids))
         return {
             'success': True,
-            'total_recycled': total_recycled,
-            'campaigns_processed': campaigns_processed
+            'campaigns_dispatched': len(campaign_ids),
+            'summary_task_id': result.id
         }
         
     except Exception as exc:
-        logger.error(f"Error recycling leads: {exc}")
+        logger.error("Error recycling leads: %s", exc)
         return {'success': False, 'error': str(exc)}
+
+
+@shared_task(bind=True, acks_late=True)
+def recycle_single_campaign(self, campaign_id: int):
+    """
+    Recycle leads for one campaign as part of a recycle_campaign_leads fan-out.
+    
+    Args:
+        campaign_id: ID of the campaign to process
+        
+    Returns:
+        dict: Leads recycled and whether the campaign was processed
+    """
+    try:
+        campaign = LeadRecyclingService.get_recycling_campaigns().filter(id=campaign_id).first()
+        recycled = _recycle_campaign(campaign) if campaign else None
+        
+        return {
+            'success': True,
+            'campaign_id': campaign_id,
+            'recycled': recycled or 0,
+            'processed': recycled is not None
+        }
+        
+    except Exception as exc:
+        logger.error("Error recycling leads for campaign %s: %s", campaign_id, exc)
+        return {'success': False, 'campaign_id': campaign_id, 'error': str(exc)}
+
+
+@shared_task(bind=True)
+def summarize_recycling_results(self, results: List[dict]):
+    """
+    Combine the per-campaign results of a recycling fan-out.
+    
+    Args:
+        results: Return values of the recycle_single_campaign tasks
+        
+    Returns:
+        dict: Totals across all campaigns
+    """
+    total_recycled = sum(result.get('recycled', 0) for result in results)
+    campaigns_processed = sum(1 for result in results if result.get('processed'))
+    failed = [result['campaign_id'] for result in results if not result.get('success')]
+    
+    logger.info("Lead recycling completed. Total recycled: %d", total_recycled)
+    
+    return {
+        'success': not failed,
+        'total_recycled': total_recycled,
+        'campaigns_processed': campaigns_processed,
+        'failed_campaigns': failed
+    }
+
+
+def _recycle_campaign(campaign: Campaign):
+    """
+    Run lead recycling for a single campaign.
+    
+    Args:
+        campaign: Campaign to recycle leads for
+        
+    Returns:
+        int: Leads recycled, or None if recycling is not allowed right now
+    """
+    logger.info("Processing lead recycling for campaign: %s", campaign.name)
+    
+    # Use the LeadRecyclingService for business logic
+    now = timezone.now()
+    recycling_service = LeadRecyclingService(campaign)
+    
+    if not recycling_service.can_recycle_now(now):
+        logger.info("Skipping campaign %s - recycling not allowed at this time", campaign.name)
+        return None
+    
+    results = recycling_service.process_campaign_recycling(batch_size=100, current_time=now)
+    campaign_total = sum(results.values())
+    
+    logger.info("Recycled %d leads for campaign %s", campaign_total, campaign.name)
+    logger.debug("Recycling breakdown for %s: %s", campaign.name, results)
+    
+    return campaign_total
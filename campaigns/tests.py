@@ -1,46 +1,105 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from unittest.mock import patch
+from freezegun import freeze_time
 
-from campaigns.models import Campaign
-from campaigns.services import LeadRecyclingService, TimezoneSchedulingService, PredictiveDialingService
-from campaigns.tasks import recycle_campaign_leads
+from campaigns.models import Campaign, CampaignAgentAssignment, CampaignStatistics
+from campaigns.serializers import CampaignAgentAssignmentSerializer, CampaignSerializer
+from campaigns.services import (
+    LeadRecyclingService, TimezoneSchedulingService, PredictiveDialingService, _compile_campaign_window
+)
+from campaigns.tasks import (
+    recycle_campaign_leads, reset_daily_statistics, schedule_campaign_calls, summarize_recycling_results,
+    update_campaign_statistics
+)
+from campaigns.views import CampaignStatisticsViewSet, CampaignViewSet
+from calls.models import CallTask
 from leads.models import Lead
+from PyDialer.celery import app as celery_app
+from PyDialer.mixins import serializer_relations
 from agents.models import Department, UserRole
+from rest_framework.test import APIRequestFactory, force_authenticate
 import pytz
 
 User = get_user_model()
 
+EASTERN = pytz.timezone('America/New_York')
 
-class LeadRecyclingServiceTestCase(TestCase):
-    """Test cases for the LeadRecyclingService class."""
+
+# Field values every fixture lead starts from, before per-lead overrides
+LEAD_DEFAULTS = {'status': 'new', 'attempts': 0, 'recycle_count': 0}
+
+
+def make_lead(campaign, **fields):
+    """Build an unsaved lead for a campaign, ready to pass to bulk_create."""
+    return Lead(campaign=campaign, **{**LEAD_DEFAULTS, **fields})
+
+
+def reload(lead, *fields):
+    """Read the given fields of a lead straight from the database as a dict."""
+    return Lead.objects.filter(pk=lead.pk).values(*fields).get()
+
+
+# Celery runs tasks inline with no broker or result backend while these tests run
+TEST_CELERY_CONF = {
+    'task_always_eager': True,
+    'task_eager_propagates': True,
+    'broker_url': 'memory://',
+    'result_backend': None,
+}
+SAVED_CELERY_CONF = {}
+
+
+def setUpModule():
+    """Configure eager Celery for the tests in this module."""
+    SAVED_CELERY_CONF.update({key: celery_app.conf[key] for key in TEST_CELERY_CONF})
+    celery_app.conf.update(TEST_CELERY_CONF)
+
+
+def tearDownModule():
+    """Restore the Celery configuration saved by setUpModule."""
+    celery_app.conf.update(SAVED_CELERY_CONF)
+
+
+class CampaignUserMixin:
+    """Mixin creating the department, role and user campaigns are created by."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create test user
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the user shared by every test in the class."""
+        department = Department.objects.create(
             name="Test Department",
             description="Test department"
         )
         
-        self.user_role = UserRole.objects.create(
+        role = UserRole.objects.create(
             name="admin",
             display_name="Administrator",
             description="Admin role"
         )
         
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
-            department=self.department,
-            role=self.user_role
+            password=None,  # Unusable password: no test logs in, so skip the hasher
+            department=department,
+            role=role
         )
+
+
+class LeadRecyclingServiceTestCase(CampaignUserMixin, TestCase):
+    """Test cases for the LeadRecyclingService class."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create test campaign with recycling enabled
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name="Test Campaign",
             description="Test campaign for recycling",
             status='active',
@@ -55,81 +114,90 @@ class LeadRecyclingServiceTestCase(TestCase):
             max_recycle_attempts=2,
             exclude_dnc_from_recycling=True,
             recycle_only_business_hours=False,
-            created_by=self.user
+            created_by=cls.user
         )
         
         # Create test leads
-        self.lead_no_answer = Lead.objects.create(
-            phone='+1111111111',
-            first_name='John',
-            last_name='Doe',
-            campaign=self.campaign,
-            status='no_answer',
-            attempts=3,
-            last_call_at=timezone.now() - timedelta(days=8),
-            recycle_count=0
-        )
-        
-        self.lead_busy = Lead.objects.create(
-            phone='+2222222222',
-            first_name='Jane',
-            last_name='Smith',
-            campaign=self.campaign,
-            status='busy',
-            attempts=2,
-            last_call_at=timezone.now() - timedelta(days=2),
-            recycle_count=0
-        )
-        
-        self.lead_disconnected = Lead.objects.create(
-            phone='+3333333333',
-            first_name='Bob',
-            last_name='Johnson',
-            campaign=self.campaign,
-            status='disconnected',
-            attempts=1,
-            last_call_at=timezone.now() - timedelta(days=35),
-            recycle_count=1
-        )
-        
-        # Lead that has reached max recycle attempts
-        self.lead_max_recycles = Lead.objects.create(
-            phone='+4444444444',
-            first_name='Max',
-            last_name='Recycles',
-            campaign=self.campaign,
-            status='no_answer',
-            attempts=3,
-            last_call_at=timezone.now() - timedelta(days=8),
-            recycle_count=2  # At max limit
-        )
-        
-        # DNC lead
-        self.lead_dnc = Lead.objects.create(
-            phone='+5555555555',
-            first_name='DNC',
-            last_name='Lead',
-            campaign=self.campaign,
-            status='no_answer',
-            attempts=1,
-            last_call_at=timezone.now() - timedelta(days=8),
-            recycle_count=0,
-            is_dnc=True
-        )
-        
+        (
+            cls.lead_no_answer,
+            cls.lead_busy,
+            cls.lead_disconnected,
+            cls.lead_max_recycles,
+            cls.lead_dnc,
+        ) = Lead.objects.bulk_create([
+            make_lead(
+                cls.campaign,
+                phone='+1111111111',
+                first_name='John',
+                last_name='Doe',
+                status='no_answer',
+                attempts=3,
+                last_call_at=timezone.now() - timedelta(days=8)
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+2222222222',
+                first_name='Jane',
+                last_name='Smith',
+                status='busy',
+                attempts=2,
+                last_call_at=timezone.now() - timedelta(days=2)
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+3333333333',
+                first_name='Bob',
+                last_name='Johnson',
+                status='disconnected',
+                attempts=1,
+                last_call_at=timezone.now() - timedelta(days=35),
+                recycle_count=1
+            ),
+            # Lead that has reached max recycle attempts
+            make_lead(
+                cls.campaign,
+                phone='+4444444444',
+                first_name='Max',
+                last_name='Recycles',
+                status='no_answer',
+                attempts=3,
+                last_call_at=timezone.now() - timedelta(days=8),
+                recycle_count=2  # At max limit
+            ),
+            # DNC lead
+            make_lead(
+                cls.campaign,
+                phone='+5555555555',
+                first_name='DNC',
+                last_name='Lead',
+                status='no_answer',
+                attempts=1,
+                last_call_at=timezone.now() - timedelta(days=8),
+                is_dnc=True
+            ),
+        ])
+    
+    def setUp(self):
+        """Set up per-test state."""
         self.recycling_service = LeadRecyclingService(self.campaign)
     
     def test_get_recyclable_leads_no_answer(self):
         """Test getting recyclable leads with no_answer status."""
-        leads = self.recycling_service.get_recyclable_leads('no_answer', 7, 100)
+        with self.assertNumQueries(1):
+            leads = self.recycling_service.get_recyclable_leads('no_answer', 100)
         
         # Should get lead_no_answer but not lead_max_recycles or lead_dnc
         self.assertEqual(len(leads), 1)
         self.assertEqual(leads[0], self.lead_no_answer)
+        
+        # Only the recycling columns are loaded, and recycling needs no others
+        self.assertIn('first_name', leads[0].get_deferred_fields())
+        with self.assertNumQueries(1):
+            self.assertTrue(self.recycling_service.recycle_lead(leads[0]))
     
     def test_get_recyclable_leads_busy(self):
         """Test getting recyclable leads with busy status."""
-        leads = self.recycling_service.get_recyclable_leads('busy', 1, 100)
+        leads = self.recycling_service.get_recyclable_leads('busy', 100)
         
         # Should get lead_busy
         self.assertEqual(len(leads), 1)
@@ -137,7 +205,7 @@ class LeadRecyclingServiceTestCase(TestCase):
     
     def test_get_recyclable_leads_disconnected(self):
         """Test getting recyclable leads with disconnected status."""
-        leads = self.recycling_service.get_recyclable_leads('disconnected', 30, 100)
+        leads = self.recycling_service.get_recyclable_leads('disconnected', 100)
         
         # Should get lead_disconnected (has 1 recycle, max is 2)
         self.assertEqual(len(leads), 1)
@@ -152,14 +220,36 @@ class LeadRecyclingServiceTestCase(TestCase):
         
         self.assertTrue(result)
         
-        # Refresh from database
-        self.lead_no_answer.refresh_from_db()
+        row = reload(
+            self.lead_no_answer, 'status', 'attempts', 'recycle_count', 'next_call_at', 'last_call_at'
+        )
+        
+        self.assertEqual(row['status'], 'new')
+        self.assertEqual(row['attempts'], 0)
+        self.assertEqual(row['recycle_count'], original_recycle_count + 1)
+        self.assertIsNone(row['next_call_at'])
+        self.assertIsNone(row['last_call_at'])
+    
+    def test_recycle_leads_bulk(self):
+        """Test recycling a whole queryset of leads in one UPDATE."""
+        Lead.objects.bulk_create([
+            make_lead(
+                self.campaign,
+                phone=f'+1999{i:07d}',
+                status='no_answer',
+                attempts=2,
+                recycle_count=2 if i < 10 else 0,  # The first ten are at the max limit
+                is_dnc=i >= 90  # The last ten are DNC
+            )
+            for i in range(100)
+        ])
+        queryset = Lead.objects.filter(campaign=self.campaign, phone__startswith='+1999')
+        
+        with self.assertNumQueries(1):
+            recycled = self.recycling_service.recycle_leads_bulk(queryset)
         
-        self.assertEqual(self.lead_no_answer.status, 'new')
-        self.assertEqual(self.lead_no_answer.attempts, 0)
-        self.assertEqual(self.lead_no_answer.recycle_count, original_recycle_count + 1)
-        self.assertIsNone(self.lead_no_answer.next_call_at)
-        self.assertIsNone(self.lead_no_answer.last_call_at)
+        self.assertEqual(recycled, 80)
+        self.assertEqual(queryset.filter(status='new', attempts=0, recycle_count=1).count(), 80)
     
     def test_recycle_lead_max_attempts_reached(self):
         """Test recycling a lead that has reached max recycle attempts."""
@@ -168,9 +258,9 @@ class LeadRecyclingServiceTestCase(TestCase):
         self.assertFalse(result)
         
         # Lead should remain unchanged
-        self.lead_max_recycles.refresh_from_db()
-        self.assertEqual(self.lead_max_recycles.status, 'no_answer')
-        self.assertEqual(self.lead_max_recycles.recycle_count, 2)
+        row = reload(self.lead_max_recycles, 'status', 'recycle_count')
+        self.assertEqual(row['status'], 'no_answer')
+        self.assertEqual(row['recycle_count'], 2)
     
     def test_recycle_lead_dnc_excluded(self):
         """Test recycling a DNC lead when DNC exclusion is enabled."""
@@ -179,9 +269,9 @@ class LeadRecyclingServiceTestCase(TestCase):
         self.assertFalse(result)
         
         # Lead should remain unchanged
-        self.lead_dnc.refresh_from_db()
-        self.assertEqual(self.lead_dnc.status, 'no_answer')
-        self.assertEqual(self.lead_dnc.recycle_count, 0)
+        row = reload(self.lead_dnc, 'status', 'recycle_count')
+        self.assertEqual(row['status'], 'no_answer')
+        self.assertEqual(row['recycle_count'], 0)
     
     def test_can_recycle_now_success(self):
         """Test can_recycle_now with valid conditions."""
@@ -216,7 +306,9 @@ class LeadRecyclingServiceTestCase(TestCase):
     
     def test_process_campaign_recycling(self):
         """Test processing campaign recycling."""
-        results = self.recycling_service.process_campaign_recycling(batch_size=100)
+        # One SELECT across every status, then one UPDATE per status
+        with self.assertNumQueries(4):
+            results = self.recycling_service.process_campaign_recycling(batch_size=100)
         
         # Should recycle leads based on their status and age
         expected_recycled = 3  # no_answer, busy, disconnected (not max_recycles or dnc)
@@ -226,10 +318,42 @@ class LeadRecyclingServiceTestCase(TestCase):
         self.assertIn('no_answer', results)
         self.assertIn('busy', results)
         self.assertIn('disconnected', results)
+        self.assertEqual(results, {'no_answer': 1, 'busy': 1, 'disconnected': 1})
+    
+    def test_process_campaign_recycling_caps_each_status(self):
+        """Test that batch_size caps each status in the SELECT, oldest calls first."""
+        older_no_answer = Lead.objects.create(
+            campaign=self.campaign,
+            phone='+6666666666',
+            status='no_answer',
+            last_call_at=timezone.now() - timedelta(days=20)
+        )
+        
+        results = self.recycling_service.process_campaign_recycling(batch_size=1)
+        
+        self.assertEqual(results, {'no_answer': 1, 'busy': 1, 'disconnected': 1})
+        self.assertEqual(reload(older_no_answer, 'status')['status'], 'new')
+        self.assertEqual(reload(self.lead_no_answer, 'status')['status'], 'no_answer')
+    
+    def test_process_campaign_recycling_counts_updated_rows(self):
+        """Test that a lead which stops qualifying after the SELECT is not counted as recycled."""
+        recycle_leads_bulk = self.recycling_service.recycle_leads_bulk
+        
+        def call_answered_first(queryset, current_time=None):
+            # The busy lead is called again between the SELECT and its UPDATE
+            Lead.objects.filter(pk=self.lead_busy.pk).update(status='answered')
+            return recycle_leads_bulk(queryset, current_time)
+        
+        with patch.object(self.recycling_service, 'recycle_leads_bulk', side_effect=call_answered_first):
+            results = self.recycling_service.process_campaign_recycling(batch_size=100)
+        
+        self.assertEqual(results, {'no_answer': 1, 'busy': 0, 'disconnected': 1})
+        self.assertEqual(reload(self.lead_busy, 'status')['status'], 'answered')
     
     def test_get_recycling_stats(self):
         """Test getting recycling statistics."""
-        stats = self.recycling_service.get_recycling_stats()
+        with self.assertNumQueries(1):
+            stats = self.recycling_service.get_recycling_stats()
         
         # Should show counts of recyclable leads by status
         self.assertIn('no_answer_recyclable', stats)
@@ -242,33 +366,18 @@ class LeadRecyclingServiceTestCase(TestCase):
         self.assertEqual(stats['disconnected_recyclable'], 1)
 
 
-class RecycleCampaignLeadsTaskTestCase(TestCase):
+# Tuesday 3 PM UTC, inside the default campaign hours, so recycling is allowed
+@freeze_time("2024-01-02T15:00:00+00:00")
+class RecycleCampaignLeadsTaskTestCase(CampaignUserMixin, TestCase):
     """Test cases for the recycle_campaign_leads Celery task."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create test user
-        self.department = Department.objects.create(
-            name="Test Department",
-            description="Test department"
-        )
-        
-        self.user_role = UserRole.objects.create(
-            name="admin",
-            display_name="Administrator", 
-            description="Admin role"
-        )
-        
-        self.user = User.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            department=self.department,
-            role=self.user_role
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create test campaign
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name="Task Test Campaign",
             description="Test campaign for task testing",
             status='active',
@@ -281,31 +390,46 @@ class RecycleCampaignLeadsTaskTestCase(TestCase):
             recycle_busy_days=1,
             recycle_disconnected_days=1,
             max_recycle_attempts=2,
-            created_by=self.user
+            created_by=cls.user
         )
         
         # Create test leads
-        Lead.objects.create(
-            phone='+1111111111',
-            campaign=self.campaign,
-            status='no_answer',
-            attempts=1,
-            last_call_at=timezone.now() - timedelta(days=2),
-            recycle_count=0
-        )
+        Lead.objects.bulk_create([
+            make_lead(
+                cls.campaign,
+                phone='+1111111111',
+                status='no_answer',
+                attempts=1,
+                last_call_at=timezone.now() - timedelta(days=2)
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+2222222222',
+                status='busy',
+                attempts=1,
+                last_call_at=timezone.now() - timedelta(days=2)
+            ),
+        ])
+    
+    @patch('campaigns.tasks.chord')
+    @patch.object(LeadRecyclingService, 'campaign_can_recycle', return_value=True)
+    def test_recycle_campaign_leads_all_campaigns(self, mock_can_recycle, mock_chord):
+        """Test recycling leads for all active campaigns fans out per campaign."""
+        with self.assertNumQueries(1):
+            result = recycle_campaign_leads()
         
-        Lead.objects.create(
-            phone='+2222222222',
-            campaign=self.campaign,
-            status='busy',
-            attempts=1,
-            last_call_at=timezone.now() - timedelta(days=2),
-            recycle_count=0
-        )
+        self.assertTrue(result['success'])
+        self.assertEqual(result['campaigns_dispatched'], 1)
+        
+        header = list(mock_chord.call_args[0][0])
+        self.assertEqual([signature.args for signature in header], [(self.campaign.id,)])
     
-    def test_recycle_campaign_leads_all_campaigns(self):
-        """Test recycling leads for all active campaigns."""
-        result = recycle_campaign_leads()
+    def test_summarize_recycling_results(self):
+        """Test combining per-campaign recycling results."""
+        result = summarize_recycling_results([
+            {'success': True, 'campaign_id': 1, 'recycled': 2, 'processed': True},
+            {'success': True, 'campaign_id': 2, 'recycled': 0, 'processed': False},
+        ])
         
         self.assertTrue(result['success'])
         self.assertEqual(result['total_recycled'], 2)
@@ -327,45 +451,27 @@ class RecycleCampaignLeadsTaskTestCase(TestCase):
         self.assertEqual(result['total_recycled'], 0)
         self.assertEqual(result['campaigns_processed'], 0)
     
-    @patch('campaigns.tasks.logger')
-    def test_recycle_campaign_leads_error_handling(self, mock_logger):
+    def test_recycle_campaign_leads_error_handling(self):
         """Test error handling in the recycling task."""
         # Create a campaign with invalid data to trigger an error
-        with patch.object(LeadRecyclingService, 'process_campaign_recycling', side_effect=Exception("Test error")):
+        with patch.object(LeadRecyclingService, 'process_campaign_recycling', side_effect=Exception("Test error")), \
+                self.assertLogs('campaigns.tasks', level='ERROR'):
             result = recycle_campaign_leads(campaign_id=self.campaign.id)
-            
-            self.assertFalse(result['success'])
-            self.assertIn('error', result)
-            mock_logger.error.assert_called()
+        
+        self.assertFalse(result['success'])
+        self.assertIn('error', result)
 
 
-class TimezoneSchedulingServiceTestCase(TestCase):
+class TimezoneSchedulingServiceTestCase(CampaignUserMixin, TestCase):
     """Test cases for the TimezoneSchedulingService class."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create test user
-        self.department = Department.objects.create(
-            name="Test Department",
-            description="Test department"
-        )
-        
-        self.user_role = UserRole.objects.create(
-            name="admin",
-            display_name="Administrator",
-            description="Admin role"
-        )
-        
-        self.user = User.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            department=self.department,
-            role=self.user_role
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create test campaign in Eastern Time
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name="Timezone Test Campaign",
             description="Campaign for timezone testing",
             status='active',
@@ -374,8 +480,8 @@ class TimezoneSchedulingServiceTestCase(TestCase):
             pacing_ratio=2.5,
             caller_id='+1234567890',
             timezone_name='America/New_York',
-            start_time='09:00:00',  # 9 AM
-            end_time='17:00:00',    # 5 PM
+            start_time=time(9, 0),  # 9 AM
+            end_time=time(17, 0),   # 5 PM
             monday=True,
             tuesday=True,
             wednesday=True,
@@ -383,225 +489,189 @@ class TimezoneSchedulingServiceTestCase(TestCase):
             friday=True,
             saturday=False,
             sunday=False,
-            created_by=self.user
+            created_by=cls.user
         )
         
         # Create leads in different timezones
-        self.lead_eastern = Lead.objects.create(
-            phone='+1111111111',
-            first_name='Eastern',
-            last_name='Lead',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/New_York',  # Eastern Time
-            best_call_time_start='10:00:00',  # 10 AM
-            best_call_time_end='16:00:00'     # 4 PM
-        )
-        
-        self.lead_pacific = Lead.objects.create(
-            phone='+2222222222',
-            first_name='Pacific',
-            last_name='Lead',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/Los_Angeles',  # Pacific Time
-            best_call_time_start='09:00:00',  # 9 AM Pacific
-            best_call_time_end='17:00:00'     # 5 PM Pacific
-        )
-        
-        self.lead_no_preference = Lead.objects.create(
-            phone='+3333333333',
-            first_name='No',
-            last_name='Preference',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/Chicago'  # Central Time, no call time preference
-        )
-        
-        self.lead_expired = Lead.objects.create(
-            phone='+4444444444',
-            first_name='Expired',
-            last_name='Lead',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/New_York',
-            do_not_call_after=timezone.now() - timedelta(days=1)  # Expired yesterday
-        )
+        (
+            cls.lead_eastern,
+            cls.lead_pacific,
+            cls.lead_no_preference,
+            cls.lead_expired,
+        ) = Lead.objects.bulk_create([
+            make_lead(
+                cls.campaign,
+                phone='+1111111111',
+                first_name='Eastern',
+                last_name='Lead',
+                timezone='America/New_York',  # Eastern Time
+                best_call_time_start=time(10, 0),  # 10 AM
+                best_call_time_end=time(16, 0)     # 4 PM
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+2222222222',
+                first_name='Pacific',
+                last_name='Lead',
+                timezone='America/Los_Angeles',  # Pacific Time
+                best_call_time_start=time(9, 0),  # 9 AM Pacific
+                best_call_time_end=time(17, 0)     # 5 PM Pacific
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+3333333333',
+                first_name='No',
+                last_name='Preference',
+                timezone='America/Chicago'  # Central Time, no call time preference
+            ),
+            make_lead(
+                cls.campaign,
+                phone='+4444444444',
+                first_name='Expired',
+                last_name='Lead',
+                timezone='America/New_York',
+                # Expired before the instants the tests freeze time at
+                do_not_call_after=datetime(2024, 1, 1, tzinfo=pytz.UTC)
+            ),
+        ])
+    
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_campaign_schedule_precomputed(self):
+        """Test the campaign schedule is precomputed and checked without queries."""
+        campaign = Campaign.objects.get(pk=self.campaign.pk)
+        lead = Lead.objects.get(pk=self.lead_eastern.pk)
+        
+        self.assertEqual(campaign.weekday_mask, 0b0011111)  # Monday to Friday
+        self.assertEqual(campaign.start_seconds, 9 * 3600)
+        self.assertEqual(campaign.end_seconds, 17 * 3600)
+        
+        # Tuesday 2 PM Eastern
+        with self.assertNumQueries(0):
+            self.assertTrue(TimezoneSchedulingService.is_lead_callable_now(lead, campaign))
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_within_business_hours(self, mock_now):
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_filter_callable_leads_reuses_compiled_window(self):
+        """Test the business-hours check is compiled once per campaign schedule."""
+        campaign = Campaign.objects.get(pk=self.campaign.pk)
+        leads = list(Lead.objects.filter(pk__in=[self.lead_eastern.pk, self.lead_no_preference.pk]))
+        
+        first = TimezoneSchedulingService.filter_callable_leads(leads, campaign)
+        hits = _compile_campaign_window.cache_info().hits
+        second = TimezoneSchedulingService.filter_callable_leads(leads, campaign)
+        
+        self.assertEqual(_compile_campaign_window.cache_info().hits, hits + 1)
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 2)
+    
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_is_lead_callable_now_within_business_hours(self):
         """Test lead is callable during business hours."""
         # Set current time to Tuesday 2 PM Eastern (within business hours)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 14, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_eastern, self.campaign)
         self.assertTrue(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_outside_business_hours(self, mock_now):
+    @freeze_time("2024-01-03T01:00:00+00:00")
+    def test_is_lead_callable_now_outside_business_hours(self):
         """Test lead is not callable outside business hours."""
         # Set current time to Tuesday 8 PM Eastern (after business hours)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 20, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_eastern, self.campaign)
         self.assertFalse(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_weekend(self, mock_now):
+    @freeze_time("2024-01-06T19:00:00+00:00")
+    def test_is_lead_callable_now_weekend(self):
         """Test lead is not callable on weekends."""
         # Set current time to Saturday 2 PM Eastern
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 6, 14, 0, 0)).astimezone(pytz.UTC)  # Saturday
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_eastern, self.campaign)
         self.assertFalse(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_before_preferred_time(self, mock_now):
+    @freeze_time("2024-01-02T14:00:00+00:00")
+    def test_is_lead_callable_now_before_preferred_time(self):
         """Test lead is not callable before preferred call time."""
         # Set current time to Tuesday 9 AM Eastern (before lead's preferred time of 10 AM)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 9, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_eastern, self.campaign)
         self.assertFalse(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_after_preferred_time(self, mock_now):
+    @freeze_time("2024-01-02T21:30:00+00:00")
+    def test_is_lead_callable_now_after_preferred_time(self):
         """Test lead is not callable after preferred call time."""
         # Set current time to Tuesday 4:30 PM Eastern (after lead's preferred time of 4 PM)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 16, 30, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_eastern, self.campaign)
         self.assertFalse(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_different_timezone(self, mock_now):
+    @freeze_time("2024-01-02T21:00:00+00:00")
+    def test_is_lead_callable_now_different_timezone(self):
         """Test lead callability with different timezone (Pacific)."""
         # Set current time to Tuesday 1 PM Pacific (within business hours for Pacific lead)
-        pacific = pytz.timezone('America/Los_Angeles')
-        mock_now.return_value = timezone.make_aware(
-            pacific.localize(timezone.datetime(2024, 1, 2, 13, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_pacific, self.campaign)
         self.assertTrue(result)
     
-    @patch('django.utils.timezone.now')
-    def test_is_lead_callable_now_expired_lead(self, mock_now):
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_is_lead_callable_now_expired_lead(self):
         """Test expired lead is not callable."""
         # Set current time to Tuesday 2 PM Eastern
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 14, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         result = TimezoneSchedulingService.is_lead_callable_now(self.lead_expired, self.campaign)
         self.assertFalse(result)
     
-    @patch('django.utils.timezone.now')
-    def test_filter_callable_leads(self, mock_now):
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_filter_callable_leads(self):
         """Test filtering leads for callability."""
         # Set current time to Tuesday 2 PM Eastern (within business hours)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 14, 0, 0)).astimezone(pytz.UTC)
-        )
-        
-        all_leads = [self.lead_eastern, self.lead_pacific, self.lead_no_preference, self.lead_expired]
-        callable_leads = TimezoneSchedulingService.filter_callable_leads(all_leads, self.campaign)
+        lead_ids = [self.lead_eastern.pk, self.lead_pacific.pk, self.lead_no_preference.pk, self.lead_expired.pk]
+        all_leads = list(Lead.objects.filter(pk__in=lead_ids).select_related('campaign'))
         
-        # Should include no_preference (no time restrictions) but exclude others based on their constraints
-        # Note: This test may need adjustment based on exact timezone calculations
-        self.assertGreater(len(callable_leads), 0)
-        self.assertLess(len(callable_leads), len(all_leads))  # Some should be filtered out
+        # Filtering must not lazily load anything per lead
+        with self.assertNumQueries(0):
+            callable_leads = TimezoneSchedulingService.filter_callable_leads(all_leads, self.campaign)
         
-        # Expired lead should definitely be excluded
-        self.assertNotIn(self.lead_expired, callable_leads)
+        # 2 PM Eastern is 11 AM Pacific: every lead is within its window except the expired one
+        self.assertEqual(
+            {lead.pk for lead in callable_leads},
+            {self.lead_eastern.pk, self.lead_pacific.pk, self.lead_no_preference.pk}
+        )
     
-    @patch('django.utils.timezone.now')
-    def test_get_next_callable_time(self, mock_now):
+    @freeze_time("2024-01-03T01:00:00+00:00")
+    def test_get_next_callable_time(self):
         """Test calculating next callable time for a lead."""
         # Set current time to Tuesday 8 PM Eastern (after business hours)
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 20, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         next_time = TimezoneSchedulingService.get_next_callable_time(self.lead_eastern, self.campaign)
         
         self.assertIsNotNone(next_time)
-        self.assertGreater(next_time, mock_now.return_value)
+        self.assertGreater(next_time, timezone.now())
         
         # Convert to Eastern time to check if it's during business hours
-        next_eastern = next_time.astimezone(eastern)
-        self.assertGreaterEqual(next_eastern.time(), timezone.time(9, 0))  # After 9 AM
-        self.assertLessEqual(next_eastern.time(), timezone.time(17, 0))    # Before 5 PM
+        next_eastern = next_time.astimezone(EASTERN)
+        self.assertGreaterEqual(next_eastern.time(), time(9, 0))  # After 9 AM
+        self.assertLessEqual(next_eastern.time(), time(17, 0))    # Before 5 PM
         self.assertIn(next_eastern.weekday(), [0, 1, 2, 3, 4])            # Monday-Friday
     
-    @patch('django.utils.timezone.now')
-    def test_schedule_lead_callback(self, mock_now):
+    @freeze_time("2024-01-03T01:00:00+00:00")
+    def test_schedule_lead_callback(self):
         """Test scheduling a lead callback."""
         # Set current time to Tuesday 8 PM Eastern
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 20, 0, 0)).astimezone(pytz.UTC)
-        )
-        
         callback_time = TimezoneSchedulingService.schedule_lead_callback(
             self.lead_eastern, callback_minutes_from_now=60
         )
         
         # Check that lead was updated
-        self.lead_eastern.refresh_from_db()
-        self.assertEqual(self.lead_eastern.status, 'callback')
-        self.assertIsNotNone(self.lead_eastern.callback_datetime)
-        self.assertEqual(self.lead_eastern.callback_datetime, callback_time)
+        row = reload(self.lead_eastern, 'status', 'callback_datetime')
+        self.assertEqual(row['status'], 'callback')
+        self.assertIsNotNone(row['callback_datetime'])
+        self.assertEqual(row['callback_datetime'], callback_time)
         
         # Callback time should be in the future
-        self.assertGreater(callback_time, mock_now.return_value)
+        self.assertGreater(callback_time, timezone.now())
 
 
-class TimezoneAwarePredictiveDialingTestCase(TestCase):
+class TimezoneAwarePredictiveDialingTestCase(CampaignUserMixin, TestCase):
     """Test cases for timezone-aware predictive dialing."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create test user
-        self.department = Department.objects.create(
-            name="Test Department",
-            description="Test department"
-        )
-        
-        self.user_role = UserRole.objects.create(
-            name="admin",
-            display_name="Administrator",
-            description="Admin role"
-        )
-        
-        self.user = User.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            department=self.department,
-            role=self.user_role
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create test campaign
-        self.campaign = Campaign.objects.create(
+        cls.campaign = Campaign.objects.create(
             name="Timezone Dialing Test",
             description="Campaign for timezone dialing testing",
             status='active',
@@ -610,8 +680,8 @@ class TimezoneAwarePredictiveDialingTestCase(TestCase):
             pacing_ratio=2.5,
             caller_id='+1234567890',
             timezone_name='America/New_York',
-            start_time='09:00:00',
-            end_time='17:00:00',
+            start_time=time(9, 0),
+            end_time=time(17, 0),
             monday=True,
             tuesday=True,
             wednesday=True,
@@ -619,43 +689,186 @@ class TimezoneAwarePredictiveDialingTestCase(TestCase):
             friday=True,
             saturday=False,
             sunday=False,
-            created_by=self.user
+            created_by=cls.user
         )
         
         # Create test leads
-        Lead.objects.create(
-            phone='+1111111111',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/New_York'
-        )
-        
-        Lead.objects.create(
-            phone='+2222222222',
-            campaign=self.campaign,
-            status='new',
-            timezone='America/Los_Angeles'
-        )
-        
+        Lead.objects.bulk_create([
+            make_lead(cls.campaign, phone='+1111111111', timezone='America/New_York'),
+            make_lead(cls.campaign, phone='+2222222222', timezone='America/Los_Angeles'),
+        ])
+    
+    def setUp(self):
+        """Set up per-test state."""
         self.dialing_service = PredictiveDialingService(self.campaign)
     
-    @patch('django.utils.timezone.now')
-    def test_get_dialable_leads_timezone_filtering(self, mock_now):
+    @freeze_time("2024-01-02T19:00:00+00:00")
+    def test_get_dialable_leads_timezone_filtering(self):
         """Test that get_dialable_leads applies timezone filtering."""
         # Set current time to Tuesday 2 PM Eastern
-        eastern = pytz.timezone('America/New_York')
-        mock_now.return_value = timezone.make_aware(
-            eastern.localize(timezone.datetime(2024, 1, 2, 14, 0, 0)).astimezone(pytz.UTC)
+        # Distinct lead timezones, then the filtered leads
+        with self.assertNumQueries(2):
+            dialable_leads = self.dialing_service.get_dialable_leads(limit=10)
+        
+        # 2 PM Eastern is 11 AM Pacific, so both leads are dialable
+        self.assertIsInstance(dialable_leads, list)
+        self.assertEqual(len(dialable_leads), 2)
+        
+        # All returned leads should be callable now, without per-lead queries
+        with self.assertNumQueries(0):
+            for lead in dialable_leads:
+                self.assertTrue(
+                    TimezoneSchedulingService.is_lead_callable_now(lead, self.campaign),
+                    f"Lead {lead.phone} in timezone {lead.timezone} should be callable"
+                )
+
+
+class AutoPrefetchMixinTestCase(TestCase):
+    """Test cases for the serializer-driven related lookups."""
+    
+    def test_serializer_relations_follow_field_sources(self):
+        """Test that dotted sources become select_related paths and unknown fields are skipped."""
+        self.assertEqual(
+            serializer_relations(CampaignAgentAssignmentSerializer, CampaignAgentAssignment),
+            (('agent', 'assigned_by', 'campaign'), ())
+        )
+        # updated_by_name names a relation Campaign does not have
+        self.assertEqual(serializer_relations(CampaignSerializer, Campaign), (('created_by',), ()))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CampaignStatisticsViewTestCase(CampaignUserMixin, TestCase):
+    """Test cases for the campaign statistics endpoints."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a campaign with today's statistics."""
+        super().setUpTestData()
+        
+        cls.campaign = Campaign.objects.create(
+            name="Statistics Campaign",
+            caller_id='+1234567890',
+            created_by=cls.user
         )
+        cls.statistics = CampaignStatistics.objects.create(
+            campaign=cls.campaign,
+            calls_attempted_today=40,
+            calls_answered_today=30,
+            calls_dropped_today=2
+        )
+    
+    def setUp(self):
+        """Start each test without cached summaries."""
+        cache.clear()
+    
+    def get(self, view, **kwargs):
+        """Call a viewset action as the test user and return the response."""
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, self.user)
+        return view(request, **kwargs)
+    
+    def test_campaign_statistics(self):
+        """Test that a campaign's statistics row is serialized with its campaign name."""
+        response = self.get(CampaignViewSet.as_view({'get': 'statistics'}), pk=self.campaign.pk)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['campaign_name'], "Statistics Campaign")
+        self.assertEqual(response.data[0]['calls_attempted_today'], 40)
+        self.assertEqual(response.data[0]['drop_rate_today'], 5.0)
+    
+    def test_summary_is_cached_until_statistics_change(self):
+        """Test that the summary totals the daily counters and is served from cache until a save."""
+        summary = CampaignStatisticsViewSet.as_view({'get': 'summary'})
+        
+        response = self.get(summary)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_calls_attempted'], 40)
+        self.assertEqual(response.data['total_calls_answered'], 30)
+        self.assertEqual(response.data['total_calls_dropped'], 2)
+        
+        # The aggregate comes from the cache
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(summary).data['total_calls_attempted'], 40)
+        
+        self.statistics.calls_attempted_today = 41
+        self.statistics.save()
+        self.assertEqual(self.get(summary).data['total_calls_attempted'], 41)
+    
+    def test_summary_is_invalidated_by_bulk_statistics_writes(self):
+        """Test that tasks writing statistics without signals still invalidate the cached summary."""
+        summary = CampaignStatisticsViewSet.as_view({'get': 'summary'})
+        self.assertEqual(self.get(summary).data['total_calls_attempted'], 40)
         
-        dialable_leads = self.dialing_service.get_dialable_leads(limit=10)
+        reset_daily_statistics()
         
-        # Should return some leads (exact number depends on timezone logic)
-        self.assertIsInstance(dialable_leads, list)
+        self.assertEqual(self.get(summary).data['total_calls_attempted'], 0)
+
+
+class CallCounterTestCase(CampaignUserMixin, TestCase):
+    """Test cases for the call events feeding the campaign's live call counters."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a campaign with a call task for one lead."""
+        super().setUpTestData()
         
-        # All returned leads should be callable now
-        for lead in dialable_leads:
-            self.assertTrue(
-                TimezoneSchedulingService.is_lead_callable_now(lead, self.campaign),
-                f"Lead {lead.phone} in timezone {lead.timezone} should be callable"
-            )
+        cls.campaign = Campaign.objects.create(
+            name="Counter Campaign",
+            caller_id='+1234567890',
+            created_by=cls.user
+        )
+        cls.statistics = CampaignStatistics.objects.create(campaign=cls.campaign, calls_attempted_today=4)
+        cls.lead = Lead.objects.create(campaign=cls.campaign, phone='+1111111111')
+    
+    def setUp(self):
+        """Create a fresh call task for each test."""
+        self.call_task = CallTask.objects.create(
+            lead=self.lead,
+            campaign=self.campaign,
+            phone_number=self.lead.phone
+        )
+    
+    def test_answer_counts_once(self):
+        """Test that answering a call counts it as answered only on the transition."""
+        self.call_task.update_state('answered')
+        self.call_task.update_state('answered')
+        
+        self.statistics.refresh_from_db()
+        self.assertEqual(self.statistics.calls_answered_today, 1)
+        self.assertEqual(self.statistics.calls_dropped_today, 0)
+    
+    def test_abandoned_call_counts_as_dropped(self):
+        """Test that an abandoned call is counted as dropped."""
+        self.call_task.update_state('abandoned')
+        
+        self.statistics.refresh_from_db()
+        self.assertEqual(self.statistics.calls_dropped_today, 1)
+        self.assertEqual(self.statistics.calls_answered_today, 0)
+    
+    def test_events_are_buffered_when_redis_is_available(self):
+        """Test that call events go to the Redis counters instead of the database."""
+        with patch('campaigns.services.counters.increment', return_value=True) as increment:
+            self.call_task.update_state('answered')
+        
+        increment.assert_called_once_with(self.campaign.id, 0, 1, 0)
+        self.statistics.refresh_from_db()
+        self.assertEqual(self.statistics.calls_answered_today, 0)
+    
+    def test_scheduled_calls_count_as_attempted(self):
+        """Test that scheduling calls adds them to the attempted counter in one update."""
+        with patch.object(PredictiveDialingService, 'get_dialable_leads', return_value=[self.lead]):
+            result = schedule_campaign_calls(self.campaign.id, 1)
+        
+        self.assertEqual(result['calls_created'], 1)
+        self.statistics.refresh_from_db()
+        self.assertEqual(self.statistics.calls_attempted_today, 5)
+    
+    def test_recompute_replaces_buffered_counters(self):
+        """Test that the statistics recompute counts from CallTask and discards the buffered deltas."""
+        with patch('campaigns.tasks.counters.discard') as discard:
+            update_campaign_statistics(self.campaign.id)
+        
+        discard.assert_called_once_with([self.campaign.id])
+        self.statistics.refresh_from_db()
+        self.assertEqual(self.statistics.calls_attempted_today, 1)
@@ -1,23 +1,79 @@
 """
 URL configuration for the campaigns app.
 
-This module defines URL patterns using DRF routers for ViewSet-based endpoints.
+This module defines static URL patterns for the ViewSet-based endpoints.
+They mirror the routes DRF's DefaultRouter would generate (including the
+route names), but are declared up front so no router introspection runs
+when the URLconf is loaded.
 """
 
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from django.conf import settings
+from django.urls import path
+from rest_framework.routers import APIRootView
 from . import views
 
 app_name = 'campaigns'
 
-# Create router and register viewsets
-router = DefaultRouter()
-router.register(r'campaigns', views.CampaignViewSet)
-router.register(r'assignments', views.CampaignAgentAssignmentViewSet)
-router.register(r'schedules', views.CampaignScheduleViewSet)
-router.register(r'statistics', views.CampaignStatisticsViewSet)
+# Standard ViewSet method maps, as used by DefaultRouter
+LIST_ACTIONS = {'get': 'list', 'post': 'create'}
+DETAIL_ACTIONS = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+READ_ONLY_LIST_ACTIONS = {'get': 'list'}
+READ_ONLY_DETAIL_ACTIONS = {'get': 'retrieve'}
+
+# Route name prefix of each ViewSet, as DefaultRouter derives it from the queryset model
+BASENAMES = {
+    views.CampaignViewSet: 'campaign',
+    views.CampaignAgentAssignmentViewSet: 'campaignagentassignment',
+    views.CampaignScheduleViewSet: 'campaignschedule',
+    views.CampaignStatisticsViewSet: 'campaignstatistics',
+}
+
+
+def _view(viewset, actions, detail):
+    """Build a ViewSet view with the initkwargs DefaultRouter would pass."""
+    return viewset.as_view(actions, basename=BASENAMES[viewset], detail=detail)
+
 
 urlpatterns = [
-    # Include router URLs
-    path('', include(router.urls)),
+    # Campaigns
+    path('campaigns/', _view(views.CampaignViewSet, LIST_ACTIONS, detail=False), name='campaign-list'),
+    path('campaigns/<int:pk>/', _view(views.CampaignViewSet, DETAIL_ACTIONS, detail=True), name='campaign-detail'),
+    path('campaigns/<int:pk>/activate/', _view(views.CampaignViewSet, {'post': 'activate'}, detail=True),
+         name='campaign-activate'),
+    path('campaigns/<int:pk>/deactivate/', _view(views.CampaignViewSet, {'post': 'deactivate'}, detail=True),
+         name='campaign-deactivate'),
+    path('campaigns/<int:pk>/statistics/', _view(views.CampaignViewSet, {'get': 'statistics'}, detail=True),
+         name='campaign-statistics'),
+    
+    # Agent assignments
+    path('assignments/', _view(views.CampaignAgentAssignmentViewSet, LIST_ACTIONS, detail=False),
+         name='campaignagentassignment-list'),
+    path('assignments/<int:pk>/', _view(views.CampaignAgentAssignmentViewSet, DETAIL_ACTIONS, detail=True),
+         name='campaignagentassignment-detail'),
+    path('assignments/<int:pk>/activate/', _view(views.CampaignAgentAssignmentViewSet, {'post': 'activate'}, detail=True),
+         name='campaignagentassignment-activate'),
+    path('assignments/<int:pk>/deactivate/', _view(views.CampaignAgentAssignmentViewSet, {'post': 'deactivate'}, detail=True),
+         name='campaignagentassignment-deactivate'),
+    
+    # Schedules
+    path('schedules/', _view(views.CampaignScheduleViewSet, LIST_ACTIONS, detail=False), name='campaignschedule-list'),
+    path('schedules/<int:pk>/', _view(views.CampaignScheduleViewSet, DETAIL_ACTIONS, detail=True),
+         name='campaignschedule-detail'),
+    
+    # Statistics (read-only)
+    path('statistics/', _view(views.CampaignStatisticsViewSet, READ_ONLY_LIST_ACTIONS, detail=False),
+         name='campaignstatistics-list'),
+    path('statistics/summary/', _view(views.CampaignStatisticsViewSet, {'get': 'summary'}, detail=False),
+         name='campaignstatistics-summary'),
+    path('statistics/<int:pk>/', _view(views.CampaignStatisticsViewSet, READ_ONLY_DETAIL_ACTIONS, detail=True),
+         name='campaignstatistics-detail'),
 ]
+
+# Browsable API root listing the endpoints above, for development only
+if settings.DEBUG:
+    urlpatterns.append(path('', APIRootView.as_view(api_root_dict={
+        'campaigns': 'campaign-list',
+        'assignments': 'campaignagentassignment-list',
+        'schedules': 'campaignschedule-list',
+        'statistics': 'campaignstatistics-list',
+    }), name='api-root'))
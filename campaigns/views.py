@@ -8,7 +8,9 @@ from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404
 from django.utils import timezone
 
 from .models import (
@@ -24,10 +26,32 @@ from .serializers import (
     CampaignScheduleSerializer,
     CampaignStatisticsSerializer
 )
-from agents.permissions import IsSupervisorOrAbove, IsManagerOrAbove
+from .cache import SUMMARY_CACHE_TIMEOUT, summary_cache_key
+from .services import PredictiveDialingManager
+from agents.permissions import IsSupervisorOrAbove, IsManagerOrAbove, RoleCacheMixin
+from PyDialer.mixins import AutoPrefetchMixin
+from PyDialer.pagination import CachedCountPagination
 
 
-class CampaignViewSet(viewsets.ModelViewSet):
+def _has_active_assignment(user, campaign_ref):
+    """
+    Build an EXISTS test for an active assignment of user to a campaign.
+    
+    Args:
+        user: Agent the assignment must belong to
+        campaign_ref: Outer query field holding the campaign id ('pk' or 'campaign_id')
+        
+    Returns:
+        Exists: Expression usable directly in filter()
+    """
+    return Exists(CampaignAgentAssignment.objects.filter(
+        agent=user,
+        is_active=True,
+        campaign_id=OuterRef(campaign_ref)
+    ))
+
+
+class CampaignViewSet(AutoPrefetchMixin, RoleCacheMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing campaigns with full CRUD operations.
     
@@ -37,7 +61,7 @@ class CampaignViewSet(viewsets.ModelViewSet):
     queryset = Campaign.objects.all()
     permission_classes = [permissions.IsAuthenticated, IsSupervisorOrAbove]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['campaign_type', 'status', 'dial_method', 'is_active']
+    filterset_fields = ['campaign_type', 'status', 'dial_method']
     search_fields = ['name', 'description', 'caller_id']
     ordering_fields = ['name', 'created_at', 'start_date', 'priority']
     ordering = ['-created_at']
@@ -55,16 +79,15 @@ class CampaignViewSet(viewsets.ModelViewSet):
         Filter queryset based on user permissions.
         """
         user = self.request.user
-        queryset = Campaign.objects.all()
+        roles = self.get_user_roles()
+        queryset = super().get_queryset()
         
         # Agents can only see campaigns they're assigned to
-        if user.is_agent() and not user.is_supervisor():
-            assigned_campaigns = user.campaignagentassignment_set.filter(
-                is_active=True
-            ).values_list('campaign_id', flat=True)
-            queryset = queryset.filter(id__in=assigned_campaigns)
+        if roles['agent'] and not roles['supervisor']:
+            # Semi-join on the assignment table; no DISTINCT or id list needed
+            queryset = queryset.filter(_has_active_assignment(user, 'pk'))
         
-        return queryset.select_related('created_by', 'updated_by')
+        return queryset
 
     def perform_create(self, serializer):
         """
@@ -81,14 +104,24 @@ class CampaignViewSet(viewsets.ModelViewSet):
         """
         serializer.save(updated_by=self.request.user)
 
+    def _update_campaign(self, pk, **fields):
+        """
+        Update one campaign visible to the user with a single UPDATE.
+        
+        The update bypasses save(), so the caller sets updated_at and the cached
+        campaign is dropped here as the post_save signal would.
+        """
+        if not self.get_queryset().filter(pk=pk).update(**fields):
+            raise Http404
+        cache.delete(PredictiveDialingManager.campaign_cache_key(pk))
+
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
         """
         Activate a campaign.
         """
-        campaign = self.get_object()
-        campaign.is_active = True
-        campaign.save()
+        now = timezone.now()
+        self._update_campaign(pk, status='active', last_started_at=now, updated_at=now)
         return Response({'status': 'Campaign activated'})
 
     @action(detail=True, methods=['post'])
@@ -96,9 +129,8 @@ class CampaignViewSet(viewsets.ModelViewSet):
         """
         Deactivate a campaign.
         """
-        campaign = self.get_object()
-        campaign.is_active = False
-        campaign.save()
+        now = timezone.now()
+        self._update_campaign(pk, status='inactive', last_stopped_at=now, updated_at=now)
         return Response({'status': 'Campaign deactivated'})
 
     @action(detail=True, methods=['get'])
@@ -107,18 +139,23 @@ class CampaignViewSet(viewsets.ModelViewSet):
         Get campaign statistics.
         """
         campaign = self.get_object()
-        stats = CampaignStatistics.objects.filter(campaign=campaign).order_by('-date')[:30]
+        # A campaign has a single statistics row; campaign_name is serialized
+        # from it, so join the campaign up front
+        stats = CampaignStatistics.objects.filter(
+            campaign=campaign
+        ).select_related('campaign')
         serializer = CampaignStatisticsSerializer(stats, many=True)
         return Response(serializer.data)
 
 
-class CampaignAgentAssignmentViewSet(viewsets.ModelViewSet):
+class CampaignAgentAssignmentViewSet(AutoPrefetchMixin, RoleCacheMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing campaign agent assignments.
     """
     queryset = CampaignAgentAssignment.objects.all()
     serializer_class = CampaignAgentAssignmentSerializer
     permission_classes = [permissions.IsAuthenticated, IsManagerOrAbove]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['campaign', 'agent', 'is_active']
     ordering_fields = ['assigned_at', 'priority']
@@ -129,14 +166,15 @@ class CampaignAgentAssignmentViewSet(viewsets.ModelViewSet):
         Filter queryset based on user permissions and campaign access.
         """
         user = self.request.user
-        queryset = CampaignAgentAssignment.objects.all()
+        roles = self.get_user_roles()
+        queryset = super().get_queryset()
         
         # Supervisors can only see assignments for campaigns they supervise
-        if user.is_supervisor() and not user.is_manager():
+        if roles['supervisor'] and not roles['manager']:
             supervised_agents = user.get_supervised_agents()
             queryset = queryset.filter(agent__in=supervised_agents)
         
-        return queryset.select_related('campaign', 'agent', 'assigned_by')
+        return queryset
 
     def perform_create(self, serializer):
         """
@@ -149,9 +187,8 @@ class CampaignAgentAssignmentViewSet(viewsets.ModelViewSet):
         """
         Activate an agent assignment.
         """
-        assignment = self.get_object()
-        assignment.is_active = True
-        assignment.save()
+        if not self.get_queryset().filter(pk=pk).update(is_active=True):
+            raise Http404
         return Response({'status': 'Assignment activated'})
 
     @action(detail=True, methods=['post'])
@@ -159,13 +196,12 @@ class CampaignAgentAssignmentViewSet(viewsets.ModelViewSet):
         """
         Deactivate an agent assignment.
         """
-        assignment = self.get_object()
-        assignment.is_active = False
-        assignment.save()
+        if not self.get_queryset().filter(pk=pk).update(is_active=False):
+            raise Http404
         return Response({'status': 'Assignment deactivated'})
 
 
-class CampaignScheduleViewSet(viewsets.ModelViewSet):
+class CampaignScheduleViewSet(AutoPrefetchMixin, RoleCacheMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing campaign schedules.
     """
@@ -182,19 +218,17 @@ class CampaignScheduleViewSet(viewsets.ModelViewSet):
         Filter queryset based on campaign access.
         """
         user = self.request.user
-        queryset = CampaignSchedule.objects.all()
+        roles = self.get_user_roles()
+        queryset = super().get_queryset()
         
         # If user is an agent, only show schedules for assigned campaigns
-        if user.is_agent() and not user.is_supervisor():
-            assigned_campaigns = user.campaignagentassignment_set.filter(
-                is_active=True
-            ).values_list('campaign_id', flat=True)
-            queryset = queryset.filter(campaign_id__in=assigned_campaigns)
+        if roles['agent'] and not roles['supervisor']:
+            queryset = queryset.filter(_has_active_assignment(user, 'campaign_id'))
         
-        return queryset.select_related('campaign')
+        return queryset
 
 
-class CampaignStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
+class CampaignStatisticsViewSet(AutoPrefetchMixin, RoleCacheMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only ViewSet for campaign statistics.
     
@@ -203,45 +237,54 @@ class CampaignStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = CampaignStatistics.objects.all()
     serializer_class = CampaignStatisticsSerializer
     permission_classes = [permissions.IsAuthenticated, IsSupervisorOrAbove]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['campaign', 'date']
-    ordering_fields = ['date', 'calls_attempted', 'calls_connected']
-    ordering = ['-date']
+    filterset_fields = ['campaign', 'last_reset_date']
+    ordering_fields = ['last_updated', 'calls_attempted_today', 'calls_answered_today', 'calls_dropped_today']
+    ordering = ['-last_updated']
 
     def get_queryset(self):
         """
         Filter queryset based on user permissions and campaign access.
         """
         user = self.request.user
-        queryset = CampaignStatistics.objects.all()
+        roles = self.get_user_roles()
+        queryset = super().get_queryset()
         
         # Agents can only see statistics for assigned campaigns
-        if user.is_agent() and not user.is_supervisor():
-            assigned_campaigns = user.campaignagentassignment_set.filter(
-                is_active=True
-            ).values_list('campaign_id', flat=True)
-            queryset = queryset.filter(campaign_id__in=assigned_campaigns)
+        if roles['agent'] and not roles['supervisor']:
+            queryset = queryset.filter(_has_active_assignment(user, 'campaign_id'))
         
-        return queryset.select_related('campaign')
+        return queryset
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """
         Get summary statistics across all accessible campaigns.
+        
+        The aggregate is cached per user and filter set for SUMMARY_CACHE_TIMEOUT
+        seconds, so repeated dashboard polls do not rescan the statistics table.
         """
-        queryset = self.filter_queryset(self.get_queryset())
+        # Sorting means nothing to an aggregate; clear any ordering the filters added
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
         
         # Calculate summary statistics
         from django.db.models import Sum, Avg
-        summary = queryset.aggregate(
-            total_calls_attempted=Sum('calls_attempted'),
-            total_calls_connected=Sum('calls_connected'),
-            total_calls_dropped=Sum('calls_dropped'),
-            total_calls_answered=Sum('calls_answered'),
-            avg_talk_time=Avg('average_talk_time'),
-            total_leads_contacted=Sum('leads_contacted'),
-            total_appointments=Sum('appointments_set'),
-            total_sales=Sum('sales_made')
-        )
+        
+        def aggregate_summary():
+            return queryset.aggregate(
+                total_active_calls=Sum('active_calls'),
+                total_agents_logged_in=Sum('agents_logged_in'),
+                total_calls_attempted=Sum('calls_attempted_today'),
+                total_calls_completed=Sum('calls_completed_today'),
+                total_calls_answered=Sum('calls_answered_today'),
+                total_calls_dropped=Sum('calls_dropped_today'),
+                avg_call_duration=Avg('average_call_duration'),
+                avg_contact_rate=Avg('contact_rate_today'),
+                avg_conversion_rate=Avg('conversion_rate_today')
+            )
+        
+        cache_key = summary_cache_key(request.user.id, request.GET.urlencode())
+        summary = cache.get_or_set(cache_key, aggregate_summary, timeout=SUMMARY_CACHE_TIMEOUT)
         
         return Response(summary)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-17 05:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0002_lead_recycle_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['campaign', 'status', 'is_dnc', 'last_call_at'], name='leads_campaig_01daeb_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_lead_leads_campaig_01daeb_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['campaign', 'status', 'recycle_count', 'last_call_at'], name='leads_campaig_28c1b4_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-17 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0004_lead_leads_campaig_28c1b4_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('is_dnc', False), models.Q(('status__in', ['completed', 'invalid', 'duplicate']), _negated=True)), fields=['campaign', 'priority', 'next_call_at'], name='lead_callable_idx'),
+        ),
+    ]
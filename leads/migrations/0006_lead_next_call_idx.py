@@ -0,0 +1,29 @@
+# Generated by Django 4.2.16 on 2026-10-17 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0005_lead_callable_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lead',
+            name='attempts',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='lead',
+            name='priority',
+            field=models.IntegerField(choices=[(1, 'Highest'), (2, 'High'), (3, 'Normal'), (4, 'Low'), (5, 'Lowest')], default=3),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('is_dnc', False), ('status__in', ['new', 'callback', 'retry'])), fields=['campaign', 'next_call_at'], name='lead_next_call_idx'),
+        ),
+        # Refresh planner statistics for the new index set
+        migrations.RunSQL('ANALYZE leads;', reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1,4 +1,8 @@
+import re
+from functools import lru_cache
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Concat, NullIf, Now, Trim
 from django.core.validators import RegexValidator, MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.contrib.auth import get_user_model
@@ -7,6 +11,39 @@ import pytz
 
 User = get_user_model()
 
+# Parse each zoneinfo name once per process; leads are checked in dialer loops
+_pytz_zone = lru_cache(maxsize=512)(pytz.timezone)
+
+# Compiled once at import and shared by the model validator and the serializers
+PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+
+
+# Statuses after which a lead is never dialed again
+CLOSED_STATUSES = ['completed', 'invalid', 'duplicate']
+
+
+class LeadQuerySet(models.QuerySet):
+    """Queryset for leads"""
+
+    def callable(self):
+        """Leads that pass Lead.is_callable, evaluated in SQL for dialer picks"""
+        return self.filter(
+            is_dnc=False,
+            consent_to_call=True,
+            attempts__lt=F('max_attempts')
+        ).exclude(
+            status__in=CLOSED_STATUSES
+        ).filter(
+            Q(do_not_call_after__isnull=True) | Q(do_not_call_after__gte=Now())
+        )
+
+    def with_full_name(self):
+        """Annotate full_name in SQL, matching Lead.get_full_name (None when both parts are blank)"""
+        return self.annotate(full_name=NullIf(
+            Trim(Concat('first_name', models.Value(' '), 'last_name', output_field=models.CharField())),
+            models.Value('')
+        ))
+
 
 class Lead(models.Model):
     """
@@ -36,7 +73,7 @@ class Lead(models.Model):
     ]
 
     # Contact Information
-    phone_regex = RegexValidator(regex=r'^\+?1?\d{9,15}$', 
+    phone_regex = RegexValidator(regex=PHONE_RE.pattern, 
                                 message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
     phone = models.CharField(validators=[phone_regex], max_length=17, db_index=True)
     alt_phone = models.CharField(validators=[phone_regex], max_length=17, blank=True, 
@@ -60,10 +97,10 @@ class Lead(models.Model):
     
     # Lead Status and Priority
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='new', db_index=True)
-    priority = models.IntegerField(choices=PRIORITY_CHOICES, default=3, db_index=True)
+    priority = models.IntegerField(choices=PRIORITY_CHOICES, default=3)
     
     # Call Attempt Tracking
-    attempts = models.IntegerField(default=0, db_index=True)
+    attempts = models.IntegerField(default=0)
     max_attempts = models.IntegerField(default=3)
     last_call_at = models.DateTimeField(null=True, blank=True, db_index=True)
     next_call_at = models.DateTimeField(null=True, blank=True, db_index=True)
@@ -107,6 +144,8 @@ class Lead(models.Model):
     source_file = models.CharField(max_length=200, blank=True)
     source_row = models.IntegerField(null=True, blank=True)
 
+    objects = LeadQuerySet.as_manager()
+
     class Meta:
         db_table = 'leads'
         ordering = ['priority', '-created_at']
@@ -116,6 +155,20 @@ class Lead(models.Model):
             models.Index(fields=['next_call_at']),
             models.Index(fields=['callback_datetime']),
             models.Index(fields=['attempts', 'status']),
+            models.Index(fields=['campaign', 'status', 'is_dnc', 'last_call_at']),
+            models.Index(fields=['campaign', 'status', 'recycle_count', 'last_call_at']),
+            # Covers LeadQuerySet.callable() picks; closed and DNC leads stay out of it
+            models.Index(
+                fields=['campaign', 'priority', 'next_call_at'],
+                name='lead_callable_idx',
+                condition=Q(is_dnc=False) & ~Q(status__in=CLOSED_STATUSES)
+            ),
+            # Matches the dialer's next-lead predicate
+            models.Index(
+                fields=['campaign', 'next_call_at'],
+                name='lead_next_call_idx',
+                condition=Q(is_dnc=False) & Q(status__in=['new', 'callback', 'retry'])
+            ),
         ]
 
     def __str__(self):
@@ -126,18 +179,21 @@ class Lead(models.Model):
 
     def get_full_name(self):
         """Return the full name with proper formatting"""
-        full_name = f"{self.first_name} {self.last_name}".strip()
-        return full_name if full_name else None
+        first_name, last_name = self.first_name, self.last_name
+        if first_name and last_name:
+            return f"{first_name} {last_name}"
+        # Phone-only leads return here without building any string
+        return first_name or last_name or None
 
     def is_callable(self):
-        """Check if lead is available for calling"""
+        """Check if lead is available for calling; Lead.objects.callable() is the SQL form"""
         if self.is_dnc or not self.consent_to_call:
             return False
         
         if self.attempts >= self.max_attempts:
             return False
         
-        if self.status in ['completed', 'invalid', 'duplicate']:
+        if self.status in CLOSED_STATUSES:
             return False
         
         if self.do_not_call_after and timezone.now() > self.do_not_call_after:
@@ -152,9 +208,9 @@ class Lead(models.Model):
         
         # Convert to lead's timezone
         try:
-            lead_tz = pytz.timezone(self.timezone)
+            lead_tz = _pytz_zone(self.timezone)
             local_time = check_datetime.astimezone(lead_tz).time()
-        except:
+        except (pytz.UnknownTimeZoneError, AttributeError):
             local_time = check_datetime.time()
         
         # Check call window if specified
@@ -169,13 +225,16 @@ class Lead(models.Model):
             minutes_delay = self.campaign.retry_delay_minutes
         
         self.next_call_at = timezone.now() + timezone.timedelta(minutes=minutes_delay)
-        self.save(update_fields=['next_call_at'])
+        Lead.objects.filter(pk=self.pk).update(next_call_at=self.next_call_at)
 
     def increment_attempts(self):
-        """Increment call attempts counter"""
-        self.attempts += 1
+        """Increment call attempts counter in a single UPDATE, safe under concurrent dialers"""
         self.last_call_at = timezone.now()
-        self.save(update_fields=['attempts', 'last_call_at'])
+        Lead.objects.filter(pk=self.pk).update(
+            attempts=F('attempts') + 1,
+            last_call_at=self.last_call_at
+        )
+        self.refresh_from_db(fields=['attempts'])
 
     def set_callback(self, callback_datetime, agent=None, notes=""):
         """Set callback information"""
@@ -183,14 +242,19 @@ class Lead(models.Model):
         self.callback_agent = agent
         self.callback_notes = notes
         self.status = 'callback'
-        self.save()
+        self.save(update_fields=['callback_datetime', 'callback_agent', 'callback_notes', 'status', 'updated_at'])
 
     def mark_as_dnc(self, reason=""):
         """Mark lead as Do Not Call"""
+        # Queryset update: no save signals fire. Lead has none today; switch to
+        # save(update_fields=...) if a DNC audit receiver is ever added
         self.is_dnc = True
         self.dnc_reason = reason
         self.status = 'dnc'
-        self.save()
+        self.updated_at = timezone.now()
+        Lead.objects.filter(pk=self.pk).update(
+            is_dnc=True, dnc_reason=reason, status='dnc', updated_at=self.updated_at
+        )
 
 
 class LeadImportBatch(models.Model):
@@ -285,6 +349,14 @@ class DispositionCode(models.Model):
         return f"{self.code} - {self.name}"
 
 
+class DispositionQuerySet(models.QuerySet):
+    """Queryset for dispositions"""
+
+    def with_rels(self):
+        """Join the relations read by process_disposition and the serializers"""
+        return self.select_related('campaign', 'disposition_code', 'lead', 'agent')
+
+
 class Disposition(models.Model):
     """
     Disposition records for call outcomes and notes
@@ -318,6 +390,8 @@ class Disposition(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     wrap_up_time = models.DurationField(null=True, blank=True, help_text="Time spent in wrap-up")
 
+    objects = DispositionQuerySet.as_manager()
+
     class Meta:
         db_table = 'dispositions'
         ordering = ['-created_at']
@@ -345,21 +419,26 @@ class Disposition(models.Model):
 
     def process_disposition(self):
         """Process the disposition and update lead accordingly"""
-        # Update lead status based on disposition
+        # Update lead status based on disposition; each branch writes only the
+        # columns it changes
         if self.disposition_code.remove_from_campaign:
-            self.lead.status = 'completed'
+            self._complete_lead()
         elif self.disposition_code.requires_callback and self.callback_datetime:
             self.lead.set_callback(self.callback_datetime, self.agent, self.callback_notes)
         elif not self.disposition_code.allows_retry:
-            self.lead.status = 'completed'
+            self._complete_lead()
         else:
             # Schedule next attempt if allowed
             if self.lead.attempts < self.lead.max_attempts:
                 self.lead.schedule_next_attempt()
             else:
-                self.lead.status = 'completed'
-        
-        self.lead.save()
+                self._complete_lead()
+
+    def _complete_lead(self):
+        """Mark the lead completed with one UPDATE, without loading it"""
+        Lead.objects.filter(pk=self.lead_id).update(status='completed', updated_at=timezone.now())
+        if Disposition.lead.is_cached(self):
+            self.lead.status = 'completed'
 
 
 class LeadNote(models.Model):
@@ -7,7 +7,7 @@ This module contains basic DRF serializers for lead management functionality.
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from campaigns.models import Campaign
-from .models import Lead, Disposition, DispositionCode, LeadNote, LeadImportBatch
+from .models import Lead, Disposition, DispositionCode, LeadNote, LeadImportBatch, PHONE_RE
 
 User = get_user_model()
 
@@ -36,8 +36,8 @@ class LeadSerializer(serializers.ModelSerializer):
         """
         Validate phone number format.
         """
-        if value and not value.replace('+', '').replace('-', '').replace(' ', '').replace('(', '').replace(')', '').isdigit():
-            raise serializers.ValidationError("Phone number must contain only digits and valid formatting characters.")
+        if value and not PHONE_RE.match(value):
+            raise serializers.ValidationError("Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
         return value
 
 
@@ -166,8 +166,10 @@ class LeadBulkImportSerializer(serializers.Serializer):
 class LeadListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for lead lists with essential fields only.
+    
+    campaign_name and full_name are annotated by LeadViewSet.get_queryset.
     """
-    campaign_name = serializers.CharField(source='campaign.name', read_only=True)
+    campaign_name = serializers.CharField(read_only=True)
     full_name = serializers.CharField(read_only=True)
     assigned_agent_name = serializers.CharField(source='assigned_agent.get_full_name', read_only=True)
 
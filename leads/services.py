@@ -0,0 +1,336 @@
+"""
+Services for the leads app.
+
+This module contains the CSV lead import used by the bulk import task.
+"""
+
+import csv
+import io
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Lead
+
+try:
+    from django_bulk_load import bulk_insert_models, bulk_update_models
+except ImportError:
+    # Optional: without it, imports fall back to bulk_create/bulk_update
+    bulk_insert_models = bulk_update_models = None
+
+
+class LeadImportService:
+    """
+    Service for importing leads from a CSV file into a campaign.
+    """
+    
+    # New leads are inserted this many rows per INSERT
+    INSERT_BATCH_SIZE = 5000
+    
+    # Existing leads are updated this many rows per UPDATE ... CASE statement
+    UPDATE_BATCH_SIZE = 1000
+    
+    # Existing phone numbers are preloaded this many rows per fetch
+    PRELOAD_CHUNK_SIZE = 10000
+    
+    # CSV columns read into lead fields, and which of them are stripped
+    CSV_COLUMNS = [
+        'first_name', 'last_name', 'email', 'phone', 'alt_phone', 'address',
+        'city', 'state', 'zip_code', 'country', 'timezone', 'priority',
+    ]
+    STRIPPED_COLUMNS = [
+        'first_name', 'last_name', 'email', 'phone', 'alt_phone', 'address',
+        'city', 'state', 'zip_code',
+    ]
+    
+    @staticmethod
+    def find_malformed_rows(text_stream) -> Tuple[int, List[int], List[Tuple[int, int]]]:
+        """
+        Find the CSV rows that have more fields than the header.
+        
+        pandas' C parser cuts such a row down to the expected fields when it
+        starts a chunk, so the rows are counted up front with csv.reader and
+        skipped by read_csv. Rows with too few fields are padded as before.
+        
+        Args:
+            text_stream: Seekable text stream of the CSV, rewound afterwards
+            
+        Returns:
+            Tuple of the header's field count, the record numbers to skip,
+            counted like read_csv's skiprows, and (row number, field count)
+            for each malformed row
+        """
+        skipped_records = []
+        malformed_rows = []
+        header_size = 0
+        row_number = 0
+        for record_number, fields in enumerate(csv.reader(text_stream)):
+            if not fields:
+                continue  # Blank lines are not rows
+            if not header_size:
+                header_size = len(fields)
+                continue
+            row_number += 1
+            if len(fields) > header_size:
+                skipped_records.append(record_number)
+                malformed_rows.append((row_number, len(fields)))
+        text_stream.seek(0)
+        return header_size, skipped_records, malformed_rows
+    
+    @staticmethod
+    def clean_rows(chunk, campaign):
+        """
+        Turn a chunk of raw CSV rows into lead field values, one column at a time.
+        
+        Args:
+            chunk: DataFrame of CSV rows read as strings
+            campaign: Campaign providing the default timezone
+            
+        Returns:
+            DataFrame with one column per Lead field, indexed like chunk
+        """
+        rows = chunk.reindex(columns=LeadImportService.CSV_COLUMNS, fill_value='')
+        for column in LeadImportService.STRIPPED_COLUMNS:
+            rows[column] = rows[column].str.strip()
+        
+        # Defaults apply only when the file has no such column
+        if 'country' not in chunk.columns:
+            rows['country'] = 'US'
+        if 'timezone' not in chunk.columns:
+            rows['timezone'] = campaign.timezone_name or 'America/New_York'
+        
+        rows['priority'] = rows['priority'].where(rows['priority'].str.isdigit(), '1').astype(int)
+        return rows.rename(columns={'zip_code': 'postal_code'})
+    
+    @staticmethod
+    def can_copy_leads() -> bool:
+        """
+        Check whether imported leads can be loaded with COPY.
+        
+        Returns:
+            bool: True when django-bulk-load is installed and the database is PostgreSQL
+        """
+        return bulk_insert_models is not None and connection.vendor == 'postgresql'
+    
+    @staticmethod
+    def import_csv(campaign, csv_file, skip_duplicates: bool, update_existing: bool) -> Dict:
+        """
+        Create and update a campaign's leads from the rows of a CSV file.
+        
+        Rows are parsed with pandas one batch at a time and cleaned per
+        column; rows with more fields than the header are found beforehand
+        in one pass of csv.reader and fail on their own. New and updated leads are written in batches; on PostgreSQL
+        with django-bulk-load installed the batches are streamed with COPY.
+        
+        Args:
+            campaign: Campaign the leads belong to
+            csv_file: Binary file object with UTF-8 CSV content
+            skip_duplicates: Ignore rows whose phone number already exists
+            update_existing: Update the existing lead instead of reporting a duplicate
+            
+        Returns:
+            Dict with total_processed, successful, failed and the errors list
+        """
+        # Decode and parse the CSV incrementally, one batch of rows at a time
+        text_stream = io.TextIOWrapper(getattr(csv_file, 'file', csv_file), encoding='utf-8', newline='')
+        header_size, skipped_records, malformed_rows = LeadImportService.find_malformed_rows(text_stream)
+        try:
+            chunks = pd.read_csv(
+                text_stream, dtype=str, keep_default_na=False, skiprows=skipped_records,
+                chunksize=LeadImportService.INSERT_BATCH_SIZE
+            )
+        except pd.errors.EmptyDataError:
+            chunks = []
+        
+        # Position of the n-th read row is n plus the malformed rows before
+        # it; subtracting each malformed row's rank lets searchsorted count them
+        malformed_shift = np.array([row for row, _ in malformed_rows]) - np.arange(len(malformed_rows))
+        reported_malformed = 0
+        
+        total_processed = 0
+        successful = 0
+        failed = 0
+        errors = []
+        
+        # Existing leads of the campaign, loaded once instead of queried per row
+        # and streamed so only one chunk of rows is held besides the result
+        existing_leads = Lead.objects.filter(campaign=campaign)
+        if update_existing:
+            # Phone -> lead id. Reversed so that, for repeated phones, the lead
+            # first in the default ordering wins, as .first() picked it before
+            existing_phones = dict(
+                existing_leads.values_list('phone', 'id').reverse().iterator(
+                    chunk_size=LeadImportService.PRELOAD_CHUNK_SIZE
+                )
+            )
+        else:
+            # Only membership is checked, so no ids and no ordering
+            existing_phones = set(
+                existing_leads.order_by().values_list('phone', flat=True).iterator(
+                    chunk_size=LeadImportService.PRELOAD_CHUNK_SIZE
+                )
+            )
+        
+        use_copy = LeadImportService.can_copy_leads()
+        
+        # New leads waiting for the next bulk INSERT, keyed by phone number, and
+        # the number of later rows merged into each of them
+        pending_leads = {}
+        pending_merges = {}
+        
+        # Field changes for existing leads, keyed by lead id, and the number of
+        # rows that contributed to them
+        pending_updates = {}
+        update_rows = 0
+        
+        def flush_pending_leads(last_row):
+            """Insert the pending leads in one batch and return their rows as (successful, failed)."""
+            leads = list(pending_leads.values())
+            # Rows merged into a pending lead share the outcome of its INSERT
+            rows = len(leads) + sum(pending_merges.values())
+            pending_leads.clear()
+            pending_merges.clear()
+            if not leads:
+                return 0, 0
+            try:
+                # Savepoint, so a failed batch does not abort the import transaction
+                with transaction.atomic():
+                    if use_copy:
+                        bulk_insert_models(leads)
+                    else:
+                        Lead.objects.bulk_create(leads, batch_size=LeadImportService.INSERT_BATCH_SIZE)
+            except Exception as e:
+                errors.append(f"Batch of {len(leads)} leads ending at row {last_row}: {str(e)}")
+                return 0, rows
+            
+            # Later rows repeating these phones are duplicates of the new leads
+            if update_existing:
+                new_ids = {lead.phone: lead.pk for lead in leads if lead.pk is not None}
+                if len(new_ids) < len(leads):
+                    # COPY does not set the new primary keys
+                    new_ids = dict(
+                        Lead.objects.filter(
+                            campaign=campaign, phone__in=[lead.phone for lead in leads]
+                        ).values_list('phone', 'id')
+                    )
+                for phone, lead_id in new_ids.items():
+                    existing_phones.setdefault(phone, lead_id)
+            else:
+                existing_phones.update(lead.phone for lead in leads)
+            return rows, 0
+        
+        def flush_pending_updates():
+            """Apply the pending field changes with bulk_update and return (updated, failed)."""
+            concrete_fields = {field.name for field in Lead._meta.concrete_fields}
+            try:
+                leads = Lead.objects.in_bulk(list(pending_updates))
+                now = timezone.now()
+                update_fields = {'updated_at'}
+                for lead_id, changes in pending_updates.items():
+                    for key, value in changes.items():
+                        if key in concrete_fields:
+                            setattr(leads[lead_id], key, value)
+                            update_fields.add(key)
+                    leads[lead_id].updated_at = now
+                with transaction.atomic():
+                    if use_copy:
+                        # COPY into a temporary table, then one UPDATE ... FROM
+                        bulk_update_models(list(leads.values()), update_field_names=sorted(update_fields))
+                    else:
+                        Lead.objects.bulk_update(
+                            list(leads.values()), sorted(update_fields), batch_size=LeadImportService.UPDATE_BATCH_SIZE
+                        )
+            except Exception as e:
+                errors.append(f"Updating {len(pending_updates)} existing leads: {str(e)}")
+                return 0, update_rows
+            return update_rows, 0
+        
+        # One transaction for the whole import, so it commits once
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Skip waiting for the WAL flush; the caller's next ordinary
+                # commit (the import batch status) flushes it
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit TO OFF')
+            
+            for chunk in chunks:
+                # Missing trailing fields are read as empty
+                chunk = chunk.fillna('')
+                # Row numbers count data rows from 1, across chunks, and
+                # include the malformed rows that were skipped
+                read_numbers = chunk.index.to_numpy() + 1
+                row_numbers = read_numbers + np.searchsorted(malformed_shift, read_numbers, side='right')
+                total_processed += len(chunk)
+                
+                # Lines with too many fields fail on their own, in row order
+                while (reported_malformed < len(malformed_rows) and len(row_numbers)
+                       and malformed_rows[reported_malformed][0] < row_numbers[-1]):
+                    row_number, field_count = malformed_rows[reported_malformed]
+                    errors.append(f"Row {row_number}: Expected {header_size} fields, saw {field_count}")
+                    reported_malformed += 1
+                
+                lead_rows = LeadImportService.clean_rows(chunk, campaign)
+                
+                # Check for required fields
+                has_phone = (lead_rows['phone'] != '').to_numpy()
+                for row_number in row_numbers[~has_phone]:
+                    errors.append(f"Row {row_number}: Phone number is required")
+                failed += int((~has_phone).sum())
+                
+                records = lead_rows[has_phone].to_dict('records')
+                for row_number, lead_data in zip(row_numbers[has_phone], records):
+                    # Handle duplicates, including earlier rows not yet inserted
+                    pending_lead = pending_leads.get(lead_data['phone'])
+                    is_existing = lead_data['phone'] in existing_phones
+                    
+                    if pending_lead or is_existing:
+                        if skip_duplicates:
+                            continue
+                        elif update_existing:
+                            changes = {key: value for key, value in lead_data.items() if value}
+                            if pending_lead:
+                                # Saved, and counted, with its batch INSERT
+                                for key, value in changes.items():
+                                    setattr(pending_lead, key, value)
+                                pending_merges[lead_data['phone']] = pending_merges.get(lead_data['phone'], 0) + 1
+                            else:
+                                existing_id = existing_phones[lead_data['phone']]
+                                pending_updates.setdefault(existing_id, {}).update(changes)
+                                update_rows += 1
+                            continue
+                        else:
+                            errors.append(f"Row {row_number}: Duplicate phone number {lead_data['phone']}")
+                            failed += 1
+                            continue
+                    
+                    # Queue new lead for the next batch INSERT
+                    pending_leads[lead_data['phone']] = Lead(campaign=campaign, **lead_data)
+                    if len(pending_leads) >= LeadImportService.INSERT_BATCH_SIZE:
+                        inserted, not_inserted = flush_pending_leads(row_number)
+                        successful += inserted
+                        failed += not_inserted
+            
+            # Malformed lines after the last row read
+            for row_number, field_count in malformed_rows[reported_malformed:]:
+                errors.append(f"Row {row_number}: Expected {header_size} fields, saw {field_count}")
+            total_processed += len(malformed_rows)
+            failed += len(malformed_rows)
+            
+            inserted, not_inserted = flush_pending_leads(total_processed)
+            successful += inserted
+            failed += not_inserted
+            
+            if pending_updates:
+                updated, not_updated = flush_pending_updates()
+                successful += updated
+                failed += not_updated
+        
+        return {
+            'total_processed': total_processed,
+            'successful': successful,
+            'failed': failed,
+            'errors': errors
+        }
@@ -0,0 +1,74 @@
+"""
+Celery tasks for lead management.
+
+This module contains background tasks for importing leads, so large uploads
+are processed by the leads workers instead of the web request.
+"""
+
+import logging
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .models import LeadImportBatch
+from .services import LeadImportService
+
+logger = logging.getLogger(__name__)
+
+# Number of row errors kept on the import batch
+MAX_LOGGED_ERRORS = 100
+
+
+@shared_task(bind=True)
+def process_bulk_import(self, import_batch_id: int, file_path: str,
+                        skip_duplicates: bool, update_existing: bool):
+    """
+    Import the leads of an uploaded CSV file and record the outcome on its batch.
+
+    The batch moves from pending to processing to completed or failed, so
+    clients can follow progress through the import batch endpoints. The
+    stored upload is deleted once processed.
+
+    Args:
+        import_batch_id: LeadImportBatch the upload belongs to
+        file_path: Path of the upload in default storage
+        skip_duplicates: Ignore rows whose phone number already exists
+        update_existing: Update existing leads found by phone number
+
+    Returns:
+        dict: Import counters for the batch
+    """
+    import_batch = LeadImportBatch.objects.select_related('campaign').get(pk=import_batch_id)
+    import_batch.status = 'processing'
+    import_batch.save(update_fields=['status'])
+
+    try:
+        with default_storage.open(file_path, 'rb') as csv_file:
+            result = LeadImportService.import_csv(
+                import_batch.campaign, csv_file, skip_duplicates, update_existing
+            )
+    except Exception as exc:
+        logger.error("Lead import batch %s failed: %s", import_batch.batch_id, exc)
+        import_batch.status = 'failed'
+        import_batch.error_log = str(exc)
+        import_batch.completed_at = timezone.now()
+        import_batch.save(update_fields=['status', 'error_log', 'completed_at'])
+        return {'success': False, 'import_batch_id': import_batch_id, 'error': str(exc)}
+    finally:
+        default_storage.delete(file_path)
+
+    import_batch.total_records = result['total_processed']
+    import_batch.successful_imports = result['successful']
+    import_batch.failed_imports = result['failed']
+    import_batch.error_log = '\n'.join(result['errors'][:MAX_LOGGED_ERRORS])
+    import_batch.status = 'completed'
+    import_batch.completed_at = timezone.now()
+    import_batch.save()
+
+    return {
+        'success': True,
+        'import_batch_id': import_batch_id,
+        'total_processed': result['total_processed'],
+        'successful': result['successful'],
+        'failed': result['failed']
+    }
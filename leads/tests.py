@@ -1,3 +1,294 @@
+import tempfile
+
 from django.test import TestCase
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+from unittest.mock import patch
+
+from agents.models import Department, UserRole
+from campaigns.models import Campaign
+from leads.models import Lead, LeadImportBatch
+from leads.services import LeadImportService
+from leads.tasks import process_bulk_import
+from leads.views import LeadViewSet
+
+User = get_user_model()
+
+
+def csv_upload(content):
+    """Wrap CSV text in an uploaded file, as the bulk import endpoint receives it."""
+    return SimpleUploadedFile('leads.csv', content.encode('utf-8'), content_type='text/csv')
+
+
+class LeadImportTestData:
+    """Mixin creating the user and campaign leads are imported into."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the department, role, user and campaign shared by the class."""
+        department = Department.objects.create(name="Test Department", description="Test department")
+        role = UserRole.objects.create(name="admin", display_name="Administrator", description="Admin role")
+        cls.user = User.objects.create_user(
+            username="importer",
+            password=None,
+            department=department,
+            role=role
+        )
+        cls.campaign = Campaign.objects.create(
+            name="Import Campaign",
+            caller_id='+1234567890',
+            created_by=cls.user
+        )
+
+
+class LeadImportServiceTestCase(LeadImportTestData, TestCase):
+    """Test cases for LeadImportService.import_csv."""
+    
+    def setUp(self):
+        """Create the lead already in the campaign before each import."""
+        Lead.objects.create(campaign=self.campaign, phone='5559999', first_name='Existing')
+    
+    def import_csv(self, content, skip_duplicates=False, update_existing=False):
+        """Import CSV text into the test campaign and return the result."""
+        return LeadImportService.import_csv(self.campaign, csv_upload(content), skip_duplicates, update_existing)
+    
+    def test_new_rows_are_cleaned_and_created(self):
+        """Values are stripped, zip_code maps to postal_code and defaults apply."""
+        result = self.import_csv("first_name,phone,zip_code,priority\n Ann ,5550001, 12345 ,x\n")
+        
+        self.assertEqual(result, {'total_processed': 1, 'successful': 1, 'failed': 0, 'errors': []})
+        lead = Lead.objects.get(phone='5550001')
+        self.assertEqual(lead.first_name, 'Ann')
+        self.assertEqual(lead.postal_code, '12345')
+        self.assertEqual(lead.priority, 1)
+        self.assertEqual(lead.country, 'US')
+        self.assertEqual(lead.timezone, self.campaign.timezone_name)
+    
+    def test_row_without_phone_fails(self):
+        """A row without a phone number is reported and not created."""
+        result = self.import_csv("first_name,phone\nNo Phone,\n")
+        
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['errors'], ["Row 1: Phone number is required"])
+    
+    def test_existing_phone_is_reported_as_duplicate(self):
+        """Without skip or update, an existing phone is a failed row."""
+        result = self.import_csv("first_name,phone\nNew,5559999\n")
+        
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['errors'], ["Row 1: Duplicate phone number 5559999"])
+        self.assertEqual(Lead.objects.get(phone='5559999').first_name, 'Existing')
+    
+    def test_existing_phone_is_skipped(self):
+        """With skip_duplicates, an existing phone is ignored without an error."""
+        result = self.import_csv("first_name,phone\nNew,5559999\n", skip_duplicates=True)
+        
+        self.assertEqual(result, {'total_processed': 1, 'successful': 0, 'failed': 0, 'errors': []})
+        self.assertEqual(Lead.objects.filter(phone='5559999').count(), 1)
+    
+    def test_existing_phone_is_updated(self):
+        """With update_existing, the non-empty values are written to the existing lead."""
+        result = self.import_csv("first_name,last_name,phone\nRenamed,,5559999\n", update_existing=True)
+        
+        self.assertEqual(result['successful'], 1)
+        lead = Lead.objects.get(phone='5559999')
+        self.assertEqual(lead.first_name, 'Renamed')
+        self.assertEqual(Lead.objects.filter(phone='5559999').count(), 1)
+    
+    def test_phone_repeated_after_a_flushed_batch_is_a_duplicate(self):
+        """A phone inserted by an earlier batch is reported, not inserted again."""
+        content = "first_name,phone\nA,5550001\nB,5550002\nC,5550003\nA2,5550001\n"
+        
+        with patch.object(LeadImportService, 'INSERT_BATCH_SIZE', 2):
+            result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, False)
+        
+        self.assertEqual(result['successful'], 3)
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['errors'], ["Row 4: Duplicate phone number 5550001"])
+        self.assertEqual(Lead.objects.filter(phone='5550001').count(), 1)
+    
+    def test_phone_repeated_after_a_flushed_batch_updates_the_new_lead(self):
+        """With update_existing, a repeated phone updates the lead its batch inserted."""
+        content = "first_name,phone\nA,5550001\nB,5550002\nC,5550003\nA2,5550001\n"
+        
+        with patch.object(LeadImportService, 'INSERT_BATCH_SIZE', 2):
+            result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, True)
+        
+        self.assertEqual(result['successful'], 4)
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(
+            list(Lead.objects.filter(phone='5550001').values_list('first_name', flat=True)), ['A2']
+        )
+    
+    def test_rows_merged_into_a_failed_batch_fail_with_it(self):
+        """A row updating a pending lead is counted only once its batch INSERT succeeds."""
+        content = "first_name,phone\nA,5550001\nA2,5550001\nB,5550002\n"
+        
+        with patch.object(Lead.objects, 'bulk_create', side_effect=ValueError("insert failed")):
+            result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, True)
+        
+        self.assertEqual(result['total_processed'], 3)
+        self.assertEqual(result['successful'], 0)
+        self.assertEqual(result['failed'], 3)
+        self.assertEqual(result['errors'], ["Batch of 2 leads ending at row 3: insert failed"])
+    
+    def test_copied_batch_ids_are_requeried_for_later_updates(self):
+        """COPY leaves the new leads without ids; they are looked up for later updates."""
+        def copy_without_ids(leads):
+            # Like COPY, write the rows without setting pk on the given instances
+            Lead.objects.bulk_create([Lead(**{
+                field.attname: getattr(lead, field.attname)
+                for field in Lead._meta.concrete_fields if not field.primary_key
+            }) for lead in leads])
+        
+        content = "first_name,phone\nA,5550001\nB,5550002\nA2,5550001\n"
+        
+        with patch.object(LeadImportService, 'INSERT_BATCH_SIZE', 2), \
+                patch.object(LeadImportService, 'can_copy_leads', return_value=True), \
+                patch('leads.services.bulk_insert_models', side_effect=copy_without_ids), \
+                patch('leads.services.bulk_update_models', side_effect=lambda leads, update_field_names:
+                      Lead.objects.bulk_update(leads, update_field_names)):
+            result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, True)
+        
+        self.assertEqual(result['successful'], 3)
+        self.assertEqual(
+            list(Lead.objects.filter(phone='5550001').values_list('first_name', flat=True)), ['A2']
+        )
+    
+    def test_malformed_line_fails_only_its_own_row(self):
+        """A line with too many fields is reported; the rows around it are imported."""
+        content = "first_name,phone\nA,5550001\nB,5550002,extra\nC,5550003\n"
+        
+        result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, False)
+        
+        self.assertEqual(result['total_processed'], 3)
+        self.assertEqual(result['successful'], 2)
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['errors'], ["Row 2: Expected 2 fields, saw 3"])
+        self.assertEqual(
+            sorted(Lead.objects.exclude(phone='5559999').values_list('phone', flat=True)), ['5550001', '5550003']
+        )
+    
+    def test_malformed_line_starting_a_chunk_is_not_truncated(self):
+        """A line with too many fields fails even as the first row of a chunk."""
+        content = (
+            "first_name,phone\nA,5550001\nB,5550002\nC,5550003,extra\n"
+            "D,5550004,x,y\n\"E\nE\",5550005\nF,5550006,z\n"
+        )
+        
+        with patch.object(LeadImportService, 'INSERT_BATCH_SIZE', 2):
+            result = LeadImportService.import_csv(self.campaign, csv_upload(content), False, False)
+        
+        self.assertEqual(result['total_processed'], 6)
+        self.assertEqual(result['successful'], 3)
+        self.assertEqual(result['failed'], 3)
+        self.assertEqual(result['errors'], [
+            "Row 3: Expected 2 fields, saw 3",
+            "Row 4: Expected 2 fields, saw 4",
+            "Row 6: Expected 2 fields, saw 3",
+        ])
+        self.assertEqual(
+            sorted(Lead.objects.exclude(phone='5559999').values_list('phone', flat=True)),
+            ['5550001', '5550002', '5550005']
+        )
+
+
+class UploadStorageMixin:
+    """Mixin pointing default storage at a temporary MEDIA_ROOT for each test."""
+    
+    def setUp(self):
+        """Use a fresh temporary directory as MEDIA_ROOT."""
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = self.settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class ProcessBulkImportTaskTestCase(UploadStorageMixin, LeadImportTestData, TestCase):
+    """Test cases for the process_bulk_import task."""
+    
+    def setUp(self):
+        """Store an upload and create its pending import batch."""
+        super().setUp()
+        self.file_path = default_storage.save('lead_imports/test.csv', ContentFile(b"first_name,phone\nA,5550001\n,\n"))
+        self.batch = LeadImportBatch.objects.create(
+            batch_id='test-batch',
+            campaign=self.campaign,
+            filename='leads.csv',
+            imported_by=self.user
+        )
+    
+    def test_completed_import_records_counts(self):
+        """A finished import marks the batch completed with its counts and deletes the upload."""
+        statuses = []
+        original_import = LeadImportService.import_csv
+        
+        def import_csv(*args):
+            statuses.append(LeadImportBatch.objects.get(pk=self.batch.pk).status)
+            return original_import(*args)
+        
+        with patch.object(LeadImportService, 'import_csv', side_effect=import_csv):
+            result = process_bulk_import(self.batch.pk, self.file_path, False, False)
+        
+        self.assertEqual(statuses, ['processing'])
+        self.assertEqual(result, {
+            'success': True, 'import_batch_id': self.batch.pk,
+            'total_processed': 2, 'successful': 1, 'failed': 1
+        })
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, 'completed')
+        self.assertEqual(
+            (self.batch.total_records, self.batch.successful_imports, self.batch.failed_imports), (2, 1, 1)
+        )
+        self.assertEqual(self.batch.error_log, "Row 2: Phone number is required")
+        self.assertIsNotNone(self.batch.completed_at)
+        self.assertFalse(default_storage.exists(self.file_path))
+    
+    def test_failed_import_marks_batch_failed(self):
+        """An error during the import marks the batch failed and still deletes the upload."""
+        with patch.object(LeadImportService, 'import_csv', side_effect=ValueError("bad file")), \
+                self.assertLogs('leads.tasks', level='ERROR'):
+            result = process_bulk_import(self.batch.pk, self.file_path, False, False)
+        
+        self.assertFalse(result['success'])
+        self.batch.refresh_from_db()
+        self.assertEqual(self.batch.status, 'failed')
+        self.assertEqual(self.batch.error_log, "bad file")
+        self.assertFalse(default_storage.exists(self.file_path))
+
 
-# Create your tests here.
+class LeadBulkImportViewTestCase(UploadStorageMixin, LeadImportTestData, TestCase):
+    """Test cases for the bulk_import action."""
+    
+    def test_upload_is_queued_after_commit(self):
+        """The upload is stored, a pending batch created and the task queued on commit."""
+        request = APIRequestFactory().post('/leads/bulk_import/', {
+            'campaign': self.campaign.pk,
+            'file': csv_upload("first_name,phone\nA,5550001\n"),
+            'skip_duplicates': False,
+            'update_existing': True
+        }, format='multipart')
+        force_authenticate(request, self.user)
+        
+        with patch.object(process_bulk_import, 'delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = LeadViewSet.as_view({'post': 'bulk_import'})(request)
+            
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(len(callbacks), 1)
+        
+        batch = LeadImportBatch.objects.get()
+        self.assertEqual(response.data['import_batch_id'], batch.pk)
+        self.assertEqual(batch.status, 'pending')
+        self.assertEqual(batch.filename, 'leads.csv')
+        self.assertEqual(Lead.objects.count(), 0)
+        
+        batch_id, file_path, skip_duplicates, update_existing = delay.call_args.args
+        self.assertEqual((batch_id, skip_duplicates, update_existing), (batch.pk, False, True))
+        self.assertTrue(default_storage.exists(file_path))
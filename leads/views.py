@@ -9,9 +9,9 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import models
-import csv
-import io
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+import uuid
 
 from .models import Lead, Disposition, DispositionCode, LeadNote, LeadImportBatch
 from .serializers import (
@@ -24,7 +24,9 @@ from .serializers import (
     LeadBulkImportSerializer
 )
 from agents.permissions import IsSupervisorOrAbove
+from PyDialer.pagination import CachedCountPagination
 from campaigns.models import Campaign
+from .tasks import process_bulk_import
 
 
 class LeadViewSet(viewsets.ModelViewSet):
@@ -34,6 +36,7 @@ class LeadViewSet(viewsets.ModelViewSet):
     queryset = Lead.objects.all()
     serializer_class = LeadSerializer
     permission_classes = [permissions.IsAuthenticated, IsSupervisorOrAbove]
+    pagination_class = CachedCountPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['campaign', 'status', 'priority', 'assigned_agent', 'is_dnc']
     search_fields = ['first_name', 'last_name', 'email', 'phone']
@@ -41,6 +44,15 @@ class LeadViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
     parser_classes = [MultiPartParser, FormParser]
 
+    # Columns loaded for the list action; wide fields such as custom_fields,
+    # callback_notes and the address are left unfetched
+    LIST_FIELDS = (
+        'id', 'campaign', 'first_name', 'last_name', 'phone',
+        'email', 'status', 'priority', 'attempts', 'last_call_at', 'next_call_at',
+        'callback_agent', 'callback_agent__username', 'callback_agent__first_name',
+        'callback_agent__last_name', 'callback_datetime', 'is_dnc', 'created_at',
+    )
+
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action.
@@ -69,12 +81,23 @@ class LeadViewSet(viewsets.ModelViewSet):
                 models.Q(assigned_agent=user) | models.Q(assigned_agent__isnull=True)
             )
         
+        queryset = queryset.with_full_name()
+        
+        if self.action == 'list':
+            # campaign_name comes from the join instead of a loaded Campaign
+            return queryset.select_related('callback_agent').only(*self.LIST_FIELDS).annotate(
+                campaign_name=models.F('campaign__name')
+            )
+        
         return queryset.select_related('campaign', 'assigned_agent')
 
     @action(detail=False, methods=['post'], permission_classes=[permissions.IsAuthenticated, IsSupervisorOrAbove])
     def bulk_import(self, request):
         """
         Bulk import leads from CSV file.
+        
+        The upload is stored and handed to the process_bulk_import task;
+        the response is 202 with the import batch to poll for progress.
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -90,133 +113,30 @@ class LeadViewSet(viewsets.ModelViewSet):
         serializer.fields['campaign'].queryset = campaign_queryset
         serializer.is_valid(raise_exception=True)
         
-        # Process the import
-        try:
-            result = self._process_bulk_import(
-                campaign=serializer.validated_data['campaign'],
-                csv_file=serializer.validated_data['file'],
-                skip_duplicates=serializer.validated_data['skip_duplicates'],
-                update_existing=serializer.validated_data['update_existing'],
-                user=request.user
-            )
-            
-            return Response({
-                'success': True,
-                'message': 'Bulk import completed successfully',
-                'import_batch_id': result['import_batch_id'],
-                'total_processed': result['total_processed'],
-                'successful': result['successful'],
-                'failed': result['failed'],
-                'errors': result['errors'][:10] if result['errors'] else []  # Limit error display
-            }, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            return Response({
-                'success': False,
-                'message': f'Import failed: {str(e)}'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-    def _process_bulk_import(self, campaign, csv_file, skip_duplicates, update_existing, user):
-        """
-        Process CSV file and create leads.
-        """
-        # Create import batch record
+        # Keep the upload and queue it; the leads workers do the import
+        csv_file = serializer.validated_data['file']
+        batch_id = uuid.uuid4().hex
+        file_path = default_storage.save(f'lead_imports/{batch_id}.csv', csv_file)
         import_batch = LeadImportBatch.objects.create(
-            campaign=campaign,
-            file_name=csv_file.name,
-            file_size=csv_file.size,
-            uploaded_by=user
+            batch_id=batch_id,
+            campaign=serializer.validated_data['campaign'],
+            filename=csv_file.name,
+            imported_by=request.user,
+            status='pending'
         )
         
-        # Read and process CSV
-        file_content = csv_file.read().decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(file_content))
+        skip_duplicates = serializer.validated_data['skip_duplicates']
+        update_existing = serializer.validated_data['update_existing']
+        transaction.on_commit(lambda: process_bulk_import.delay(
+            import_batch.id, file_path, skip_duplicates, update_existing
+        ))
         
-        total_processed = 0
-        successful = 0
-        failed = 0
-        errors = []
-        
-        try:
-            for row in csv_reader:
-                total_processed += 1
-                
-                try:
-                    # Clean and validate row data
-                    lead_data = {
-                        'campaign': campaign,
-                        'first_name': row.get('first_name', '').strip(),
-                        'last_name': row.get('last_name', '').strip(),
-                        'email': row.get('email', '').strip(),
-                        'phone': row.get('phone', '').strip(),
-                        'alt_phone': row.get('alt_phone', '').strip(),
-                        'address': row.get('address', '').strip(),
-                        'city': row.get('city', '').strip(),
-                        'state': row.get('state', '').strip(),
-                        'zip_code': row.get('zip_code', '').strip(),
-                        'country': row.get('country', 'US'),
-                        'timezone': row.get('timezone', campaign.timezone or 'America/New_York'),
-                        'priority': int(row.get('priority', 1)) if row.get('priority', '').isdigit() else 1,
-                    }
-                    
-                    # Check for required fields
-                    if not lead_data['phone']:
-                        errors.append(f"Row {total_processed}: Phone number is required")
-                        failed += 1
-                        continue
-                    
-                    # Handle duplicates
-                    existing_lead = Lead.objects.filter(
-                        phone=lead_data['phone'], 
-                        campaign=campaign
-                    ).first()
-                    
-                    if existing_lead:
-                        if skip_duplicates:
-                            continue
-                        elif update_existing:
-                            for key, value in lead_data.items():
-                                if key != 'campaign' and value:
-                                    setattr(existing_lead, key, value)
-                            existing_lead.save()
-                            successful += 1
-                            continue
-                        else:
-                            errors.append(f"Row {total_processed}: Duplicate phone number {lead_data['phone']}")
-                            failed += 1
-                            continue
-                    
-                    # Create new lead
-                    Lead.objects.create(**lead_data)
-                    successful += 1
-                    
-                except Exception as e:
-                    errors.append(f"Row {total_processed}: {str(e)}")
-                    failed += 1
-            
-            # Update import batch
-            import_batch.total_records = total_processed
-            import_batch.processed_records = total_processed
-            import_batch.successful_records = successful
-            import_batch.failed_records = failed
-            import_batch.status = 'completed'
-            if errors:
-                import_batch.error_log = '\n'.join(errors[:100])  # Store first 100 errors
-            import_batch.save()
-            
-            return {
-                'import_batch_id': import_batch.id,
-                'total_processed': total_processed,
-                'successful': successful,
-                'failed': failed,
-                'errors': errors
-            }
-            
-        except Exception as e:
-            import_batch.status = 'failed'
-            import_batch.error_log = str(e)
-            import_batch.save()
-            raise e
+        return Response({
+            'success': True,
+            'message': 'Bulk import queued',
+            'import_batch_id': import_batch.id,
+            'status': import_batch.status
+        }, status=status.HTTP_202_ACCEPTED)
 
 
 class DispositionCodeViewSet(viewsets.ReadOnlyModelViewSet):
@@ -255,7 +175,7 @@ class DispositionViewSet(viewsets.ModelViewSet):
         if user.is_agent() and not user.is_supervisor():
             queryset = queryset.filter(agent=user)
         
-        return queryset.select_related('lead', 'agent', 'disposition_code')
+        return queryset.with_rels()
 
     def perform_create(self, serializer):
         """
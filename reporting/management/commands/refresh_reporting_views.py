@@ -70,26 +70,28 @@ class Command(BaseCommand):
             self.stdout.write(f"Cache timeout: {cache_timeout} seconds")
         
         refreshed_views = []
+        # Everything is written to the cache in one set_many call at the end
+        cached = {}
         
         try:
             # Refresh Agent Performance Views
             if 'all' in views or 'agent' in views:
-                self._refresh_agent_performance_views(start_date, end_date, cache_timeout, verbose)
+                cached.update(self._refresh_agent_performance_views(start_date, end_date, verbose))
                 refreshed_views.append('agent')
             
             # Refresh Campaign Performance Views
             if 'all' in views or 'campaign' in views:
-                self._refresh_campaign_performance_views(start_date, end_date, cache_timeout, verbose)
+                cached.update(self._refresh_campaign_performance_views(start_date, end_date, verbose))
                 refreshed_views.append('campaign')
             
             # Refresh Call Analytics Views
             if 'all' in views or 'call' in views:
-                self._refresh_call_analytics_views(start_date, end_date, cache_timeout, verbose)
+                cached.update(self._refresh_call_analytics_views(start_date, end_date, verbose))
                 refreshed_views.append('call')
             
             # Refresh Disposition Views
             if 'all' in views or 'disposition' in views:
-                self._refresh_disposition_views(start_date, end_date, cache_timeout, verbose)
+                cached.update(self._refresh_disposition_views(start_date, end_date, verbose))
                 refreshed_views.append('disposition')
             
             # Store refresh metadata
@@ -102,7 +104,8 @@ class Command(BaseCommand):
                 'views_refreshed': refreshed_views,
                 'execution_time': time.time() - start_time
             }
-            cache.set('reporting_views_metadata', refresh_metadata, cache_timeout)
+            cached['reporting_views_metadata'] = refresh_metadata
+            cache.set_many(cached, cache_timeout)
             
             execution_time = time.time() - start_time
             self.stdout.write(
@@ -117,8 +120,9 @@ class Command(BaseCommand):
             )
             raise CommandError(f"Failed to refresh reporting views: {str(e)}")
 
-    def _refresh_agent_performance_views(self, start_date, end_date, cache_timeout, verbose):
-        """Refresh agent performance reporting data"""
+    def _refresh_agent_performance_views(self, start_date, end_date, verbose):
+        """Refresh agent performance reporting data, returning the cache entries"""
+        cached = {}
         if verbose:
             self.stdout.write("Refreshing agent performance views...")
         
@@ -127,47 +131,39 @@ class Command(BaseCommand):
             start_date=start_date, 
             end_date=end_date
         )
-        cache.set('agent_performance_overall', overall_stats, cache_timeout)
+        cached['agent_performance_overall'] = overall_stats
         
         # Individual agent performance
-        agents = User.objects.filter(role__name='agent', is_active=True)
-        agent_stats = {}
-        
-        for agent in agents:
-            stats = AgentPerformanceReport.get_agent_stats(
-                agent_id=agent.id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            agent_stats[agent.id] = stats
+        agent_ids = list(User.objects.filter(role__name='agent', is_active=True).values_list('id', flat=True))
+        agent_stats = AgentPerformanceReport.get_all_agent_stats(
+            agent_ids,
+            start_date=start_date,
+            end_date=end_date
+        )
         
-        cache.set('agent_performance_individual', agent_stats, cache_timeout)
+        cached['agent_performance_individual'] = agent_stats
         
         # Agent rankings
         rankings = AgentPerformanceReport.get_agent_rankings(
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('agent_performance_rankings', list(rankings), cache_timeout)
+        cached['agent_performance_rankings'] = list(rankings)
         
         # Hourly performance patterns for today
         today = timezone.now().date()
-        hourly_patterns = {}
-        
-        for agent in agents:
-            hourly_data = AgentPerformanceReport.get_hourly_performance(
-                agent_id=agent.id,
-                date=today
-            )
-            hourly_patterns[agent.id] = list(hourly_data)
+        hourly_patterns = AgentPerformanceReport.get_all_hourly_performance(agent_ids, date=today)
         
-        cache.set('agent_performance_hourly', hourly_patterns, cache_timeout)
+        cached['agent_performance_hourly'] = hourly_patterns
         
         if verbose:
-            self.stdout.write(f"  - Cached performance data for {agents.count()} agents")
+            self.stdout.write(f"  - Cached performance data for {len(agent_ids)} agents")
+        
+        return cached
 
-    def _refresh_campaign_performance_views(self, start_date, end_date, cache_timeout, verbose):
-        """Refresh campaign performance reporting data"""
+    def _refresh_campaign_performance_views(self, start_date, end_date, verbose):
+        """Refresh campaign performance reporting data, returning the cache entries"""
+        cached = {}
         if verbose:
             self.stdout.write("Refreshing campaign performance views...")
         
@@ -176,42 +172,35 @@ class Command(BaseCommand):
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('campaign_performance_overall', overall_stats, cache_timeout)
+        cached['campaign_performance_overall'] = overall_stats
         
         # Individual campaign performance
-        campaigns = Campaign.objects.filter(is_active=True)
-        campaign_stats = {}
-        
-        for campaign in campaigns:
-            stats = CampaignPerformanceReport.get_campaign_stats(
-                campaign_id=campaign.id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            lead_stats = CampaignPerformanceReport.get_campaign_lead_stats(campaign.id)
-            stats.update(lead_stats)
-            campaign_stats[campaign.id] = stats
+        campaign_ids = list(Campaign.objects.filter(status='active').values_list('id', flat=True))
+        campaign_stats = CampaignPerformanceReport.get_all_campaign_stats(
+            campaign_ids,
+            start_date=start_date,
+            end_date=end_date
+        )
+        lead_stats = CampaignPerformanceReport.get_all_campaign_lead_stats(campaign_ids)
+        for campaign_id, stats in campaign_stats.items():
+            stats.update(lead_stats[campaign_id])
         
-        cache.set('campaign_performance_individual', campaign_stats, cache_timeout)
+        cached['campaign_performance_individual'] = campaign_stats
         
         # Campaign hourly patterns for today
         today = timezone.now().date()
-        hourly_patterns = {}
-        
-        for campaign in campaigns:
-            hourly_data = CampaignPerformanceReport.get_campaign_hourly_stats(
-                campaign_id=campaign.id,
-                date=today
-            )
-            hourly_patterns[campaign.id] = list(hourly_data)
+        hourly_patterns = CampaignPerformanceReport.get_all_campaign_hourly_stats(campaign_ids, date=today)
         
-        cache.set('campaign_performance_hourly', hourly_patterns, cache_timeout)
+        cached['campaign_performance_hourly'] = hourly_patterns
         
         if verbose:
-            self.stdout.write(f"  - Cached performance data for {campaigns.count()} campaigns")
+            self.stdout.write(f"  - Cached performance data for {len(campaign_ids)} campaigns")
+        
+        return cached
 
-    def _refresh_call_analytics_views(self, start_date, end_date, cache_timeout, verbose):
-        """Refresh call analytics reporting data"""
+    def _refresh_call_analytics_views(self, start_date, end_date, verbose):
+        """Refresh call analytics reporting data, returning the cache entries"""
+        cached = {}
         if verbose:
             self.stdout.write("Refreshing call analytics views...")
         
@@ -219,32 +208,35 @@ class Command(BaseCommand):
         daily_volume = CallAnalyticsReport.get_daily_call_volume(
             days=(end_date - start_date).days
         )
-        cache.set('call_analytics_daily_volume', list(daily_volume), cache_timeout)
+        cached['call_analytics_daily_volume'] = list(daily_volume)
         
         # Hourly call patterns for today
         today = timezone.now().date()
         hourly_patterns = CallAnalyticsReport.get_hourly_call_pattern(date=today)
-        cache.set('call_analytics_hourly_patterns', list(hourly_patterns), cache_timeout)
+        cached['call_analytics_hourly_patterns'] = list(hourly_patterns)
         
         # Call outcome distribution
         outcome_distribution = CallAnalyticsReport.get_call_outcome_distribution(
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('call_analytics_outcomes', list(outcome_distribution), cache_timeout)
+        cached['call_analytics_outcomes'] = list(outcome_distribution)
         
         # Recording statistics
         recording_stats = CallAnalyticsReport.get_recording_statistics(
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('call_analytics_recordings', recording_stats, cache_timeout)
+        cached['call_analytics_recordings'] = recording_stats
         
         if verbose:
             self.stdout.write("  - Cached call analytics data")
+        
+        return cached
 
-    def _refresh_disposition_views(self, start_date, end_date, cache_timeout, verbose):
-        """Refresh disposition reporting data"""
+    def _refresh_disposition_views(self, start_date, end_date, verbose):
+        """Refresh disposition reporting data, returning the cache entries"""
+        cached = {}
         if verbose:
             self.stdout.write("Refreshing disposition views...")
         
@@ -253,37 +245,32 @@ class Command(BaseCommand):
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('disposition_stats_overall', list(overall_disposition_stats), cache_timeout)
+        cached['disposition_stats_overall'] = list(overall_disposition_stats)
         
         # Overall conversion funnel
         overall_funnel = DispositionReport.get_conversion_funnel(
             start_date=start_date,
             end_date=end_date
         )
-        cache.set('disposition_funnel_overall', overall_funnel, cache_timeout)
+        cached['disposition_funnel_overall'] = overall_funnel
         
         # Per-campaign disposition statistics
-        campaigns = Campaign.objects.filter(is_active=True)
-        campaign_dispositions = {}
-        campaign_funnels = {}
-        
-        for campaign in campaigns:
-            disposition_stats = DispositionReport.get_disposition_stats(
-                campaign_id=campaign.id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            funnel_stats = DispositionReport.get_conversion_funnel(
-                campaign_id=campaign.id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            campaign_dispositions[campaign.id] = list(disposition_stats)
-            campaign_funnels[campaign.id] = funnel_stats
+        campaign_ids = list(Campaign.objects.filter(status='active').values_list('id', flat=True))
+        campaign_dispositions = DispositionReport.get_all_disposition_stats(
+            campaign_ids,
+            start_date=start_date,
+            end_date=end_date
+        )
+        campaign_funnels = DispositionReport.get_all_conversion_funnels(
+            campaign_ids,
+            start_date=start_date,
+            end_date=end_date
+        )
         
-        cache.set('disposition_stats_by_campaign', campaign_dispositions, cache_timeout)
-        cache.set('disposition_funnels_by_campaign', campaign_funnels, cache_timeout)
+        cached['disposition_stats_by_campaign'] = campaign_dispositions
+        cached['disposition_funnels_by_campaign'] = campaign_funnels
         
         if verbose:
-            self.stdout.write(f"  - Cached disposition data for {campaigns.count()} campaigns")
+            self.stdout.write(f"  - Cached disposition data for {len(campaign_ids)} campaigns")
+        
+        return cached
@@ -27,6 +27,67 @@ class ReportingQuerySet(models.QuerySet):
         return self.filter(created_at__date__range=[start_date, end_date])
 
 
+def _aggregate(queryset, aggregates):
+    """
+    Evaluate aggregates like aggregate(), allowing result names that match fields.
+    
+    Names such as total_cost are aliased in SQL, so a model field of the same
+    name can still be aggregated (e.g. Avg('total_cost') next to Sum('total_cost')).
+    
+    Args:
+        queryset: Filtered queryset to aggregate
+        aggregates: Mapping of result name to aggregate expression
+    
+    Returns:
+        dict: Aggregate results keyed by result name
+    """
+    row = queryset.aggregate(**{f'agg_{name}': expression for name, expression in aggregates.items()})
+    return {name: row[f'agg_{name}'] for name in aggregates}
+
+
+def _aggregate_by(queryset, group_field, aggregates, keys):
+    """
+    Evaluate aggregates for every value of group_field in one GROUP BY query.
+    
+    Args:
+        queryset: Filtered queryset to aggregate
+        group_field: Field the rows are grouped by, e.g. 'agent_id'
+        aggregates: Mapping of result name to aggregate expression
+        keys: Values of group_field to report; groups without rows get the
+            values aggregate() returns for an empty queryset
+    
+    Returns:
+        dict: Aggregate results, as aggregate() would return them, keyed by group value
+    """
+    empty = _aggregate(queryset.none(), aggregates)
+    results = {key: dict(empty) for key in keys}
+    
+    # Aliased as in _aggregate
+    aliases = {f'agg_{name}': expression for name, expression in aggregates.items()}
+    rows = queryset.filter(**{f'{group_field}__in': keys}).order_by().values(group_field).annotate(**aliases)
+    for row in rows:
+        results[row[group_field]] = {name: row[f'agg_{name}'] for name in aggregates}
+    return results
+
+
+def _rows_by(rows, group_field, keys):
+    """
+    Split values() rows into one list per value of group_field.
+    
+    Args:
+        rows: values() queryset that includes group_field
+        group_field: Field the rows are split on; it is removed from each row
+        keys: Values of group_field to report, each starting with an empty list
+    
+    Returns:
+        dict: Lists of rows keyed by group value, in queryset order
+    """
+    results = {key: [] for key in keys}
+    for row in rows:
+        results[row.pop(group_field)].append(row)
+    return results
+
+
 class AgentPerformanceReport:
     """Agent performance reporting utility class"""
     
@@ -44,16 +105,34 @@ class AgentPerformanceReport:
         if end_date:
             queryset = queryset.filter(call_date__lte=end_date)
         
-        return queryset.aggregate(
-            total_calls=Count('id'),
-            answered_calls=Count('id', filter=Q(call_result='ANSWERED')),
-            completed_calls=Count('id', filter=Q(call_result='COMPLETED')),
-            dropped_calls=Count('id', filter=Q(call_result='DROPPED')),
-            total_talk_time=Sum('talk_duration'),
-            avg_talk_time=Avg('talk_duration'),
-            total_cost=Sum('cost'),
-            avg_cost=Avg('cost'),
-        )
+        return _aggregate(queryset, cls._stat_aggregates())
+    
+    @classmethod
+    def get_all_agent_stats(cls, agent_ids, start_date=None, end_date=None):
+        """Get get_agent_stats() for many agents with one grouped query"""
+        queryset = CallDetailRecord.objects.all()
+        
+        if start_date:
+            queryset = queryset.filter(call_date__gte=start_date)
+        
+        if end_date:
+            queryset = queryset.filter(call_date__lte=end_date)
+        
+        return _aggregate_by(queryset, 'agent_id', cls._stat_aggregates(), agent_ids)
+    
+    @classmethod
+    def _stat_aggregates(cls):
+        """Aggregates reported by get_agent_stats"""
+        return {
+            'total_calls': Count('id'),
+            'answered_calls': Count('id', filter=Q(call_result='ANSWERED')),
+            'completed_calls': Count('id', filter=Q(call_result='COMPLETED')),
+            'dropped_calls': Count('id', filter=Q(call_result='DROPPED')),
+            'total_talk_time': Sum('talk_duration'),
+            'avg_talk_time': Avg('talk_duration'),
+            'total_cost': Sum('total_cost'),
+            'avg_cost': Avg('total_cost'),
+        }
     
     @classmethod
     def get_hourly_performance(cls, agent_id=None, date=None):
@@ -67,12 +146,32 @@ class AgentPerformanceReport:
             queryset = queryset.filter(agent_id=agent_id)
         
         return queryset.annotate(
-            hour=Extract('start_time', 'hour')
-        ).values('hour').annotate(
-            total_calls=Count('id'),
-            answered_calls=Count('id', filter=Q(call_result='ANSWERED')),
-            avg_talk_time=Avg('talk_duration'),
-        ).order_by('hour')
+            hour=Extract('call_time', 'hour')
+        ).values('hour').annotate(**cls._hourly_aggregates()).order_by('hour')
+    
+    @classmethod
+    def get_all_hourly_performance(cls, agent_ids, date=None):
+        """Get get_hourly_performance() rows for many agents with one grouped query"""
+        if date is None:
+            date = timezone.now().date()
+        
+        rows = CallDetailRecord.objects.filter(
+            agent_id__in=agent_ids,
+            call_date=date
+        ).annotate(
+            hour=Extract('call_time', 'hour')
+        ).values('agent_id', 'hour').annotate(**cls._hourly_aggregates()).order_by('agent_id', 'hour')
+        
+        return _rows_by(rows, 'agent_id', agent_ids)
+    
+    @classmethod
+    def _hourly_aggregates(cls):
+        """Aggregates reported per hour by get_hourly_performance"""
+        return {
+            'total_calls': Count('id'),
+            'answered_calls': Count('id', filter=Q(call_result='ANSWERED')),
+            'avg_talk_time': Avg('talk_duration'),
+        }
     
     @classmethod
     def get_agent_rankings(cls, start_date=None, end_date=None, metric='total_calls'):
@@ -120,19 +219,37 @@ class CampaignPerformanceReport:
         if end_date:
             queryset = queryset.filter(call_date__lte=end_date)
         
-        return queryset.aggregate(
-            total_calls=Count('id'),
-            answered_calls=Count('id', filter=Q(call_result='ANSWERED')),
-            completed_calls=Count('id', filter=Q(call_result='COMPLETED')),
-            dropped_calls=Count('id', filter=Q(call_result='DROPPED')),
-            busy_calls=Count('id', filter=Q(call_result='BUSY')),
-            no_answer_calls=Count('id', filter=Q(call_result='NO_ANSWER')),
-            failed_calls=Count('id', filter=Q(call_result='FAILED')),
-            total_talk_time=Sum('talk_duration'),
-            avg_talk_time=Avg('talk_duration'),
-            total_cost=Sum('cost'),
-            avg_cost=Avg('cost'),
-        )
+        return _aggregate(queryset, cls._stat_aggregates())
+    
+    @classmethod
+    def get_all_campaign_stats(cls, campaign_ids, start_date=None, end_date=None):
+        """Get get_campaign_stats() for many campaigns with one grouped query"""
+        queryset = CallDetailRecord.objects.all()
+        
+        if start_date:
+            queryset = queryset.filter(call_date__gte=start_date)
+        
+        if end_date:
+            queryset = queryset.filter(call_date__lte=end_date)
+        
+        return _aggregate_by(queryset, 'campaign_id', cls._stat_aggregates(), campaign_ids)
+    
+    @classmethod
+    def _stat_aggregates(cls):
+        """Aggregates reported by get_campaign_stats"""
+        return {
+            'total_calls': Count('id'),
+            'answered_calls': Count('id', filter=Q(call_result='ANSWERED')),
+            'completed_calls': Count('id', filter=Q(call_result='COMPLETED')),
+            'dropped_calls': Count('id', filter=Q(call_result='DROPPED')),
+            'busy_calls': Count('id', filter=Q(call_result='BUSY')),
+            'no_answer_calls': Count('id', filter=Q(call_result='NO_ANSWER')),
+            'failed_calls': Count('id', filter=Q(call_result='FAILED')),
+            'total_talk_time': Sum('talk_duration'),
+            'avg_talk_time': Avg('talk_duration'),
+            'total_cost': Sum('total_cost'),
+            'avg_cost': Avg('total_cost'),
+        }
     
     @classmethod
     def get_campaign_hourly_stats(cls, campaign_id, date=None):
@@ -144,26 +261,56 @@ class CampaignPerformanceReport:
             campaign_id=campaign_id,
             call_date=date
         ).annotate(
-            hour=Extract('start_time', 'hour')
-        ).values('hour').annotate(
-            total_calls=Count('id'),
-            answered_calls=Count('id', filter=Q(call_result='ANSWERED')),
-            dropped_calls=Count('id', filter=Q(call_result='DROPPED')),
-            avg_talk_time=Avg('talk_duration'),
-        ).order_by('hour')
+            hour=Extract('call_time', 'hour')
+        ).values('hour').annotate(**cls._hourly_aggregates()).order_by('hour')
+    
+    @classmethod
+    def get_all_campaign_hourly_stats(cls, campaign_ids, date=None):
+        """Get get_campaign_hourly_stats() rows for many campaigns with one grouped query"""
+        if date is None:
+            date = timezone.now().date()
+        
+        rows = CallDetailRecord.objects.filter(
+            campaign_id__in=campaign_ids,
+            call_date=date
+        ).annotate(
+            hour=Extract('call_time', 'hour')
+        ).values('campaign_id', 'hour').annotate(**cls._hourly_aggregates()).order_by('campaign_id', 'hour')
+        
+        return _rows_by(rows, 'campaign_id', campaign_ids)
+    
+    @classmethod
+    def _hourly_aggregates(cls):
+        """Aggregates reported per hour by get_campaign_hourly_stats"""
+        return {
+            'total_calls': Count('id'),
+            'answered_calls': Count('id', filter=Q(call_result='ANSWERED')),
+            'dropped_calls': Count('id', filter=Q(call_result='DROPPED')),
+            'avg_talk_time': Avg('talk_duration'),
+        }
     
     @classmethod
     def get_campaign_lead_stats(cls, campaign_id):
         """Get lead statistics for a campaign"""
-        return Lead.objects.filter(campaign_id=campaign_id).aggregate(
-            total_leads=Count('id'),
-            fresh_leads=Count('id', filter=Q(status='NEW', call_attempts=0)),
-            callback_leads=Count('id', filter=Q(status='CALLBACK')),
-            dnc_leads=Count('id', filter=Q(status='DNC')),
-            completed_leads=Count('id', filter=Q(status='COMPLETED')),
-            avg_attempts=Avg('call_attempts'),
-            max_attempts=Max('call_attempts'),
-        )
+        return _aggregate(Lead.objects.filter(campaign_id=campaign_id), cls._lead_aggregates())
+    
+    @classmethod
+    def get_all_campaign_lead_stats(cls, campaign_ids):
+        """Get get_campaign_lead_stats() for many campaigns with one grouped query"""
+        return _aggregate_by(Lead.objects.all(), 'campaign_id', cls._lead_aggregates(), campaign_ids)
+    
+    @classmethod
+    def _lead_aggregates(cls):
+        """Aggregates reported by get_campaign_lead_stats"""
+        return {
+            'total_leads': Count('id'),
+            'fresh_leads': Count('id', filter=Q(status='new', attempts=0)),
+            'callback_leads': Count('id', filter=Q(status='callback')),
+            'dnc_leads': Count('id', filter=Q(status='dnc')),
+            'completed_leads': Count('id', filter=Q(status='completed')),
+            'avg_attempts': Avg('attempts'),
+            'max_attempts': Max('attempts'),
+        }
 
 
 class CallAnalyticsReport:
@@ -269,6 +416,29 @@ class DispositionReport:
             requires_callback=F('disposition_code__requires_callback')
         ).order_by('-count')
     
+    @classmethod
+    def get_all_disposition_stats(cls, campaign_ids, start_date=None, end_date=None):
+        """Get get_disposition_stats() rows for many campaigns with one grouped query"""
+        queryset = Disposition.objects.filter(lead__campaign_id__in=campaign_ids)
+        
+        if start_date:
+            queryset = queryset.filter(created_at__date__gte=start_date)
+        
+        if end_date:
+            queryset = queryset.filter(created_at__date__lte=end_date)
+        
+        rows = queryset.values(
+            'lead__campaign_id',
+            'disposition_code__code',
+            'disposition_code__description'
+        ).annotate(
+            count=Count('id'),
+            is_sale=F('disposition_code__is_sale'),
+            requires_callback=F('disposition_code__requires_callback')
+        ).order_by('lead__campaign_id', '-count')
+        
+        return _rows_by(rows, 'lead__campaign_id', campaign_ids)
+    
     @classmethod
     def get_conversion_funnel(cls, campaign_id=None, start_date=None, end_date=None):
         """Get conversion funnel statistics"""
@@ -293,6 +463,28 @@ class DispositionReport:
                 disposition_code__is_sale=True
             ).aggregate(total=Sum('sale_amount'))['total'] or 0,
         }
+    
+    @classmethod
+    def get_all_conversion_funnels(cls, campaign_ids, start_date=None, end_date=None):
+        """Get get_conversion_funnel() for many campaigns with one grouped query"""
+        queryset = Disposition.objects.all()
+        
+        if start_date:
+            queryset = queryset.filter(created_at__date__gte=start_date)
+        
+        if end_date:
+            queryset = queryset.filter(created_at__date__lte=end_date)
+        
+        funnels = _aggregate_by(queryset, 'lead__campaign_id', {
+            'total_dispositions': Count('id'),
+            'sales': Count('id', filter=Q(disposition_code__is_sale=True)),
+            'callbacks': Count('id', filter=Q(disposition_code__requires_callback=True)),
+            'total_sale_amount': Sum('sale_amount', filter=Q(disposition_code__is_sale=True)),
+        }, campaign_ids)
+        
+        for funnel in funnels.values():
+            funnel['total_sale_amount'] = funnel['total_sale_amount'] or 0
+        return funnels
 
 
 # Create your models here.